@@ -55,6 +55,7 @@ decorator) can be undone and redone. If using :mod:`aeidon` in a context where
 reverting actions is never needed, greater flexibility can be achieved by
 accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 
+:var CACHE_HOME_DIR: Path to the user's local cache directory
 :var CONFIG_HOME_DIR: Path to the user's local configuration directory
 :var DATA_DIR: Path to the global data directory
 :var DATA_HOME_DIR: Path to the user's local data directory
@@ -71,6 +72,7 @@ accessing the subtitles directly (via :attr:`aeidon.Project.subtitles`).
 :var registers: Enumerations for action action reversion register types
 """
 
+import importlib
 import re
 import sys
 
@@ -87,6 +89,7 @@ from aeidon import deco
 from aeidon import i18n
 from aeidon import util
 from aeidon import temp
+from aeidon import columns
 from aeidon.delegate import *
 from aeidon.singleton import *
 from aeidon.mutables import *
@@ -95,26 +98,50 @@ from aeidon.errors import *
 from aeidon.enum import *
 from aeidon.enums import *
 from aeidon import encodings
-from aeidon import languages
-from aeidon import countries
-from aeidon import locales
-from aeidon import scripts
 from aeidon.metadata import *
 from aeidon.calculator import *
 from aeidon.finder import *
 from aeidon.parser import *
 from aeidon.liner import *
+from aeidon.intervalindex import *
 from aeidon import containers
 from aeidon.subtitle import *
+from aeidon.store import *
 from aeidon.file import *
+from aeidon.sniffer import *
 from aeidon import files
 from aeidon.markup import *
 from aeidon import markups
 from aeidon.markupconv import *
-from aeidon.pattern import *
-from aeidon.patternman import *
 from aeidon.clipboard import *
 from aeidon.revertable import *
+from aeidon.changebatch import *
 from aeidon import agents
 from aeidon.project import *
-from aeidon.unittest import *
+
+# Submodules not needed to read, edit and write subtitles are imported on
+# first access, along with the names they add to the aeidon namespace.
+_lazy_modules = {
+    "batch":        (),
+    "correction":   ("TextSnapshot",),
+    "countries":    (),
+    "languages":    (),
+    "locales":      (),
+    "pattern":      ("Pattern",),
+    "patternman":   ("PatternManager",),
+    "patternset":   ("PatternSet",),
+    "scripts":      (),
+    "spellchecker": ("SpellChecker",),
+    "unittest":     ("TestCase",),
+}
+
+def __getattr__(name):
+    """Import lazily loaded submodule or name from it on first access."""
+    for module_name, names in _lazy_modules.items():
+        if name != module_name and not name in names: continue
+        module = importlib.import_module("aeidon.{}".format(module_name))
+        if name == module_name: return module
+        globals()[name] = getattr(module, name)
+        return globals()[name]
+    raise AttributeError("module {} has no attribute {}"
+                         .format(repr(__name__), repr(name)))
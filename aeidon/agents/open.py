@@ -18,7 +18,7 @@
 """Reading and parsing data from subtitle files."""
 
 import aeidon
-import bisect
+import math
 
 
 class OpenAgent(aeidon.Delegate):
@@ -32,36 +32,116 @@ class OpenAgent(aeidon.Delegate):
         for i, subtitle in enumerate(subtitles):
             self.subtitles[i].tran_text = subtitle.main_text
 
+    def _align_translations_by_overlap(self, subtitles):
+        """Add translation texts by maximizing temporal overlap."""
+        mains = list(self.subtitles)
+        texts = {}
+        inserted = []
+        i = 0
+        for subtitle in subtitles:
+            # Attach translation to the existing subtitle it overlaps
+            # most, joining texts of translations split differently.
+            start = subtitle.start_ms
+            end = subtitle.end_ms
+            while i < len(mains) and mains[i].end_ms <= start:
+                i += 1
+            best, best_overlap = None, 0
+            for j in range(i, len(mains)):
+                if mains[j].start_ms >= end: break
+                overlap = (min(end, mains[j].end_ms) -
+                           max(start, mains[j].start_ms))
+                if overlap > best_overlap:
+                    best, best_overlap = j, overlap
+            if best is None:
+                new = self._new_translation_subtitle(subtitle)
+                inserted.append((i, new))
+                continue
+            texts.setdefault(best, []).append(subtitle.main_text)
+        for i, lines in texts.items():
+            mains[i].tran_text = "\n".join(lines)
+        self._splice_subtitles(mains, inserted)
+
     def _align_translations_by_position(self, subtitles):
         """Add translation texts by aligning subtitle positions."""
-        subtitles = [x.copy() for x in subtitles]
-        mode = self.main_file.mode
+        mains = list(self.subtitles)
+        inserted = []
         i = 0
-        while subtitles:
-            # Examine subtitles to be added one-by-one by comparing
+        for subtitle in subtitles:
+            # Merge translations with existing subtitles by comparing
             # their temporal middle positions with the start and end
-            # positions of existing subtitles.
-            ts = subtitles[0].get_start(mode)
-            te = subtitles[0].get_end(mode)
-            tm = self.calc.get_middle(ts, te)
-            while True:
-                # Skip over existing subtitles when
-                # no suitable match found among translations.
-                if i == len(self.subtitles): break
-                ms = self.subtitles[i].get_start(mode)
-                me = self.subtitles[i].get_end(mode)
-                if not self.calc.is_earlier(me, tm): break
+            # positions of existing subtitles, skipping over existing
+            # subtitles when no suitable match found among translations.
+            middle = (subtitle.start_ms + subtitle.end_ms) / 2
+            while i < len(mains) and mains[i].end_ms < middle:
+                i += 1
+            if i < len(mains) and mains[i].start_ms <= middle:
+                mains[i].tran_text = subtitle.main_text
                 i += 1
-            if i == len(self.subtitles) or self.calc.is_later(ms, tm):
-                # Add a new subtitle when no suitable match
-                # found among existing subtitles.
-                subtitle = self.new_subtitle()
-                subtitle.start = subtitles[0].start
-                subtitle.end = subtitles[0].end
-                self.subtitles.insert(i, subtitle)
-            self.subtitles[i].tran_text = subtitles[0].main_text
-            subtitles.pop(0)
-            i += 1
+                continue
+            # Add a new subtitle when no suitable match
+            # found among existing subtitles.
+            new = self._new_translation_subtitle(subtitle)
+            inserted.append((i, new))
+        self._splice_subtitles(mains, inserted)
+
+    @aeidon.deco.export
+    def load(self, doc, file, subtitles, align_method=None):
+        """
+        Set `file` and `subtitles` read with :meth:`read` as `doc`.
+
+        See :meth:`open_translation` for `align_method`.
+        """
+        if doc == aeidon.documents.MAIN:
+            return self.load_main(file, subtitles)
+        if doc == aeidon.documents.TRAN:
+            return self.load_translation(file, subtitles, align_method)
+        raise ValueError("Invalid document: {}".format(repr(doc)))
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def load_main(self, file, subtitles):
+        """Set `file` and `subtitles` read with :meth:`read` as main."""
+        self.main_file = file
+        self.subtitles = subtitles
+        self.set_framerate(self.framerate, register=None)
+        self.main_changed = 0
+        # Deactivate possible translation file.
+        self.tran_file = None
+        self.tran_changed = None
+        self.emit("main-file-opened", self.main_file)
+
+    @aeidon.deco.export
+    @aeidon.deco.notify_frozen
+    def load_translation(self, file, subtitles, align_method=None):
+        """
+        Set `file` and `subtitles` read with :meth:`read` as translation.
+
+        See :meth:`open_translation` for `align_method`.
+        """
+        align_method = align_method or aeidon.align_methods.POSITION
+        self.tran_file = file
+        for subtitle in subtitles:
+            subtitle.framerate = self.framerate
+        for subtitle in self.subtitles:
+            subtitle.tran_text = ""
+        blocked = self.block("subtitles-inserted")
+        if align_method == aeidon.align_methods.NUMBER:
+            self._align_translations_by_number(subtitles)
+        if align_method == aeidon.align_methods.POSITION:
+            self._align_translations_by_position(subtitles)
+        if align_method == aeidon.align_methods.OVERLAP:
+            self._align_translations_by_overlap(subtitles)
+        self.unblock("subtitles-inserted", blocked)
+        self.tran_changed = 0
+        self.emit("translation-file-opened", self.tran_file)
+
+    def _new_translation_subtitle(self, subtitle):
+        """Return a new subtitle for translation `subtitle`."""
+        new = self.new_subtitle()
+        new.start = subtitle.start
+        new.end = subtitle.end
+        new.tran_text = subtitle.main_text
+        return new
 
     @aeidon.deco.export
     def open(self, doc, path, encoding=None, align_method=None):
@@ -84,7 +164,6 @@ class OpenAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {}".format(repr(doc)))
 
     @aeidon.deco.export
-    @aeidon.deco.notify_frozen
     def open_main(self, path, encoding=None):
         """
         Read and parse subtitle data for main file from `path`.
@@ -98,24 +177,11 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.FormatError` if unable to detect format.
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
-        encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.main_file)
-        self.subtitles, sort_count = self._sort_subtitles(subtitles)
-        self.set_framerate(self.framerate, register=None)
-        self.main_changed = 0
-        # Deactivate possible translation file.
-        self.tran_file = None
-        self.tran_changed = None
-        self.emit("main-file-opened", self.main_file)
+        file, subtitles, sort_count = self.read(path, encoding)
+        self.load_main(file, subtitles)
         return sort_count
 
     @aeidon.deco.export
-    @aeidon.deco.notify_frozen
     def open_translation(self, path, encoding=None, align_method=None):
         """
         Read and parse subtitle data for translation file from `path`.
@@ -131,6 +197,9 @@ class OpenAgent(aeidon.Delegate):
         takes into account that not all subtitles are translated, or vice versa
         and that one main subtitle may correspond to two translation subtitles,
         or vice versa, as per length restrictions etc.
+        :attr:`aeidon.align_methods.OVERLAP` attaches each translation text to
+        the existing subtitle it overlaps most in time, joining texts if
+        subtitles are split differently in the translation.
 
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
@@ -140,33 +209,38 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.FormatError` if unable to detect format.
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
-        encoding = encoding or aeidon.util.get_default_encoding()
-        align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
-        subtitles = self._read_file(self.tran_file)
-        subtitles, sort_count = self._sort_subtitles(subtitles)
-        for subtitle in subtitles:
-            subtitle.framerate = self.framerate
-        for subtitle in self.subtitles:
-            subtitle.tran_text = ""
-        blocked = self.block("subtitles-inserted")
-        if align_method == aeidon.align_methods.NUMBER:
-            self._align_translations_by_number(subtitles)
-        if align_method == aeidon.align_methods.POSITION:
-            self._align_translations_by_position(subtitles)
-        self.unblock("subtitles-inserted", blocked)
-        self.tran_changed = 0
-        self.emit("translation-file-opened", self.tran_file)
+        file, subtitles, sort_count = self.read(path, encoding)
+        self.load_translation(file, subtitles, align_method)
         return sort_count
 
-    def _read_file(self, file):
+    @aeidon.deco.export
+    def read(self, path, encoding=None):
+        """
+        Read and parse subtitle data from `path` without changing project.
+
+        `encoding` can be ``None`` to use the system default encoding or a
+        sequence of encodings to try, see :func:`aeidon.sniff`, in which case
+        the file is parsed only with the first encoding that decodes it.
+        Return file, sorted subtitles and the amount of subtitles that needed
+        to be moved in order to arrange them in ascending chronological order.
+        Since the project is not accessed, this can be called from another
+        thread, leaving :meth:`load` to be called from the main thread.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Raise :exc:`aeidon.ParseError` if parsing fails.
+        """
+        sniff = self._sniff(path, encoding)
+        file = aeidon.files.new(sniff.format, path, sniff.encoding)
+        subtitles = self._read_file(file, sniff)
+        subtitles, sort_count = self._sort_subtitles(subtitles)
+        return file, subtitles, sort_count
+
+    def _read_file(self, file, sniff=None):
         """Read `file` and return subtitles."""
         try:
-            return file.read()
+            return file.read(sniff)
         except (IOError, UnicodeError):
             raise
         except Exception:
@@ -176,12 +250,51 @@ class OpenAgent(aeidon.Delegate):
             raise aeidon.ParseError("Failed to parse file {}"
                                     .format(repr(file.path)))
 
+    def _sniff(self, path, encoding):
+        """
+        Return a :class:`aeidon.SniffResult` for file at `path`.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        """
+        sniff = aeidon.sniff(path, encoding)
+        if sniff.format is None:
+            raise aeidon.FormatError("Failed to detect format of file {}"
+                                     .format(repr(path)))
+        return sniff
+
     def _sort_subtitles(self, subtitles):
         """Return sorted `subtitles` and sort count."""
+        starts = [x.start_ms for x in subtitles]
+        # Count subtitles starting before some earlier subtitle, i.e.
+        # ones that need to be moved. Most files are already in order,
+        # which this single pass reveals without needing to sort.
         sort_count = 0
-        sorted_starts = []
-        for start in (x.start_frame for x in subtitles):
-            bisect.insort(sorted_starts, start)
-            if sorted_starts[-1] != start:
+        latest = -math.inf
+        for start in starts:
+            if start < latest:
                 sort_count += 1
-        return sorted(subtitles), sort_count
+            else:
+                latest = start
+        if sort_count == 0:
+            return list(subtitles), sort_count
+        order = sorted(range(len(starts)), key=starts.__getitem__)
+        return [subtitles[i] for i in order], sort_count
+
+    def _splice_subtitles(self, subtitles, inserted):
+        """
+        Set `subtitles` with `inserted` subtitles as subtitles at once.
+
+        `inserted` should be a list of indices in `subtitles` and subtitles
+        to insert before them, in ascending order of indices.
+        """
+        if not inserted: return
+        merged = []
+        i = 0
+        for index, subtitle in inserted:
+            merged.extend(subtitles[i:index])
+            merged.append(subtitle)
+            i = index
+        merged.extend(subtitles[i:])
+        self.subtitles[:] = merged
@@ -43,34 +43,40 @@ class PositionAgent(aeidon.Delegate):
         Using a gap of at least zero is always a good idea if overlapping
         is not desired. Return changed indices.
         """
-        new_indices = []
-        new_subtitles = []
-        for index in indices or self.get_all_indices():
-            start = self.subtitles[index].start_seconds
-            end = self.subtitles[index].end_seconds
-            if speed is not None:
-                length = self.get_text_length(index, aeidon.documents.MAIN)
-                optimal_duration = length / speed
-                dol = lengthen and end - start < optimal_duration
-                dos = shorten  and end - start > optimal_duration
-                end = start + optimal_duration if dol or dos else end
-            domin = minimum and end - start < minimum
-            domax = maximum and end - start > maximum
-            end = start + minimum if domin else end
-            end = start + maximum if domax else end
-            end_max = (self.subtitles[index+1].start_seconds
-                       if index < len(self.subtitles) - 1
-                       else 360000)
-
-            dogap = gap is not None and end_max - end < gap
-            end = max(start, end_max - gap) if dogap else end
-            if end != self.subtitles[index].end_seconds:
-                new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
-                subtitle.end_seconds = end
-                new_subtitles.append(subtitle)
-        if not new_indices: return []
-        self.replace_positions(new_indices, new_subtitles, register=register)
+        indices = indices or self.get_all_indices()
+        mode = aeidon.modes.TIME
+        all_starts, all_ends = self.get_position_arrays(None, mode)
+        starts = [all_starts[i] for i in indices]
+        ends = [all_ends[i] for i in indices]
+        limits = [(all_starts[i+1] if i < len(all_starts) - 1 else 360000000)
+                  for i in indices]
+
+        lengths = [0] * len(indices)
+        if speed is not None:
+            lengths = [self.get_text_length(i, aeidon.documents.MAIN)
+                       for i in indices]
+
+        to_ms = lambda x: (None if x is None else x * 1000)
+        new_ends = aeidon.columns.adjust_durations(starts,
+                                                   ends,
+                                                   limits,
+                                                   lengths,
+                                                   speed=speed,
+                                                   lengthen=lengthen,
+                                                   shorten=shorten,
+                                                   minimum=to_ms(minimum),
+                                                   maximum=to_ms(maximum),
+                                                   gap=to_ms(gap))
+
+        changed = [i for i in range(len(indices)) if new_ends[i] != ends[i]]
+        if not changed: return []
+        new_indices = [indices[i] for i in changed]
+        self.replace_position_arrays(new_indices,
+                                     [starts[i] for i in changed],
+                                     [new_ends[i] for i in changed],
+                                     mode,
+                                     register=register)
+
         self.set_action_description(register, _("Adjusting durations"))
         return new_indices
 
@@ -84,15 +90,22 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
-        self.set_framerate(framerate_out)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode = self.get_mode()
+        starts, ends = self.get_position_arrays(indices, mode)
+        coefficient = framerate_out.value / framerate_in.value
+        if mode == aeidon.modes.TIME:
+            coefficient = 1 / coefficient
+        starts = aeidon.columns.scale(starts, coefficient)
+        ends = aeidon.columns.scale(ends, coefficient)
+        self.set_framerate(framerate_out, register=register)
+        self.replace_position_arrays(indices,
+                                     starts,
+                                     ends,
+                                     mode,
+                                     register=register)
+
         self.group_actions(register, 2, _("Converting framerate"))
 
     def _get_frame_transform(self, p1, p2):
@@ -139,8 +152,11 @@ class PositionAgent(aeidon.Delegate):
         orig_framerate = self.framerate
         self.framerate = framerate
         self.calc = aeidon.Calculator(framerate)
-        for subtitle in self.subtitles:
-            subtitle.framerate = framerate
+        if isinstance(self.subtitles, aeidon.SubtitleStore):
+            self.subtitles.set_framerate(framerate)
+        else:
+            for subtitle in self.subtitles:
+                subtitle.framerate = framerate
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Setting framerate")
@@ -158,15 +174,27 @@ class PositionAgent(aeidon.Delegate):
         `value` can be any valid position type, negative to make subtitles
         appear ealier, positive to make subtitles appear later.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode = self.get_mode()
+        value = self._to_native(value, mode)
+        starts, ends = self.get_position_arrays(indices, mode)
+        self.replace_position_arrays(indices,
+                                     aeidon.columns.shift(starts, value),
+                                     aeidon.columns.shift(ends, value),
+                                     mode,
+                                     register=register)
+
         self.set_action_description(register, _("Shifting positions"))
 
+    def _to_native(self, value, mode):
+        """Return position `value` as an integer in units of `mode`."""
+        if mode == aeidon.modes.TIME:
+            return self.calc.to_ms(value)
+        if mode == aeidon.modes.FRAME:
+            return self.calc.to_frame(value)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(mode)))
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def transform_positions(self, indices, p1, p2, register=-1):
@@ -176,13 +204,17 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode = self.get_mode()
+        constant = self._to_native(constant, mode)
+        starts, ends = self.get_position_arrays(indices, mode)
+        starts = aeidon.columns.scale(starts, coefficient, constant)
+        ends = aeidon.columns.scale(ends, coefficient, constant)
+        self.replace_position_arrays(indices,
+                                     starts,
+                                     ends,
+                                     mode,
+                                     register=register)
+
         self.set_action_description(register, _("Transforming positions"))
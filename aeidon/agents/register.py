@@ -58,6 +58,7 @@ class RegisterAgent(aeidon.Delegate):
         aeidon.Delegate.__init__(self, master)
         self._do_description = None
         aeidon.util.connect(self, self, "notify::undo_limit")
+        aeidon.util.connect(self, self, "notify::undo_memory_limit")
 
     def _break_action_group(self, stack, index=0):
         """Break the action group in `stack` and return amount broken into."""
@@ -78,10 +79,16 @@ class RegisterAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     def cut_reversion_stacks(self):
-        """Cut undo and redo stacks to their maximum lengths."""
+        """Cut undo and redo stacks to their maximum lengths and sizes."""
         if self.undo_limit is not None:
-            del self.redoables[self.undo_limit:]
-            del self.undoables[self.undo_limit:]
+            self.redoables.cut(length=self.undo_limit)
+            self.undoables.cut(length=self.undo_limit)
+        if self.undo_memory_limit is not None:
+            # Remove the oldest undoable actions first and only then
+            # actions at the far end of the redoable stack.
+            limit = self.undo_memory_limit
+            self.undoables.cut(nbytes=max(0, limit - self.redoables.nbytes))
+            self.redoables.cut(nbytes=max(0, limit - self.undoables.nbytes))
 
     @aeidon.deco.export
     def emit_action_signal(self, register):
@@ -99,6 +106,11 @@ class RegisterAgent(aeidon.Delegate):
         raise ValueError("Invalid register: {}"
                          .format(repr(register)))
 
+    @aeidon.deco.export
+    def get_history_size(self):
+        """Return approximate memory used by undo and redo stacks in bytes."""
+        return self.undoables.nbytes + self.redoables.nbytes
+
     def _get_source_stack(self, register):
         """Return the stack where the action to register is taken from."""
         if register.shift == 1:
@@ -117,18 +129,23 @@ class RegisterAgent(aeidon.Delegate):
         action_group.description = description
         stack = self._get_destination_stack(register)
         for i in range(count):
-            action = stack.pop(0)
+            action = stack.pop()
             if isinstance(action, aeidon.RevertableActionGroup):
                 action_group.actions.extend(action.actions)
             else: # Single action
                 action_group.actions.append(action)
-        stack.insert(0, action_group)
+        stack.push(action_group)
 
     def _on_notify_undo_limit(self, *args):
         """Cut reversion stacks if limit set."""
         if self.undo_limit is not None:
             self.cut_reversion_stacks()
 
+    def _on_notify_undo_memory_limit(self, *args):
+        """Cut reversion stacks if limit set."""
+        if self.undo_memory_limit is not None:
+            self.cut_reversion_stacks()
+
     @aeidon.deco.export
     def redo(self, count=1):
         """Redo `count` amount of actions from the redoable stack."""
@@ -136,39 +153,43 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.redoables[0], group):
             return self._revert_multiple(count, aeidon.registers.REDO)
         self._do_description = self.redoables[0].description
-        self.redoables.pop(0).revert()
+        self.redoables.pop().revert()
 
     @aeidon.deco.export
     def register_action(self, action):
         """Register `action` as done, undone or redone."""
         if action.register == aeidon.registers.DO:
-            self.undoables.insert(0, action)
-            self.redoables = []
+            self.undoables.push(action)
+            self.redoables.clear()
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.UNDO:
-            self.redoables.insert(0, action)
+            self.redoables.push(action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.REDO:
-            self.undoables.insert(0, action)
+            self.undoables.push(action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
 
     def _revert_multiple(self, count, register):
         """Revert multiple actions."""
         self.block(register.signal)
-        stack = self._get_source_stack(register)
-        for i in range(count):
-            part_count = 1
-            if isinstance(stack[0], aeidon.RevertableActionGroup):
-                description = stack[0].description
-                part_count = self._break_action_group(stack)
-            for j in range(part_count):
-                self._do_description = stack[0].description
-                stack.pop(0).revert()
-            if part_count > 1:
-                self.group_actions(register, part_count, description)
-        self.unblock(register.signal)
+        frozen = self.freeze_changes()
+        try:
+            stack = self._get_source_stack(register)
+            for i in range(count):
+                part_count = 1
+                if isinstance(stack[0], aeidon.RevertableActionGroup):
+                    description = stack[0].description
+                    part_count = self._break_action_group(stack)
+                for j in range(part_count):
+                    self._do_description = stack[0].description
+                    stack.pop().revert()
+                if part_count > 1:
+                    self.group_actions(register, part_count, description)
+        finally:
+            self.unblock(register.signal)
+            self.thaw_changes(frozen)
         self.cut_reversion_stacks()
         self.emit_action_signal(register)
 
@@ -198,4 +219,4 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.undoables[0], group):
             return self._revert_multiple(count, aeidon.registers.UNDO)
         self._do_description = self.undoables[0].description
-        self.undoables.pop(0).revert()
+        self.undoables.pop().revert()
@@ -20,11 +20,50 @@
 import aeidon
 
 
+class _ConvertedSubtitle:
+
+    """
+    Subtitle with text of a document replaced for writing.
+
+    Files write texts via :meth:`aeidon.Subtitle.get_text`, everything else
+    is read from the original subtitle, which is left unchanged.
+    """
+
+    def __init__(self, subtitle, doc, text):
+        """Initialize a :class:`_ConvertedSubtitle` instance."""
+        self._doc = doc
+        self._subtitle = subtitle
+        self._text = text
+
+    def __getattr__(self, name):
+        """Return attribute `name` of the original subtitle."""
+        return getattr(self._subtitle, name)
+
+    def get_text(self, doc):
+        """Return text corresponding to `doc`."""
+        if doc == self._doc: return self._text
+        return self._subtitle.get_text(doc)
+
+
 class SaveAgent(aeidon.Delegate):
 
-    """Writing subtitle data to file."""
+    """
+    Writing subtitle data to file.
+
+    :cvar _markup_converters: Dictionary mapping format pairs to converters
+    """
+
+    _markup_converters = {}
+
+    def _get_markup_converter(self, from_format, to_format):
+        """Return a cached :class:`aeidon.MarkupConverter` instance."""
+        key = (from_format, to_format)
+        if not key in self._markup_converters:
+            converter = aeidon.MarkupConverter(from_format, to_format)
+            self._markup_converters[key] = converter
+        return self._markup_converters[key]
 
-    def _save(self, doc, file, keep_changes):
+    def _save(self, doc, file, keep_changes, write_func=None):
         """
         Write subtitle data from `doc` to `file`.
 
@@ -33,51 +72,60 @@ class SaveAgent(aeidon.Delegate):
         Raise :exc:`UnicodeError` if encoding fails.
         """
         current_format = self.get_format(doc)
-        orig_texts = [x.get_text(doc) for x in self.subtitles]
+        subtitles = self.subtitles
         indices = []
         if current_format is not None and file.format != current_format:
             # Convert markup if saving in different format.
-            converter = aeidon.MarkupConverter(current_format, file.format)
-            for i, subtitle in enumerate(self.subtitles):
-                text = subtitle.get_text(doc)
-                new_text = converter.convert(text)
-                if new_text == text: continue
-                subtitle.set_text(doc, new_text)
-                indices.append(i)
-        file.write(self.subtitles, doc)
-        if keep_changes: return indices
-        for i, subtitle in enumerate(self.subtitles):
-            subtitle.set_text(doc, orig_texts[i])
-        return []
+            converter = self._get_markup_converter(current_format, file.format)
+            texts = [x.get_text(doc) for x in self.subtitles]
+            new_texts = list(map(converter.convert, texts))
+            indices = [i for i, text in enumerate(texts)
+                       if new_texts[i] != text]
+            if keep_changes:
+                for i in indices:
+                    self.subtitles[i].set_text(doc, new_texts[i])
+            else:
+                # Write converted texts without changing subtitles.
+                subtitles = list(self.subtitles)
+                for i in indices:
+                    subtitles[i] = _ConvertedSubtitle(
+                        subtitles[i], doc, new_texts[i])
+        write_func = write_func or file.write
+        write_func(subtitles, doc)
+        return (indices if keep_changes else [])
 
     @aeidon.deco.export
-    def save(self, doc, file=None, keep_changes=True):
+    def save(self, doc, file=None, keep_changes=True, write_func=None):
         """
         Write subtitle data from `doc` to `file`.
 
-        `file` can be ``None`` to use existing file.
+        `file` can be ``None`` to use existing file. `write_func` can be a
+        function to call instead of ``file.write`` with the same arguments,
+        e.g. to write in another thread while waiting for it to finish.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         if doc == aeidon.documents.MAIN:
-            return self.save_main(file, keep_changes)
+            return self.save_main(file, keep_changes, write_func)
         if doc == aeidon.documents.TRAN:
-            return self.save_translation(file, keep_changes)
+            return self.save_translation(file, keep_changes, write_func)
         raise ValueError("Invalid document: {}".format(repr(doc)))
 
     @aeidon.deco.export
-    def save_main(self, file=None, keep_changes=True):
+    def save_main(self, file=None, keep_changes=True, write_func=None):
         """
         Write subtitle data from main document to `file`.
 
         `file` can be ``None`` to use :attr:`main_file`.
+        See :meth:`save` for `write_func`.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         file = file or self.main_file
         if file is not None and self.main_file is not None:
             file.copy_from(self.main_file)
-        indices = self._save(aeidon.documents.MAIN, file, keep_changes)
+        indices = self._save(aeidon.documents.MAIN,
+                             file, keep_changes, write_func)
         if keep_changes:
             if (self.main_file is not None and
                 file.mode != self.main_file.mode):
@@ -91,18 +139,20 @@ class SaveAgent(aeidon.Delegate):
         self.emit("main-file-saved", file)
 
     @aeidon.deco.export
-    def save_translation(self, file=None, keep_changes=True):
+    def save_translation(self, file=None, keep_changes=True, write_func=None):
         """
         Write subtitle data from translation document to `file`.
 
         `file` can be ``None`` to use :attr:`tran_file`.
+        See :meth:`save` for `write_func`.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
         file = file or self.tran_file
         if file is not None and self.tran_file is not None:
             file.copy_from(self.tran_file)
-        indices = self._save(aeidon.documents.TRAN, file, keep_changes)
+        indices = self._save(aeidon.documents.TRAN,
+                             file, keep_changes, write_func)
         if keep_changes:
             self.tran_file = file
             self.tran_changed = 0
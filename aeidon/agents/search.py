@@ -18,6 +18,9 @@
 """Searching for and replacing text."""
 
 import aeidon
+import bisect
+import heapq
+import itertools
 import re
 
 from aeidon.i18n import _
@@ -35,14 +38,27 @@ class SearchAgent(aeidon.Delegate):
     :ivar _match_index: Index of the last match
     :ivar _match_span: Start and end positions of the last match
     :ivar _indices: Sequence of target indices or ``None`` for all
+    :ivar _search_index: Dictionary mapping documents to lists of matches
+    :ivar _search_key: Tuple identifying the pattern of :attr:`_search_index`
     :ivar _wrap: ``True`` to wrap search, ``False`` to stop at the last index
 
     Searching is done with the help of an instance of :class:`aeidon.Finder`.
     This agent provides for looping over the subtitles and their texts, feeding
     those texts to the finder and raising :exc:`StopIteration` when no more
     matches are found.
+
+    To avoid feeding texts without matches to the finder, all matches of the
+    pattern are indexed once as sorted lists of index, start, end tuples for
+    each document. The index is updated from ``main-texts-changed`` and
+    ``translation-texts-changed`` signals and rebuilt when subtitles are
+    inserted or removed. Texts changed without emitting those signals can
+    thus cause matches to be missed.
     """
 
+    # Amount of changed indices above which it is faster
+    # to merge a new list of matches than to update in-place.
+    _search_index_merge_limit = 32
+
     def __init__(self, master):
         """Initialize a :class:`SearchAgent` instance."""
         aeidon.Delegate.__init__(self, master)
@@ -53,9 +69,32 @@ class SearchAgent(aeidon.Delegate):
         self._match_index = None
         self._match_passed = None
         self._match_span = None
+        self._search_index = {}
+        self._search_key = None
         self._wrap = None
         # Set targets to defaults.
         self.set_search_target()
+        aeidon.util.connect(self, self, "main-texts-changed")
+        aeidon.util.connect(self, self, "notify::subtitles")
+        aeidon.util.connect(self, self, "subtitles-inserted")
+        aeidon.util.connect(self, self, "subtitles-moved")
+        aeidon.util.connect(self, self, "subtitles-removed")
+        aeidon.util.connect(self, self, "translation-texts-changed")
+
+    @aeidon.deco.export
+    def count_search_matches(self):
+        """Return the amount of matches of pattern in search targets."""
+        return sum(self._count_search_matches(x) for x in self._docs)
+
+    def _count_search_matches(self, doc):
+        """Return the amount of matches in `doc` in target range."""
+        matches = self._get_search_index(doc)
+        if self._indices is None:
+            return len(matches)
+        first, last = self._get_target_range()
+        a = bisect.bisect_left(matches, (first,))
+        z = bisect.bisect_left(matches, (last + 1,))
+        return z - a
 
     def _find(self, index, doc, pos, next):
         """
@@ -72,15 +111,18 @@ class SearchAgent(aeidon.Delegate):
         self._match_index = index
         self._match_doc = doc
         self._match_passed = False
-        indices = self._indices or self.get_all_indices()
+        first, last = self._get_target_range()
         while True:
+            if not self.count_search_matches():
+                # Avoid looping around documents with no matches.
+                raise StopIteration
             with aeidon.util.silent(ValueError):
                 # Return match in document after location.
                 return find(index, doc, pos)
             # Proceed to the next document or raise StopIteration.
             self._match_passed = True
             doc = self._get_document(doc, next)
-            index = (min(indices) if next else max(indices))
+            index = (first if next else last)
             pos = None
 
     @aeidon.deco.export
@@ -109,6 +151,22 @@ class SearchAgent(aeidon.Delegate):
         doc = (self._docs[-1] if doc is None else doc)
         return self._find(index, doc, pos, next=False)
 
+    def _find_all(self, text):
+        """Return a list of start and end positions of matches in `text`."""
+        pattern = self._finder.pattern
+        if not isinstance(pattern, str):
+            return [x.span() for x in pattern.finditer(text)]
+        if not pattern: return []
+        if self._finder.ignore_case:
+            text = text.lower()
+            pattern = pattern.lower()
+        spans = []
+        pos = text.find(pattern)
+        while pos >= 0:
+            spans.append((pos, pos + len(pattern)))
+            pos = text.find(pattern, pos + len(pattern))
+        return spans
+
     def _get_document(self, doc, next):
         """
         Return the document to proceed to.
@@ -134,6 +192,84 @@ class SearchAgent(aeidon.Delegate):
         raise ValueError("Invalid document: {} or invalid next: {}"
                          .format(repr(doc), repr(next)))
 
+    def _get_search_index(self, doc):
+        """Return a sorted list of index, start, end matches in `doc`."""
+        if self._search_index.get(doc) is None:
+            self._search_index[doc] = [
+                (i, a, z) for i, subtitle in enumerate(self.subtitles)
+                for a, z in self._find_all(subtitle.get_text(doc))]
+        return self._search_index[doc]
+
+    @aeidon.deco.export
+    def get_search_match_number(self, index, doc, span):
+        """
+        Return the zero-based number of the match among all matches.
+
+        Raise :exc:`ValueError` if no such match.
+        """
+        number = 0
+        for target_doc in self._docs:
+            matches = self._get_search_index(target_doc)
+            a = 0
+            if self._indices is not None:
+                first, last = self._get_target_range()
+                a = bisect.bisect_left(matches, (first,))
+            if target_doc == doc:
+                i = bisect.bisect_left(matches, (index,) + tuple(span))
+                if i < len(matches) and matches[i] == (index,) + tuple(span):
+                    return number + i - a
+                break
+            number += self._count_search_matches(target_doc)
+        raise ValueError("Invalid match: {}"
+                         .format(repr((index, doc, span))))
+
+    @aeidon.deco.export
+    def get_search_matches(self):
+        """Return a sorted list of index, document, span in search targets."""
+        matches = []
+        for doc in self._docs:
+            index = self._get_search_index(doc)
+            a, z = 0, len(index)
+            if self._indices is not None:
+                first, last = self._get_target_range()
+                a = bisect.bisect_left(index, (first,))
+                z = bisect.bisect_left(index, (last + 1,))
+            matches.extend((x[0], doc, x[1:]) for x in index[a:z])
+        return matches
+
+    def _get_target_range(self):
+        """Return the first and last index of target subtitles."""
+        if self._indices is None:
+            return 0, len(self.subtitles) - 1
+        return min(self._indices), max(self._indices)
+
+    def _invalidate_search_index(self):
+        """Remove index of matches to be rebuilt when needed."""
+        self._search_index = {}
+
+    def _iter_search_indices(self, doc, start, stop, next):
+        """
+        Iterate over indices with matches in `doc` from `start` to `stop`.
+
+        `next` should be ``True`` to iterate in ascending order, ``False``
+        for descending. `stop` is exclusive in either case.
+        """
+        # Look up each index anew, since the list of matches
+        # can be updated in-place while iterating.
+        matches = self._get_search_index(doc)
+        if next:
+            i = bisect.bisect_left(matches, (start,))
+            while i < len(matches) and matches[i][0] < stop:
+                index = matches[i][0]
+                yield index
+                i = bisect.bisect_left(matches, (index + 1,))
+        else:
+            i = bisect.bisect_left(matches, (stop,)) - 1
+            while i >= 0 and matches[i][0] >= start:
+                index = matches[i][0]
+                yield index
+                i = bisect.bisect_left(matches, (index,)) - 1
+
     def _next_in_document(self, index, doc, pos=None):
         """
         Find the next match in `doc` starting from `pos`.
@@ -143,8 +279,16 @@ class SearchAgent(aeidon.Delegate):
         Raise :exc:`ValueError` if no match in this `doc` after `pos`.
         Return tuple of index, document, match span.
         """
-        indices = self._indices or self.get_all_indices()
-        for index in range(index, max(indices)+1):
+        start = index
+        first, last = self._get_target_range()
+        for index in self._iter_search_indices(doc,
+                                               max(index, first),
+                                               last + 1,
+                                               next=True):
+
+            # Position applies only to the first index.
+            if index != start:
+                pos = None
             text = self.subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
@@ -155,6 +299,9 @@ class SearchAgent(aeidon.Delegate):
             try:
                 match_span = self._finder.next()
             except StopIteration:
+                if pos is None:
+                    # Text changed without a signal being emitted.
+                    self._update_search_index(doc, [index])
                 # Raise StopIteration if a full loop around all target
                 # documents and indices has been made with no matches.
                 if doc == self._match_doc:
@@ -180,8 +327,16 @@ class SearchAgent(aeidon.Delegate):
         Raise :exc:`ValueError` if no match in this `doc` before `pos`.
         Return tuple of index, document, match span.
         """
-        indices = self._indices or self.get_all_indices()
-        for index in reversed(range(min(indices), index+1)):
+        start = index
+        first, last = self._get_target_range()
+        for index in self._iter_search_indices(doc,
+                                               first,
+                                               min(index, last) + 1,
+                                               next=False):
+
+            # Position applies only to the first index.
+            if index != start:
+                pos = None
             text = self.subtitles[index].get_text(doc)
             # Avoid resetting finder's match span.
             if text != self._finder.text:
@@ -192,6 +347,9 @@ class SearchAgent(aeidon.Delegate):
             try:
                 match_span = self._finder.previous()
             except StopIteration:
+                if pos is None:
+                    # Text changed without a signal being emitted.
+                    self._update_search_index(doc, [index])
                 # Raise StopIteration if a full loop around all target
                 # documents and indices has been made with no matches.
                 if doc == self._match_doc:
@@ -208,6 +366,32 @@ class SearchAgent(aeidon.Delegate):
         # Raise ValueError if no match found in this document after position.
         raise ValueError("No more matches in document")
 
+    def _on_main_texts_changed(self, project, ranges):
+        """Update index of matches in main texts at `ranges`."""
+        indices = itertools.chain.from_iterable(ranges)
+        self._update_search_index(aeidon.documents.MAIN, indices)
+
+    def _on_notify_subtitles(self, *args):
+        """Rebuild index of matches when needed."""
+        self._invalidate_search_index()
+
+    def _on_subtitles_inserted(self, project, ranges):
+        """Rebuild index of matches when needed."""
+        self._invalidate_search_index()
+
+    def _on_subtitles_moved(self, project, order):
+        """Rebuild index of matches when needed."""
+        self._invalidate_search_index()
+
+    def _on_subtitles_removed(self, project, ranges):
+        """Rebuild index of matches when needed."""
+        self._invalidate_search_index()
+
+    def _on_translation_texts_changed(self, project, ranges):
+        """Update index of matches in translation texts at `ranges`."""
+        indices = itertools.chain.from_iterable(ranges)
+        self._update_search_index(aeidon.documents.TRAN, indices)
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def replace(self, register=-1):
@@ -268,6 +452,13 @@ class SearchAgent(aeidon.Delegate):
         # Ignore case only if in flags.
         self._finder.ignore_case = False
         self._finder.set_regex(pattern, flags)
+        self._set_search_key((pattern, flags))
+
+    def _set_search_key(self, key):
+        """Set pattern identified by `key` and invalidate index if changed."""
+        if key == self._search_key: return
+        self._invalidate_search_index()
+        self._search_key = key
 
     @aeidon.deco.export
     def set_search_replacement(self, replacement):
@@ -279,6 +470,7 @@ class SearchAgent(aeidon.Delegate):
         """Set the string pattern to find."""
         self._finder.pattern = pattern
         self._finder.ignore_case = ignore_case
+        self._set_search_key((pattern, ignore_case))
 
     @aeidon.deco.export
     def set_search_target(self, indices=None, docs=None, wrap=True):
@@ -291,3 +483,22 @@ class SearchAgent(aeidon.Delegate):
         self._indices = (tuple(indices) if indices else None)
         self._docs = tuple(docs or aeidon.documents)
         self._wrap = wrap
+
+    def _update_search_index(self, doc, indices):
+        """Update index of matches in `doc` at `indices`."""
+        matches = self._search_index.get(doc)
+        if matches is None: return
+        indices = sorted(set(indices))
+        if len(indices) > self._search_index_merge_limit:
+            changed = set(indices)
+            matches = [x for x in matches if not x[0] in changed]
+            new_matches = [(i, a, z) for i in indices for a, z in
+                           self._find_all(self.subtitles[i].get_text(doc))]
+            matches = list(heapq.merge(matches, new_matches))
+            self._search_index[doc] = matches
+            return
+        for i in indices:
+            a = bisect.bisect_left(matches, (i,))
+            z = bisect.bisect_left(matches, (i + 1,), a)
+            text = self.subtitles[i].get_text(doc)
+            matches[a:z] = [(i,) + x for x in self._find_all(text)]
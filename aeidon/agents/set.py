@@ -18,7 +18,6 @@
 """Setting values of single subtitle fields."""
 
 import aeidon
-import bisect
 
 from aeidon.i18n import _
 
@@ -29,14 +28,28 @@ class SetAgent(aeidon.Delegate):
 
     def _move_if_needed(self, index):
         """Move subtitle for correct order and return new index."""
-        subtitle = self.subtitles[index]
-        subtitles = self.subtitles[:index] + self.subtitles[index+1:]
-        new_index = bisect.bisect_right(subtitles, subtitle)
-        if new_index == index: return new_index
-        subtitle = self.subtitles.pop(index)
-        self.emit("subtitles-removed", (index,))
-        self.subtitles.insert(new_index, subtitle)
-        self.emit("subtitles-inserted", (new_index,))
+        subtitles = self.subtitles
+        start = subtitles[index].start_ms
+        # Most edits keep order, which is seen from the neighbours.
+        if ((index == 0 or subtitles[index-1].start_ms <= start) and
+            (index == len(subtitles) - 1 or
+             subtitles[index+1].start_ms > start)):
+            return index
+        # Find the index after subtitles starting at or before start,
+        # skipping over the subtitle itself at index.
+        low, high = 0, len(subtitles) - 1
+        while low < high:
+            middle = (low + high) // 2
+            other = subtitles[middle + (middle >= index)]
+            if start < other.start_ms:
+                high = middle
+            else:
+                low = middle + 1
+        new_index = low
+        subtitles.insert(new_index, subtitles.pop(index))
+        order = list(range(len(subtitles)))
+        order.insert(new_index, order.pop(index))
+        self.emit("subtitles-moved", order)
         return new_index
 
     @aeidon.deco.export
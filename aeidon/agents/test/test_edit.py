@@ -86,6 +86,33 @@ class TestEditAgent(aeidon.TestCase):
         self.project.remove_subtitles((2, 3))
         assert len(subtitles) == orig_length - 2
 
+    @aeidon.deco.reversion_test
+    def test_reorder_subtitles(self):
+        subtitles = list(self.project.subtitles)
+        order = [0, 3, 1, 2] + list(range(4, len(subtitles)))
+        self.project.reorder_subtitles(order)
+        assert self.project.subtitles == [subtitles[i] for i in order]
+
+    def test_reorder_subtitles__value_error(self):
+        self.assert_raises(ValueError,
+                           self.project.reorder_subtitles,
+                           [1, 0])
+
+    @aeidon.deco.reversion_test
+    def test_replace_position_arrays(self):
+        self.project.replace_position_arrays((0, 1), (100, 300), (200, 400))
+        starts, ends = self.project.get_position_arrays((0, 1))
+        assert list(starts) == [100, 300]
+        assert list(ends) == [200, 400]
+
+    @aeidon.deco.reversion_test
+    def test_replace_position_arrays__frame(self):
+        mode = aeidon.modes.FRAME
+        self.project.replace_position_arrays((0,), (24,), (48,), mode)
+        subtitles = self.project.subtitles
+        assert subtitles[0].start_frame == 24
+        assert subtitles[0].end_frame == 48
+
     @aeidon.deco.reversion_test
     def test_replace_positions(self):
         new_subtitles = []
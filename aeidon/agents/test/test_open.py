@@ -24,6 +24,63 @@ class TestOpenAgent(aeidon.TestCase):
     def setup_method(self, method):
         self.project = self.new_project()
 
+    def test_load_main(self):
+        path = self.new_subrip_file()
+        file, subtitles, sort_count = self.project.read(path, "ascii")
+        self.project.load_main(file, subtitles)
+        assert self.project.main_file is file
+        assert self.project.subtitles == subtitles
+        assert self.project.main_changed == 0
+
+    def test_load_translation(self):
+        path = self.new_subrip_file()
+        file, subtitles, sort_count = self.project.read(path, "ascii")
+        method = aeidon.align_methods.NUMBER
+        self.project.load_translation(file, subtitles, method)
+        assert self.project.tran_file is file
+        assert self.project.subtitles[0].tran_text == subtitles[0].main_text
+
+    def test_load_translation__overlap(self):
+        subtitles = [x.copy() for x in self.project.subtitles[:2]]
+        subtitles[0].main_text = "x"
+        subtitles[1].main_text = "y"
+        subtitles[1].start = subtitles[0].start
+        subtitles[1].end = subtitles[0].end
+        subtitles[1].shift_positions(0.5)
+        file = self.project.tran_file
+        method = aeidon.align_methods.OVERLAP
+        self.project.load_translation(file, subtitles, method)
+        assert self.project.subtitles[0].tran_text == "x\ny"
+        assert self.project.subtitles[1].tran_text == ""
+
+    def test_load_translation__overlap_insert(self):
+        subtitle = self.project.subtitles[-1].copy()
+        subtitle.shift_positions(1000.0)
+        subtitle.main_text = "x"
+        count = len(self.project.subtitles)
+        file = self.project.tran_file
+        method = aeidon.align_methods.OVERLAP
+        self.project.load_translation(file, [subtitle], method)
+        assert len(self.project.subtitles) == count + 1
+        assert self.project.subtitles[-1].tran_text == "x"
+        assert self.project.subtitles[-1].main_text == ""
+
+    def test_load_translation__position(self):
+        subtitles = [x.copy() for x in self.project.subtitles]
+        subtitles.insert(1, subtitles[0].copy())
+        subtitles[1].shift_positions(0.001)
+        subtitles[1].main_text = "x"
+        count = len(self.project.subtitles)
+        file = self.project.tran_file
+        method = aeidon.align_methods.POSITION
+        self.project.load_translation(file, subtitles, method)
+        assert len(self.project.subtitles) == count + 1
+        assert self.project.subtitles[1].tran_text == "x"
+        assert self.project.subtitles[1].main_text == ""
+        for i in (0, 2, 3):
+            subtitle = self.project.subtitles[i]
+            assert subtitle.main_text == subtitles[i].main_text
+
     def test_open_main(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -53,6 +110,12 @@ class TestOpenAgent(aeidon.TestCase):
             method = aeidon.align_methods.NUMBER
             self.project.open_translation(path, "ascii", method)
 
+    def test_open_translation__align_overlap(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            method = aeidon.align_methods.OVERLAP
+            self.project.open_translation(path, "ascii", method)
+
     def test_open_translation__align_position(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -66,3 +129,43 @@ class TestOpenAgent(aeidon.TestCase):
         self.project.open_translation(path, "ascii")
         assert self.project.subtitles
         assert self.project.tran_file.encoding == "utf_8_sig"
+
+    def test_read(self):
+        path = self.new_subrip_file()
+        subtitles = self.project.subtitles
+        file, new_subtitles, sort_count = self.project.read(path, "ascii")
+        assert file.format == aeidon.formats.SUBRIP
+        assert new_subtitles
+        assert sort_count == 0
+        assert self.project.subtitles is subtitles
+
+    def test_read__sort(self):
+        path = self.new_microdvd_file()
+        with open(path, "w") as f:
+            f.write("{500}{600}a\n")
+            f.write("{100}{200}b\n")
+            f.write("{300}{400}c\n")
+            f.write("{700}{800}d\n")
+            f.write("{200}{250}e\n")
+        file, subtitles, sort_count = self.project.read(path, "ascii")
+        assert [x.main_text for x in subtitles] == list("becad")
+        assert sort_count == 3
+
+    def test_read__encodings(self):
+        path = self.new_subrip_file()
+        with open(path, "a", encoding="utf_8") as f:
+            f.write("\u00e4\n")
+        encodings = ("ascii", "utf_8")
+        file, subtitles, sort_count = self.project.read(path, encodings)
+        assert file.encoding == "utf_8"
+        assert subtitles[-1].main_text.endswith("\u00e4")
+
+    def test_read__format_error(self):
+        path = self.new_temp_file(aeidon.formats.SUBRIP)
+        open(path, "w").write("xxx\n")
+        main_file = self.project.main_file
+        self.assert_raises(aeidon.FormatError,
+                           self.project.read,
+                           path, "ascii")
+
+        assert self.project.main_file is main_file
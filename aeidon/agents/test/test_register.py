@@ -27,6 +27,35 @@ class TestRegisterAgent(aeidon.TestCase):
         self.project = self.new_project()
         self.delegate = self.project.undo.__self__
 
+    def test_cut_reversion_stacks__undo_memory_limit(self):
+        for i in range(5):
+            self.project.clear_texts((i,), MAIN)
+        nbytes = self.project.undoables[0].nbytes
+        self.project.undo_memory_limit = nbytes * 2
+        assert len(self.project.undoables) == 2
+        self.project.undo_memory_limit = 0
+        assert len(self.project.undoables) == 1
+        self.project.undo()
+        assert self.project.subtitles[4].main_text
+
+    def test_get_history_size(self):
+        assert self.project.get_history_size() == 0
+        self.project.clear_texts((0, 1, 2), MAIN)
+        assert self.project.get_history_size() > 0
+        self.project.undo()
+        size = self.project.redoables.nbytes
+        assert self.project.get_history_size() == size
+
+    def test_group_actions(self):
+        self.project.clear_texts((0,), MAIN)
+        self.project.clear_texts((1,), MAIN)
+        self.project.group_actions(aeidon.registers.DO, 2, "test")
+        assert len(self.project.undoables) == 1
+        assert self.project.undoables[0].description == "test"
+        self.project.undo()
+        assert self.project.subtitles[0].main_text
+        assert self.project.subtitles[1].main_text
+
     def test_redo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
@@ -60,3 +89,12 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[0].main_text == ""
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
+
+    def test_undo__error(self):
+        self.project.clear_texts((0,), MAIN)
+        def revert(*args, **kwargs):
+            raise ValueError
+        self.project.undoables[0].revert_function = revert
+        self.assert_raises(ValueError, self.project.undo)
+        # Changes must be thawed for signals to be emitted again.
+        assert not self.project.thaw_changes()
@@ -34,6 +34,28 @@ class TestSaveAgent(aeidon.TestCase):
             self.project.save_main(file, keep_changes=True)
             assert self.project.main_changed == 0
 
+    def test_save_main__markup(self):
+        self.project.subtitles[0].main_text = "<i>test</i>"
+        path = self.project.main_file.path
+        file = aeidon.files.new(aeidon.formats.MICRODVD, path, "ascii")
+        self.project.save_main(file, keep_changes=False)
+        assert self.project.subtitles[0].main_text == "<i>test</i>"
+        assert file.read()[0].main_text == "{Y:i}test"
+        file = aeidon.files.new(aeidon.formats.MICRODVD, path, "ascii")
+        self.project.save_main(file, keep_changes=True)
+        assert self.project.subtitles[0].main_text == "{Y:i}test"
+
+    def test_save_main__write_func(self):
+        calls = []
+        def write(subtitles, doc):
+            calls.append(doc)
+            file.write(subtitles, doc)
+        path = self.project.main_file.path
+        file = aeidon.files.new(aeidon.formats.SUBVIEWER2, path, "ascii")
+        self.project.save_main(file, write_func=write)
+        assert calls == [aeidon.documents.MAIN]
+        assert self.project.main_file is file
+
     def test_save_translation(self):
         for format in aeidon.formats:
             self.project.clear_texts((0,), aeidon.documents.TRAN)
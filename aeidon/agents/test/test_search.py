@@ -37,6 +37,49 @@ class TestSearchAgent(aeidon.TestCase):
         indices = list(range(3, len(self.project.subtitles)))
         self.project.remove_subtitles(indices, register=None)
 
+    def test_count_search_matches(self):
+        self.project.set_search_string("you")
+        assert self.project.count_search_matches() == 6
+        self.project.set_search_target(None, (MAIN,))
+        assert self.project.count_search_matches() == 3
+        self.project.set_search_target((1, 2), (MAIN,))
+        assert self.project.count_search_matches() == 1
+
+    def test_count_search_matches__ignore_case(self):
+        self.project.set_search_string("BE", ignore_case=True)
+        assert self.project.count_search_matches() == 4
+
+    def test_count_search_matches__insert(self):
+        self.project.set_search_string("you")
+        subtitle = self.project.new_subtitle()
+        subtitle.main_text = "you and you"
+        self.project.insert_subtitles((0,), (subtitle,))
+        assert self.project.count_search_matches() == 8
+        self.project.remove_subtitles((0, 1))
+        assert self.project.count_search_matches() == 2
+
+    def test_count_search_matches__set_text(self):
+        self.project.set_search_string("you")
+        self.project.set_text(0, MAIN, "you, you and you")
+        assert self.project.count_search_matches() == 7
+        self.project.undo()
+        assert self.project.count_search_matches() == 6
+
+    def test_count_search_matches__replace_all(self):
+        self.project.set_search_regex(r"\bS")
+        self.project.set_search_replacement("s")
+        assert self.project.count_search_matches() == 2
+        self.project.replace_all()
+        assert self.project.count_search_matches() == 0
+
+    def test_find_next__changed_without_signal(self):
+        self.project.set_search_string("you")
+        self.project.count_search_matches()
+        for subtitle in self.project.subtitles:
+            subtitle.main_text = subtitle.tran_text = ""
+        self.assert_raises(StopIteration, self.project.find_next)
+        assert self.project.count_search_matches() == 0
+
     def test_find_next(self):
         matches = iter(((0, MAIN, ( 0,  0)),
                         (0, MAIN, (26, 26)),
@@ -76,6 +119,25 @@ class TestSearchAgent(aeidon.TestCase):
                 assert next(matches) is StopIteration
                 break
 
+    def test_get_search_match_number(self):
+        self.project.set_search_string("you")
+        match = self.project.find_next(1, TRAN, None)
+        assert self.project.get_search_match_number(*match) == 5
+        self.assert_raises(ValueError,
+                           self.project.get_search_match_number,
+                           0, MAIN, (0, 3))
+
+    def test_get_search_matches(self):
+        self.project.set_search_string("you")
+        self.project.set_search_target(None, (TRAN, MAIN))
+        matches = self.project.get_search_matches()
+        assert matches == [(0, TRAN, (17, 20)),
+                           (0, TRAN, (26, 29)),
+                           (1, TRAN, ( 3,  6)),
+                           (0, MAIN, (17, 20)),
+                           (0, MAIN, (26, 29)),
+                           (1, MAIN, ( 3,  6))]
+
     @aeidon.deco.reversion_test
     def test_replace(self):
         self.project.set_search_target(None, (MAIN,))
@@ -57,6 +57,16 @@ class TestSetAgent(aeidon.TestCase):
         assert subtitles[0].main_text == text_3
         assert subtitles[1].main_text == text_0
 
+    @aeidon.deco.reversion_test
+    def test_set_start__reorder_later(self):
+        subtitles = self.project.subtitles
+        text_0 = subtitles[0].main_text
+        text_4 = subtitles[4].main_text
+        start = subtitles[3].start_seconds
+        self.project.set_start(0, start)
+        assert subtitles[3].main_text == text_0
+        assert subtitles[4].main_text == text_4
+
     @aeidon.deco.reversion_test
     def test_set_text__main(self):
         subtitles = self.project.subtitles
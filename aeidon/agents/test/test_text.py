@@ -82,6 +82,14 @@ class TestTextAgent(aeidon.TestCase):
                                             doc=aeidon.documents.MAIN,
                                             language="en")
 
+    def test_spell_check_join_words__text(self):
+        self.project.subtitles[0].main_text = "This is a tes t."
+        self.project.spell_check_join_words(indices=[0],
+                                            doc=aeidon.documents.MAIN,
+                                            language="en")
+
+        assert self.project.subtitles[0].main_text == "This is a test."
+
     def test_spell_check_split_words(self):
         for subtitle in self.project.subtitles:
             subtitle.main_text = subtitle.main_text.replace("s ", "s")
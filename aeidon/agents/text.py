@@ -38,7 +38,8 @@ class TextAgent(aeidon.Delegate):
         Break lines to fit defined maximum line length and count.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. `length_func`
+        be a sequence of instances of :class:`aeidon.Pattern` or an instance
+        of :class:`aeidon.PatternSet`. `length_func`
         should return the length of a string argument. `max_length` should be
         the maximum allowed length of lines in the same scale as returned by
         `length_func`. `max_lines` may be violated to avoid violating
@@ -50,7 +51,7 @@ class TextAgent(aeidon.Delegate):
         """
         new_indices = []
         new_texts = []
-        patterns = [x for x in patterns if x.enabled]
+        patterns = self._get_pattern_set(patterns)
         penalties = self._get_penalties(patterns)
         liner = self.get_liner(doc)
         liner.set_penalties(penalties)
@@ -97,13 +98,15 @@ class TextAgent(aeidon.Delegate):
         Capitalize texts as defined by `patterns`.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
-        :exc:`re.error` if a bad regular expression among `patterns`.
+        be a sequence of instances of :class:`aeidon.Pattern` or an instance
+        of :class:`aeidon.PatternSet`. Raise :exc:`re.error` if a bad regular
+        expression among `patterns`.
         """
         new_indices = []
         new_texts = []
         parser = self.get_parser(doc)
-        patterns = [x for x in patterns if x.enabled]
+        patterns = self._get_pattern_set(patterns)
+        items = list(zip(patterns.patterns, patterns.regexes))
         indices = indices or self.get_all_indices()
         for indices in aeidon.util.get_ranges(indices):
             cap_next = False
@@ -113,10 +116,8 @@ class TextAgent(aeidon.Delegate):
                 if cap_next or index == 0:
                     self._capitalize_first(parser, 0)
                     cap_next = False
-                for pattern in patterns:
-                    string = pattern.get_field("Pattern")
-                    flags = pattern.get_flags()
-                    parser.set_regex(string, flags)
+                for pattern, regex in items:
+                    parser.pattern = regex
                     parser.pos = 0
                     cap_next = self._capitalize_text(parser, pattern, cap_next)
                 text = parser.get_text()
@@ -157,24 +158,22 @@ class TextAgent(aeidon.Delegate):
         Correct common human and OCR errors in texts.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
-        :exc:`re.error` if a bad regular expression among `patterns`.
+        be a sequence of instances of :class:`aeidon.Pattern` or an instance
+        of :class:`aeidon.PatternSet`. Raise :exc:`re.error` if a bad regular
+        expression among `patterns`.
         """
         new_indices = []
         new_texts = []
         parser = self.get_parser(doc)
-        patterns = [x for x in patterns if x.enabled]
-        re_patterns = self._get_substitutions(patterns)
-        repeats = [x.get_field_boolean("Repeat") for x in patterns]
+        patterns = self._get_pattern_set(patterns)
         for index in indices or self.get_all_indices():
             subtitle = self.subtitles[index]
             parser.set_text(subtitle.get_text(doc))
-            for i, item in enumerate(re_patterns):
-                string, flags, replacement = item
-                parser.set_regex(string, flags)
+            for regex, replacement, repeat in patterns.substitutions:
+                parser.pattern = regex
                 parser.replacement = replacement
                 count = parser.replace_all()
-                while repeats[i] and count:
+                while repeat and count:
                     count = parser.replace_all()
             text = parser.get_text()
             if text != subtitle.get_text(doc):
@@ -184,19 +183,11 @@ class TextAgent(aeidon.Delegate):
         self.replace_texts(new_indices, doc, new_texts, register=register)
         self.set_action_description(register, _("Correcting common errors"))
 
-    def _get_enchant_checker(self, language):
-        """Return an enchant spell-checker for `language`."""
-        import enchant.checker
-        dictionary = enchant.Dict(language)
-        # Sometimes enchant will initialize a dictionary that will not
-        # actually work when trying to use it, hence check something.
-        dictionary.check("aeidon")
-        return enchant.checker.SpellChecker(dictionary, "")
-
-    def _get_misspelled_indices(self, checker):
-        """Return a list of misspelled indices in `checker`'s text."""
-        i = [list(range(x.wordpos, x.wordpos + len(x.word))) for x in checker]
-        return aeidon.util.flatten(i)
+    def _get_pattern_set(self, patterns):
+        """Return `patterns` as a :class:`aeidon.PatternSet` instance."""
+        if isinstance(patterns, aeidon.PatternSet):
+            return patterns
+        return aeidon.PatternSet(patterns)
 
     def _get_penalties(self, patterns):
         """Return a list of penalty definitions."""
@@ -205,15 +196,40 @@ class TextAgent(aeidon.Delegate):
             "flags": x.get_flags(),
             "group": int(x.get_field("Group")),
             "value": float(x.get_field("Penalty")),
-        } for x in patterns]
+        } for x in patterns.patterns]
 
-    def _get_substitutions(self, patterns):
-        """Return a list of substitution definitions."""
-        return [(
-            x.get_field("Pattern"),
-            x.get_flags(),
-            x.get_field("Replacement"),
-        ) for x in patterns]
+    def _join_words(self, checker, text):
+        """Return `text` with misspelled words joined to neighbours."""
+        words = checker.split(text)
+        i = 0
+        while i < len(words):
+            a, word = words[i]
+            z = a + len(word)
+            if checker.check(word):
+                i += 1
+                continue
+            # Check only the words formed by joining to the previous
+            # or to the next word, leaving the rest of the text as is.
+            ok_with_prev = ok_with_next = False
+            if i > 0 and text[a-1:a] == " ":
+                b, prev = words[i-1]
+                if b + len(prev) == a - 1:
+                    ok_with_prev = checker.check(prev + word)
+            if i < len(words) - 1 and text[z:z+1] == " ":
+                b, following = words[i+1]
+                if b == z + 1:
+                    ok_with_next = checker.check(word + following)
+            # Join backwards or forwards if only one direction,
+            # but not both, produce a correctly spelled result.
+            if ok_with_prev and not ok_with_next:
+                text = text[:a-1] + text[a:]
+                words = checker.split(text)
+                continue
+            if ok_with_next and not ok_with_prev:
+                text = text[:z] + text[z+1:]
+                words = checker.split(text)
+            i += 1
+        return text
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -222,19 +238,19 @@ class TextAgent(aeidon.Delegate):
         Remove hearing impaired parts from subtitles.
 
         `indices` can be ``None`` to process all subtitles. `patterns` should
-        be a sequence of instances of :class:`aeidon.Pattern`. Raise
-        :exc:`re.error` if a bad regular expression among `patterns`.
+        be a sequence of instances of :class:`aeidon.Pattern` or an instance
+        of :class:`aeidon.PatternSet`. Raise :exc:`re.error` if a bad regular
+        expression among `patterns`.
         """
         new_indices = []
         new_texts = []
         parser = self.get_parser(doc)
-        patterns = [x for x in patterns if x.enabled]
-        re_patterns = self._get_substitutions(patterns)
+        patterns = self._get_pattern_set(patterns)
         for index in indices or self.get_all_indices():
             subtitle = self.subtitles[index]
             parser.set_text(subtitle.get_text(doc))
-            for string, flags, replacement in re_patterns:
-                parser.set_regex(string, flags)
+            for regex, replacement, repeat in patterns.substitutions:
+                parser.pattern = regex
                 parser.replacement = replacement
                 parser.replace_all()
             text = parser.get_text()
@@ -293,33 +309,12 @@ class TextAgent(aeidon.Delegate):
         new_indices = []
         new_texts = []
         re_multispace = re.compile(r" +")
-        checker = self._get_enchant_checker(language)
-        seeker = self._get_enchant_checker(language)
+        checker = aeidon.SpellChecker(language)
         for index in indices or self.get_all_indices():
             subtitle = self.subtitles[index]
             text = subtitle.get_text(doc)
             text = re_multispace.sub(" ", text)
-            checker.set_text(text)
-            for error in checker:
-                text = checker.get_text()
-                a = checker.wordpos
-                z = checker.wordpos + len(checker.word)
-                ok_with_prev = ok_with_next = False
-                if checker.leading_context(1) == " ":
-                    seeker.set_text(text[:a-1] + text[a:])
-                    poss = self._get_misspelled_indices(seeker)
-                    ok_with_prev = not a-1 in poss
-                if checker.trailing_context(1) == " ":
-                    seeker.set_text(text[:z] + text[z+1:])
-                    poss = self._get_misspelled_indices(seeker)
-                    ok_with_next = not a in poss
-                # Join backwards or forwards if only one direction,
-                # but not both, produce a correctly spelled result.
-                if ok_with_prev and not ok_with_next:
-                    checker.set_text(text[:a-1] + text[a:])
-                if ok_with_next and not ok_with_prev:
-                    checker.set_text(text[:z] + text[z+1:])
-            new_text = checker.get_text()
+            new_text = self._join_words(checker, text)
             if new_text != text:
                 new_indices.append(index)
                 new_texts.append(new_text)
@@ -340,30 +335,12 @@ class TextAgent(aeidon.Delegate):
         new_indices = []
         new_texts = []
         re_multispace = re.compile(r" +")
-        checker = self._get_enchant_checker(language)
-        indices = indices or self.get_all_indices()
-        for index in indices:
+        checker = aeidon.SpellChecker(language)
+        for index in indices or self.get_all_indices():
             subtitle = self.subtitles[index]
             text = subtitle.get_text(doc)
             text = re_multispace.sub(" ", text)
-            checker.set_text(text)
-            for error in checker:
-                # Skip capitalized words, which are usually names
-                # and thus not always found in dictionaries.
-                if checker.word.capitalize() == checker.word: continue
-                suggestions = []
-                for i, suggestion in enumerate(checker.suggest()):
-                    if suggestion.find(" ") > 0:
-                        if suggestion.replace(" ", "") == checker.word:
-                            suggestions.append(suggestion)
-                # Split word only if only one two-word suggestion found that
-                # has all the same characters as the original unsplit word.
-                if len(suggestions) != 1: continue
-                text = checker.get_text()
-                a = checker.wordpos
-                z = checker.wordpos + len(checker.word)
-                checker.set_text(text[:a] + suggestions[0] + text[z:])
-            new_text = checker.get_text()
+            new_text = self._split_words(checker, text)
             if new_text != text:
                 new_indices.append(index)
                 new_texts.append(new_text)
@@ -371,3 +348,21 @@ class TextAgent(aeidon.Delegate):
         self.replace_texts(new_indices, doc, new_texts, register=register)
         description = _("Splitting words by spell-check suggestions")
         self.set_action_description(register, description)
+
+    def _split_words(self, checker, text):
+        """Return `text` with misspelled words split in two."""
+        # Split from the end to keep positions of earlier words valid.
+        for a, word in reversed(checker.split(text)):
+            # Skip capitalized words, which are usually names
+            # and thus not always found in dictionaries.
+            if word.capitalize() == word: continue
+            if checker.check(word): continue
+            suggestions = [x for x in checker.suggest(word)
+                           if x.find(" ") > 0 and
+                           x.replace(" ", "") == word]
+
+            # Split word only if only one two-word suggestion found that
+            # has all the same characters as the original unsplit word.
+            if len(suggestions) != 1: continue
+            text = text[:a] + suggestions[0] + text[a+len(word):]
+        return text
@@ -18,6 +18,7 @@
 """Miscellaneous helper methods."""
 
 import aeidon
+import array
 
 
 class UtilityAgent(aeidon.Delegate):
@@ -110,6 +111,34 @@ class UtilityAgent(aeidon.Delegate):
         clean_func = self.get_markup_clean_func(doc)
         return aeidon.Parser(re_tag, clean_func)
 
+    @aeidon.deco.export
+    def get_position_arrays(self, indices=None, mode=None):
+        """
+        Return arrays of start and end positions at `indices`.
+
+        Positions are returned as :class:`array.array` instances of integers,
+        milliseconds for :attr:`aeidon.modes.TIME` and frames for
+        :attr:`aeidon.modes.FRAME`. `indices` can be ``None`` to process all
+        subtitles and `mode` can be ``None`` to use the mode of the main file.
+        """
+        mode = mode or self.get_mode()
+        if indices is None:
+            indices = self.get_all_indices()
+        if isinstance(self.subtitles, aeidon.SubtitleStore):
+            return self.subtitles.get_positions(indices, mode)
+        subtitles = [self.subtitles[i] for i in indices]
+        if all(x.mode == mode for x in subtitles):
+            return (array.array("q", [x._start for x in subtitles]),
+                    array.array("q", [x._end for x in subtitles]))
+        if mode == aeidon.modes.TIME:
+            return (array.array("q", [x.start_ms for x in subtitles]),
+                    array.array("q", [x.end_ms for x in subtitles]))
+        if mode == aeidon.modes.FRAME:
+            return (array.array("q", [x.start_frame for x in subtitles]),
+                    array.array("q", [x.end_frame for x in subtitles]))
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(mode)))
+
     @aeidon.deco.export
     def get_text_length(self, index, doc):
         """Return the amount of characters in text excluding markup."""
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Converting and normalizing subtitle files in batch.
+
+Files are processed in a pool of worker processes, each of which reads
+pattern files once upon initialization and then reuses them for all files
+given to it. Operations are applied to each file in the order given and
+failure to process one file does not affect the processing of others.
+"""
+
+import aeidon
+import argparse
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+
+from aeidon.i18n import _
+
+__all__ = ("BatchResult", "convert", "find_files", "main")
+
+# Worker process state, set by _init_worker.
+_worker = None
+
+
+class BatchResult:
+
+    """
+    Result of processing one file.
+
+    :ivar count: Amount of subtitles in file
+    :ivar error: String description of error or ``None`` if successful
+    :ivar out_path: Path to the file written or ``None``
+    :ivar path: Path to the file read
+    :ivar seconds: Duration of processing in seconds
+    """
+
+    def __init__(self, path):
+        """Initialize a :class:`BatchResult` instance."""
+        self.count = 0
+        self.error = None
+        self.out_path = None
+        self.path = path
+        self.seconds = 0
+
+
+class _AppendOperation(argparse.Action):
+
+    """Argument parser action to append an operation in given order."""
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        """Append operation and its arguments to `namespace`."""
+        operations = list(namespace.operations or [])
+        operations.append((self.dest, values))
+        namespace.operations = operations
+
+
+class _Worker:
+
+    """
+    Processing of files in one worker process.
+
+    :ivar options: Namespace of options as returned by :func:`parse_args`
+    :ivar patterns: Dictionary mapping pattern types to pattern sets
+    """
+
+    def __init__(self, options):
+        """Initialize a :class:`_Worker` instance."""
+        self.options = options
+        self.patterns = {}
+        names = [x[0] for x in options.operations]
+        code = (options.script, options.language, options.country)
+        if "break_lines" in names:
+            manager = aeidon.PatternManager("line-break")
+            self.patterns["line-break"] = manager.get_pattern_set(*code)
+        if "correct_errors" in names:
+            manager = aeidon.PatternManager("common-error")
+            self.patterns["common-error"] = manager.get_pattern_set(*code)
+
+    def _get_out_path(self, path, format):
+        """Return path of the file to write corresponding to `path`."""
+        root = os.path.splitext(path)[0]
+        if self.options.output_dir is not None:
+            root = os.path.relpath(os.path.abspath(root), self.options.root)
+            root = os.path.join(self.options.output_dir, root)
+        return root + format.extension
+
+    def process(self, path):
+        """Process file at `path` and return a :class:`BatchResult`."""
+        result = BatchResult(path)
+        start = time.perf_counter()
+        try:
+            self._process(path, result)
+        except Exception:
+            # Isolate all errors to the file being processed.
+            lines = traceback.format_exception_only(*sys.exc_info()[:2])
+            result.error = lines[-1].strip()
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _process(self, path, result):
+        """Process file at `path` and fill in `result`."""
+        options = self.options
+        framerate = getattr(aeidon.framerates, options.framerate_in)
+        project = aeidon.Project(framerate)
+        # Undo history is of no use here, keep only the action
+        # just done, which is needed to emit the action signal.
+        project.undo_limit = 1
+        project.open_main(path, options.encoding)
+        result.count = len(project.subtitles)
+        doc = aeidon.documents.MAIN
+        for name, value in options.operations:
+            if name == "break_lines":
+                project.break_lines(indices=None,
+                                    doc=doc,
+                                    patterns=self.patterns["line-break"],
+                                    length_func=len,
+                                    max_length=options.max_length,
+                                    max_lines=options.max_lines)
+
+            if name == "correct_errors":
+                project.correct_common_errors(
+                    None, doc, self.patterns["common-error"])
+            if name == "framerate":
+                project.convert_framerate(None, *(
+                    getattr(aeidon.framerates, x) for x in value))
+            if name == "shift":
+                project.shift_positions(None, value)
+        format = project.main_file.format
+        if options.format is not None:
+            format = getattr(aeidon.formats, options.format)
+        out_path = self._get_out_path(path, format)
+        if (os.path.abspath(out_path) == os.path.abspath(path) and
+            not options.overwrite):
+            raise IOError("Refusing to overwrite input file {}"
+                          .format(repr(path)))
+        aeidon.util.makedirs(os.path.dirname(out_path))
+        encoding = options.output_encoding or project.main_file.encoding
+        file = aeidon.files.new(format, out_path, encoding)
+        if options.newline is not None:
+            file.newline = getattr(aeidon.newlines, options.newline)
+        # Markup is converted when saving in a different format.
+        project.save_main(file)
+        result.out_path = out_path
+
+
+def convert(paths, options, processes=None):
+    """
+    Process files at `paths` and yield :class:`BatchResult` instances.
+
+    `options` should be a namespace as returned by :func:`parse_args`.
+    `processes` is the amount of worker processes to use, ``None`` for as
+    many as there are CPUs or one to process files in this process.
+    Results are yielded in the order in which processing finishes.
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(paths) < 2:
+        worker = _Worker(options)
+        yield from map(worker.process, paths)
+        return
+    processes = min(processes, len(paths))
+    chunksize = max(1, min(16, len(paths) // (processes * 4)))
+    with multiprocessing.Pool(processes,
+                              initializer=_init_worker,
+                              initargs=(options,)) as pool:
+        yield from pool.imap_unordered(_process, paths, chunksize)
+
+def find_files(paths):
+    """
+    Return a sorted list of subtitle files found at `paths`.
+
+    `paths` can contain files, directories and glob patterns. Directories
+    are searched recursively for files with an extension used by any of
+    the subtitle file formats.
+    """
+    found = set()
+    extensions = tuple(set(x.extension for x in aeidon.formats
+                           if x.extension is not None))
+
+    for path in paths:
+        for path in (glob.glob(path, recursive=True) or [path]):
+            if os.path.isfile(path):
+                found.add(path)
+                continue
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                found.update(os.path.join(root, x) for x in files
+                             if x.endswith(extensions))
+    return sorted(found)
+
+def _format(name):
+    """Return name of :attr:`aeidon.formats` item matching `name`."""
+    for format in aeidon.formats:
+        if format.name.lower() == name.lower():
+            return format.name
+    raise argparse.ArgumentTypeError("Invalid format: {}"
+                                     .format(repr(name)))
+
+def _framerate(value):
+    """Return name of :attr:`aeidon.framerates` item matching `value`."""
+    for framerate in aeidon.framerates:
+        if abs(framerate.value - float(value)) < 0.01:
+            return framerate.name
+    raise argparse.ArgumentTypeError("Invalid framerate: {}"
+                                     .format(repr(value)))
+
+def _framerates(value):
+    """Return a tuple of two framerate names matching `value`."""
+    return tuple(map(_framerate, value.split(":")))
+
+def _init_worker(options):
+    """Initialize worker process state."""
+    global _worker
+    _worker = _Worker(options)
+
+def main(args=None):
+    """Process files given on command line and return exit status."""
+    options = parse_args(args)
+    paths = find_files(options.paths)
+    if not paths:
+        print(_("No subtitle files found"), file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    count = failures = 0
+    for i, result in enumerate(convert(paths, options, options.jobs)):
+        count += result.count
+        failures += result.error is not None
+        if result.error is not None:
+            print("[{:d}/{:d}] {}: {}".format(
+                i+1, len(paths), result.path, result.error),
+                  file=sys.stderr)
+        elif not options.quiet:
+            print("[{:d}/{:d}] {} -> {}".format(
+                i+1, len(paths), result.path, result.out_path))
+    seconds = time.perf_counter() - start
+    print(_("{:d} files, {:d} failed, {:d} subtitles in {:.3f} s, "
+            "{:.1f} files/s, {:.0f} subtitles/s").format(
+                len(paths), failures, count, seconds,
+                len(paths) / seconds, count / seconds),
+          file=sys.stderr)
+    return int(failures > 0)
+
+def _newline(name):
+    """Return name of :attr:`aeidon.newlines` item matching `name`."""
+    for newline in aeidon.newlines:
+        if newline.name.lower() == name.lower():
+            return newline.name
+    raise argparse.ArgumentTypeError("Invalid newline: {}"
+                                     .format(repr(name)))
+
+def parse_args(args=None):
+    """Parse and return options from `args`."""
+    parser = argparse.ArgumentParser(
+        prog="aeidon-batch",
+        description=_("Convert and normalize subtitle files in batch. "
+                      "Operations are applied in the order given."))
+
+    parser.add_argument(
+        "paths",
+        metavar=_("PATH"),
+        nargs="+",
+        help=_("subtitle file, directory or glob pattern"))
+
+    parser.add_argument(
+        "-e", "--encoding",
+        metavar=_("ENCODING"),
+        default=None,
+        help=_("character encoding used to open files"))
+
+    # Enumeration items are stored by name in options,
+    # since those are pickled and passed to worker processes.
+    parser.add_argument(
+        "--framerate-in",
+        metavar=_("FPS"),
+        type=_framerate,
+        default="23.976",
+        help=_("framerate of video, used with frame-based formats"))
+
+    operations = parser.add_argument_group(_("operations"))
+    operations.add_argument(
+        "--shift",
+        action=_AppendOperation,
+        metavar=_("SECONDS"),
+        type=float,
+        help=_("make subtitles appear earlier or later"))
+
+    operations.add_argument(
+        "--framerate",
+        action=_AppendOperation,
+        metavar=_("IN:OUT"),
+        type=_framerates,
+        help=_("convert positions from framerate IN to OUT"))
+
+    operations.add_argument(
+        "--break-lines",
+        action=_AppendOperation,
+        nargs=0,
+        help=_("break lines to fit maximum length and count"))
+
+    operations.add_argument(
+        "--correct-errors",
+        action=_AppendOperation,
+        nargs=0,
+        help=_("correct common human and OCR errors"))
+
+    patterns = parser.add_argument_group(_("patterns"))
+    patterns.add_argument(
+        "--script",
+        metavar=_("CODE"),
+        default="Latn",
+        help=_("ISO 15924 script code of pattern set"))
+
+    patterns.add_argument(
+        "--language",
+        metavar=_("CODE"),
+        default=None,
+        help=_("ISO 639 language code of pattern set"))
+
+    patterns.add_argument(
+        "--country",
+        metavar=_("CODE"),
+        default=None,
+        help=_("ISO 3166 country code of pattern set"))
+
+    patterns.add_argument(
+        "--max-length",
+        metavar=_("N"),
+        type=int,
+        default=44,
+        help=_("maximum line length in characters"))
+
+    patterns.add_argument(
+        "--max-lines",
+        metavar=_("N"),
+        type=int,
+        default=2,
+        help=_("maximum amount of lines"))
+
+    output = parser.add_argument_group(_("output"))
+    output.add_argument(
+        "-f", "--format",
+        metavar=_("FORMAT"),
+        type=_format,
+        default=None,
+        help=_("format to save as, converting markup"))
+
+    output.add_argument(
+        "-o", "--output-dir",
+        metavar=_("DIRECTORY"),
+        default=None,
+        help=_("directory to write files to, keeping subdirectories"))
+
+    output.add_argument(
+        "--output-encoding",
+        metavar=_("ENCODING"),
+        default=None,
+        help=_("character encoding to save files in"))
+
+    output.add_argument(
+        "--newline",
+        metavar=_("NEWLINE"),
+        type=_newline,
+        default=None,
+        help=_("newline type to save files with: mac, unix or windows"))
+
+    output.add_argument(
+        "--overwrite",
+        action="store_true",
+        default=False,
+        help=_("allow overwriting input files"))
+
+    parser.add_argument(
+        "-j", "--jobs",
+        metavar=_("N"),
+        type=int,
+        default=None,
+        help=_("amount of worker processes, default amount of CPUs"))
+
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        default=False,
+        help=_("only print errors and summary"))
+
+    parser.set_defaults(operations=[])
+    options = parser.parse_args(args)
+    # Files are written to output directory relative to the common
+    # parent directory of all the files and directories given.
+    paths = [os.path.abspath(x) for x in options.paths]
+    paths = [x if os.path.isdir(x) else os.path.dirname(x) for x in paths]
+    options.root = os.path.commonpath(paths)
+    return options
+
+def _process(path):
+    """Process file at `path` in a worker process."""
+    return _worker.process(path)
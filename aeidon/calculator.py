@@ -29,6 +29,11 @@ class Calculator:
 
     Times are handled as strings, frames as integers and seconds as floats.
     Only one instance of :class:`Calculator` exists for a given framerate.
+
+    Internally, times are handled as integer milliseconds, which are an exact
+    representation of the ``HH:MM:SS.SSS`` strings. Calculating in
+    milliseconds and converting to strings only when needed avoids parsing
+    and formatting strings for every single operation.
     """
 
     _instances = {}
@@ -67,9 +72,9 @@ class Calculator:
     def add(self, x, y):
         """Add position `y` to `x`."""
         if aeidon.is_time(x):
-            x = self.to_seconds(x)
-            y = self.to_seconds(y)
-            return self.seconds_to_time(x + y)
+            x = self.time_to_ms(x)
+            y = self.to_ms(y)
+            return self.ms_to_time(x + y)
         if aeidon.is_frame(x):
             return x + self.to_frame(y)
         if aeidon.is_seconds(x):
@@ -77,21 +82,24 @@ class Calculator:
         raise ValueError("Invalid type for x: {}"
                          .format(repr(type(x))))
 
+    def frame_to_ms(self, frame):
+        """Convert `frame` to milliseconds."""
+        return int(round(1000 * frame / self._framerate))
+
     def frame_to_seconds(self, frame):
         """Convert `frame` to seconds."""
         return aeidon.as_seconds(frame / self._framerate)
 
     def frame_to_time(self, frame):
         """Convert `frame` to time."""
-        seconds = self.frame_to_seconds(frame)
-        return self.seconds_to_time(seconds)
+        return self.ms_to_time(self.frame_to_ms(frame))
 
     def get_middle(self, x, y):
         """Return time, frame or seconds halfway between `x` and `y`."""
         if aeidon.is_time(x):
-            x = self.time_to_seconds(x)
-            y = self.to_seconds(y)
-            return self.seconds_to_time((x+y)/2)
+            x = self.time_to_ms(x)
+            y = self.to_ms(y)
+            return self.ms_to_time(round((x+y)/2))
         if aeidon.is_frame(x):
             y = self.to_frame(y)
             return aeidon.as_frame(round((x+y)/2, 0))
@@ -104,8 +112,7 @@ class Calculator:
     def is_earlier(self, x, y):
         """Return ``True`` if `x` is earlier than `y`."""
         if aeidon.is_time(x):
-            x = self.time_to_seconds(x)
-            return self.is_earlier(x, y)
+            return (self.time_to_ms(x) < self.to_ms(y))
         if aeidon.is_frame(x):
             return (x < self.to_frame(y))
         if aeidon.is_seconds(x):
@@ -116,8 +123,7 @@ class Calculator:
     def is_later(self, x, y):
         """Return ``True`` if `x` is later than `y`."""
         if aeidon.is_time(x):
-            x = self.time_to_seconds(x)
-            return self.is_later(x, y)
+            return (self.time_to_ms(x) > self.to_ms(y))
         if aeidon.is_frame(x):
             return (x > self.to_frame(y))
         if aeidon.is_seconds(x):
@@ -141,6 +147,26 @@ class Calculator:
                 0 <= seconds  <=  59 and
                 0 <= mseconds <= 999)
 
+    def ms_to_frame(self, ms):
+        """Convert `ms` milliseconds to frame."""
+        return int(round(ms * self._framerate / 1000, 0))
+
+    def ms_to_seconds(self, ms):
+        """Convert `ms` milliseconds to seconds."""
+        return aeidon.as_seconds(ms / 1000)
+
+    def ms_to_time(self, ms):
+        """Convert `ms` milliseconds to time."""
+        sign = ("-" if ms < 0 else "")
+        ms = abs(ms)
+        if ms > 359999999:
+            return "{}99:59:59.999".format(sign)
+        seconds, ms = divmod(ms, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return ("{}{:02d}:{:02d}:{:02d}.{:03d}"
+                .format(sign, hours, minutes, seconds, ms))
+
     def normalize_time(self, time):
         """
         Convert `time` to valid format.
@@ -173,9 +199,9 @@ class Calculator:
         if given `ndigits` is greater than zero.
         """
         if aeidon.is_time(pos):
-            pos = self.time_to_seconds(pos)
-            pos = round(pos, ndigits)
-            return self.seconds_to_time(pos)
+            pos = self.time_to_ms(pos)
+            pos = self.round_ms(pos, ndigits)
+            return self.ms_to_time(pos)
         if aeidon.is_frame(pos):
             ndigits = min(0, ndigits)
             pos = round(pos, ndigits)
@@ -186,36 +212,50 @@ class Calculator:
         raise ValueError("Invalid type for pos: {}"
                          .format(repr(type(pos))))
 
+    def round_ms(self, ms, ndigits):
+        """
+        Round `ms` milliseconds to given precision in decimal digits of seconds.
+
+        Halves are rounded away from zero, i.e. the same way regardless
+        of whether the digit before is odd or even.
+
+        >>> calc = aeidon.Calculator()
+        >>> calc.round_ms(14445, 2)
+        14450
+        """
+        if ndigits >= 3: return ms
+        unit = 10**(3 - ndigits)
+        sign = (-1 if ms < 0 else 1)
+        return sign * ((abs(ms) + unit // 2) // unit * unit)
+
     def seconds_to_frame(self, seconds):
         """Convert `seconds` to frame."""
         return int(round(seconds * self._framerate, 0))
 
+    def seconds_to_ms(self, seconds):
+        """Convert `seconds` to milliseconds."""
+        return int(round(seconds * 1000))
+
     def seconds_to_time(self, seconds):
         """Convert `seconds` to time."""
-        sign = ("-" if seconds < 0 else "")
-        seconds = abs(round(seconds, 3))
-        if seconds > 359999.999:
-            return "{}99:59:59.999".format(sign)
-        return ("{}{:02.0f}:{:02.0f}:{:02.0f}.{:03.0f}"
-                .format(sign,
-                        seconds // 3600,
-                        (seconds % 3600) // 60,
-                        int(seconds % 60),
-                        (seconds % 1) * 1000))
+        return self.ms_to_time(self.seconds_to_ms(seconds))
 
     def time_to_frame(self, time):
         """Convert `time` to frame."""
-        seconds = self.time_to_seconds(time)
-        return self.seconds_to_frame(seconds)
+        return self.ms_to_frame(self.time_to_ms(time))
+
+    def time_to_ms(self, time):
+        """Convert `time` to milliseconds."""
+        if time.startswith("-"):
+            return -self.time_to_ms(time[1:])
+        return (int(time[ :2]) * 3600000 +
+                int(time[3:5]) *   60000 +
+                int(time[6:8]) *    1000 +
+                int(time[9: ]))
 
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
-        coefficient = (-1 if time.startswith("-") else 1)
-        time = (time[1:] if time.startswith("-") else time)
-        return coefficient * sum((float(time[ :2]) * 3600,
-                                  float(time[3:5]) * 60,
-                                  float(time[6:8]),
-                                  float(time[9: ]) / 1000))
+        return self.time_to_ms(time) / 1000
 
     def to_frame(self, pos):
         """Convert `pos` to frame."""
@@ -228,6 +268,17 @@ class Calculator:
         raise ValueError("Invalid type for pos: {}"
                          .format(repr(type(pos))))
 
+    def to_ms(self, pos):
+        """Convert `pos` to milliseconds."""
+        if aeidon.is_time(pos):
+            return self.time_to_ms(pos)
+        if aeidon.is_frame(pos):
+            return self.frame_to_ms(pos)
+        if aeidon.is_seconds(pos):
+            return self.seconds_to_ms(pos)
+        raise ValueError("Invalid type for pos: {}"
+                         .format(repr(type(pos))))
+
     def to_seconds(self, pos):
         """Convert `pos` to seconds."""
         if aeidon.is_time(pos):
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Changes to subtitles accumulated to be emitted as signals at once."""
+
+import aeidon
+import bisect
+
+__all__ = ("ChangeBatch",)
+
+
+class ChangeBatch:
+
+    """
+    Changes to subtitles accumulated to be emitted as signals at once.
+
+    :cvar signals: Tuple of signals accumulated, in order of emission
+
+    Any amount of signals can be added to a batch, which merges them so that
+    each signal is emitted at most once, and in a way that the indices in all
+    signals correspond to the state of the subtitles after all changes.
+    Removed subtitles are given as indices before any changes, followed by
+    possible moves of the remaining subtitles as an order, i.e. a list of
+    old indices at new indices, after which inserted subtitles are given as
+    indices after all changes. Indices of changed subtitles are shifted to
+    follow insertions, moves and removals and dropped if the subtitle is
+    removed. All indices except the order of moves are given as a sorted list
+    of :class:`range` objects of consecutive indices, as returned by
+    :func:`aeidon.util.get_index_ranges`, which keeps signals small even if
+    all subtitles changed.
+    """
+
+    signals = (
+        "subtitles-removed",
+        "subtitles-moved",
+        "subtitles-inserted",
+        "positions-changed",
+        "main-texts-changed",
+        "translation-texts-changed",
+        "subtitles-changed",
+    )
+
+    def __init__(self, count):
+        """
+        Initialize a :class:`ChangeBatch` instance.
+
+        `count` should be the amount of subtitles before any changes.
+        """
+        self._changed = {x: set() for x in self.signals[3:]}
+        self._count = count
+        self._notify_queue = []
+        self._rows = None
+
+    def add(self, signal, *args):
+        """Add emission of `signal` with `args` to batch."""
+        if signal.startswith("notify::"):
+            # Notify signals are emitted after others,
+            # once each with the value at the time of emission.
+            if not signal in self._notify_queue:
+                self._notify_queue.append(signal)
+            return
+        indices = args[0]
+        if signal == "subtitles-inserted":
+            return self._insert(indices)
+        if signal == "subtitles-moved":
+            return self._move(indices)
+        if signal == "subtitles-removed":
+            return self._remove(indices)
+        self._changed[signal].update(indices)
+
+    def get_notify_signals(self):
+        """Return a list of notify signals added."""
+        return list(self._notify_queue)
+
+    def get_signals(self):
+        """Return a list of signals and lists of ranges of indices."""
+        signals = []
+        if self._rows is not None:
+            rows = self._rows
+            inserted = []
+            if None in rows:
+                inserted = [i for i, x in enumerate(rows) if x is None]
+                rows = [x for x in rows if x is not None]
+            removed = []
+            order = rows
+            if len(rows) < self._count:
+                kept = set(rows)
+                removed = [x for x in range(self._count) if not x in kept]
+                # Give moves in terms of the remaining subtitles,
+                # i.e. after removals and before insertions.
+                if rows != sorted(rows):
+                    order = [x - bisect.bisect_left(removed, x) for x in rows]
+                else:
+                    order = list(range(len(rows)))
+            if removed:
+                ranges = aeidon.util.get_index_ranges(removed)
+                signals.append(("subtitles-removed", ranges))
+            if order != list(range(len(order))):
+                signals.append(("subtitles-moved", list(order)))
+            if inserted:
+                ranges = aeidon.util.get_index_ranges(inserted)
+                signals.append(("subtitles-inserted", ranges))
+        for signal in self.signals[3:]:
+            if self._changed[signal]:
+                ranges = aeidon.util.get_index_ranges(self._changed[signal])
+                signals.append((signal, ranges))
+        return signals
+
+    def _init_rows(self):
+        """Initialize map of current rows to original rows."""
+        if self._rows is not None: return
+        self._rows = list(range(self._count))
+
+    def _insert(self, indices):
+        """Add insertion of subtitles at `indices`."""
+        self._init_rows()
+        indices = sorted(set(indices))
+        for index in indices:
+            self._rows.insert(index, None)
+        for signal, changed in self._changed.items():
+            # Inserting in ascending order shifts all indices
+            # at or after the point of insertion by one.
+            shifted = []
+            i = 0
+            for index in sorted(changed):
+                while i < len(indices) and indices[i] <= index + i:
+                    i += 1
+                shifted.append(index + i)
+            self._changed[signal] = set(shifted)
+
+    def _move(self, order):
+        """Add moving of subtitles to `order`."""
+        self._init_rows()
+        self._rows = list(map(self._rows.__getitem__, order))
+        if not any(self._changed.values()): return
+        new_indices = [0] * len(order)
+        for new_index, index in enumerate(order):
+            new_indices[index] = new_index
+        for signal, changed in self._changed.items():
+            self._changed[signal] = set(new_indices[x] for x in changed)
+
+    def _remove(self, indices):
+        """Add removal of subtitles at `indices`."""
+        self._init_rows()
+        indices = sorted(set(indices))
+        for index in reversed(indices):
+            del self._rows[index]
+        removed = set(indices)
+        for signal, changed in self._changed.items():
+            self._changed[signal] = set(
+                x - bisect.bisect_left(indices, x)
+                for x in changed if not x in removed)
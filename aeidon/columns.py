@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Vectorized arithmetic on columns of integer positions.
+
+Columns are sequences of integer positions, milliseconds or frames, e.g.
+as returned by :meth:`aeidon.Project.get_position_arrays`. If :mod:`numpy`
+is available, columns are processed as NumPy arrays, otherwise with plain
+Python loops. Either way, results are returned as :class:`array.array`
+instances of type ``"q"``, which are compact enough to be kept in the
+undo and redo stacks.
+"""
+
+import aeidon
+import array
+
+
+def _from_numpy(values):
+    """Return NumPy array `values` rounded to an :class:`array.array`."""
+    import numpy
+    values = numpy.rint(values).astype(numpy.int64)
+    return array.array("q", values.tobytes())
+
+def _to_numpy(column):
+    """Return `column` as a NumPy array of floats."""
+    import numpy
+    return numpy.asarray(column, dtype=numpy.float64)
+
+def adjust_durations(starts, ends, limits, lengths, speed=None,
+                     lengthen=False, shorten=False, minimum=None,
+                     maximum=None, gap=None):
+
+    """
+    Return `ends` adjusted to match given duration constraints.
+
+    `starts`, `ends` and `limits` should be columns of milliseconds, `limits`
+    being the latest allowed end positions, i.e. start positions of next
+    subtitles. `lengths` should be the amounts of characters in texts. `speed`
+    is reading speed in characters per second and `minimum`, `maximum` and
+    `gap` are milliseconds. See :meth:`aeidon.Project.adjust_durations`
+    for an explanation of the arguments.
+    """
+    if aeidon.util.numpy_available():
+        import numpy
+        starts = _to_numpy(starts)
+        ends = _to_numpy(ends)
+        if speed is not None:
+            optimal = _to_numpy(lengths) * 1000 / speed
+            durations = ends - starts
+            adjust = numpy.zeros(len(starts), dtype=bool)
+            if lengthen: adjust |= durations < optimal
+            if shorten: adjust |= durations > optimal
+            ends = numpy.where(adjust, starts + optimal, ends)
+        if minimum:
+            ends = numpy.where(ends - starts < minimum, starts + minimum, ends)
+        if maximum:
+            ends = numpy.where(ends - starts > maximum, starts + maximum, ends)
+        if gap is not None:
+            limits = _to_numpy(limits)
+            ends = numpy.where(limits - ends < gap,
+                               numpy.maximum(starts, limits - gap),
+                               ends)
+
+        return _from_numpy(ends)
+    new_ends = array.array("q")
+    for start, end, limit, length in zip(starts, ends, limits, lengths):
+        if speed is not None:
+            optimal = length * 1000 / speed
+            dol = lengthen and end - start < optimal
+            dos = shorten  and end - start > optimal
+            end = start + optimal if dol or dos else end
+        end = start + minimum if minimum and end - start < minimum else end
+        end = start + maximum if maximum and end - start > maximum else end
+        dogap = gap is not None and limit - end < gap
+        end = max(start, limit - gap) if dogap else end
+        new_ends.append(int(round(end)))
+    return new_ends
+
+def scale(column, coefficient, constant=0):
+    """Return `column` multiplied by `coefficient` with `constant` added."""
+    if aeidon.util.numpy_available():
+        import numpy
+        values = numpy.rint(_to_numpy(column) * coefficient)
+        return _from_numpy(values + constant)
+    return array.array("q", [int(round(x * coefficient)) + constant
+                             for x in column])
+
+def shift(column, value):
+    """Return `column` with integer `value` added."""
+    if aeidon.util.numpy_available():
+        return _from_numpy(_to_numpy(column) + value)
+    return array.array("q", [x + value for x in column])
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Correcting texts of subtitles apart from the project they belong to.
+
+Text corrections need nothing but the texts of one document and the markup
+of its file format. A :class:`TextSnapshot` holds only those, which makes it
+cheap to pass to a worker process, where :func:`correct_texts` can apply
+corrections to it and return only the texts that changed.
+"""
+
+import aeidon
+
+__all__ = ("TextSnapshot", "correct_texts")
+
+
+class TextSnapshot:
+
+    """
+    Texts of one document of a project without other subtitle data.
+
+    :ivar doc: Name of the :attr:`aeidon.documents` item of texts
+    :ivar format: Name of the :attr:`aeidon.formats` item or ``None``
+    :ivar texts: List of texts of all subtitles
+    """
+
+    def __init__(self, project, doc):
+        """Initialize a :class:`TextSnapshot` instance."""
+        format = project.get_format(doc)
+        self.doc = doc.name
+        self.format = (format.name if format is not None else None)
+        if isinstance(project.subtitles, aeidon.SubtitleStore):
+            self.texts = project.subtitles.get_texts(doc)
+        else:
+            self.texts = [x.get_text(doc) for x in project.subtitles]
+
+    def new_project(self):
+        """Return a new project with subtitles of snapshot texts."""
+        doc = getattr(aeidon.documents, self.doc)
+        project = aeidon.Project()
+        if self.format is not None:
+            # Markup is determined by the format of the main file,
+            # also for the translation document if no such file.
+            format = getattr(aeidon.formats, self.format)
+            project.main_file = aeidon.files.new(format, "", "utf_8")
+        blank = aeidon.Subtitle()
+        subtitles = []
+        for text in self.texts:
+            subtitle = blank.copy()
+            subtitle.set_text(doc, text)
+            subtitles.append(subtitle)
+        project.subtitles = subtitles
+        return project
+
+
+def correct_texts(snapshot, indices, corrections):
+    """
+    Apply `corrections` to texts of `snapshot` and return changes.
+
+    `indices` can be ``None`` to correct all subtitles. `corrections` should
+    be a sequence of tuples of the name of a text correcting method of
+    :class:`aeidon.Project` and a dictionary of keyword arguments to it other
+    than `indices` and `doc`. Return a list of tuples of index, original text
+    and corrected text of the subtitles whose text changed. Subtitles removed
+    by a correction, e.g. as left blank, are returned with their last text
+    and excluded from subsequent corrections.
+    """
+    doc = getattr(aeidon.documents, snapshot.doc)
+    project = snapshot.new_project()
+    subtitles = list(project.subtitles)
+    targets = indices
+    for name, kwargs in corrections:
+        getattr(project, name)(indices, doc, **kwargs)
+        if targets is None: continue
+        if len(project.subtitles) == len(subtitles): continue
+        # Translate indices to follow removals of subtitles.
+        current = {id(x): i for i, x in enumerate(project.subtitles)}
+        indices = [current[id(subtitles[i])] for i in targets
+                   if id(subtitles[i]) in current]
+        if not indices: break
+    changes = []
+    for i, orig in enumerate(snapshot.texts):
+        new = subtitles[i].get_text(doc)
+        if new == orig: continue
+        changes.append((i, orig, new))
+    return changes
@@ -18,7 +18,6 @@
 """Names and ISO 3166 codes for countries and conversions between them."""
 
 import aeidon
-import os
 
 from aeidon.i18n import d_
 
@@ -27,17 +26,7 @@ _countries = {}
 
 def _init_countries():
     """Initialize the dictionary mapping codes to names."""
-    import xml.etree.ElementTree as ET
-    path = "/usr/share/xml/iso-codes/iso_3166.xml"
-    if not os.path.isfile(path):
-        # Prefer files part of the iso-codes installation,
-        # use bundled copy as fallback.
-        path = os.path.join(aeidon.DATA_DIR, "iso-codes", "iso_3166.xml")
-    for element in ET.parse(path).findall("iso_3166_entry"):
-        code = element.get("alpha_2_code", None)
-        name = element.get("name", None)
-        if not code or not name: continue
-        _countries[code] = name
+    _countries.update(aeidon.util.read_iso_codes("iso_3166", "alpha_2_code"))
 
 def code_to_name(code):
     """Convert ISO 3166 `code` to localized country name."""
@@ -185,10 +185,13 @@ def revertable(function):
             # Execute plain function for nested function calls
             # that are part of another revertable action.
             return function(*args, **kwargs)
+        # Emit signals of changes once for the whole action.
+        frozen = project.freeze_changes()
         try:
             value = function(*args, **kwargs)
         finally:
             project.unblock(register.signal)
+            project.thaw_changes(frozen)
         project.cut_reversion_stacks()
         if (project.main_changed != main_changed or
             project.tran_changed != tran_changed):
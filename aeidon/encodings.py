@@ -23,6 +23,7 @@ For functions dealing with character encodings, see also :mod:`aeidon.util`.
 
 import aeidon
 import codecs
+import io
 import locale
 import re
 
@@ -174,13 +175,30 @@ def detect(path):
     bom_encoding = detect_bom(path)
     if bom_encoding is not None:
         return bom_encoding
+    with open(path, "rb") as f:
+        return _detect_lines(f)
+
+def detect_bom(path):
+    """Return corresponding encoding if BOM found, else ``None``."""
+    with open(path, "rb") as f:
+        line = f.readline()
+    return get_bom_encoding(line)
+
+def detect_data(data):
+    """Detect the encoding of bytes `data` and return code or ``None``."""
+    bom_encoding = get_bom_encoding(data)
+    if bom_encoding is not None:
+        return bom_encoding
+    return _detect_lines(io.BytesIO(data))
+
+def _detect_lines(lines):
+    """Detect the encoding of bytes `lines` and return code or ``None``."""
     from chardet import universaldetector
     detector = universaldetector.UniversalDetector()
-    with open(path, "rb") as f:
-        detector.reset()
-        for line in f:
-            detector.feed(line)
-            if detector.done: break
+    detector.reset()
+    for line in lines:
+        detector.feed(line)
+        if detector.done: break
     detector.close()
     code = detector.result["encoding"]
     if code is None: return None
@@ -192,23 +210,21 @@ def detect(path):
     except ValueError:
         return None
 
-def detect_bom(path):
-    """Return corresponding encoding if BOM found, else ``None``."""
-    with open(path, "rb") as f:
-        line = f.readline()
-    if (line.startswith(codecs.BOM_UTF32_BE) and
+def get_bom_encoding(data):
+    """Return corresponding encoding if `data` starts with BOM, else ``None``."""
+    if (data.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
-    if (line.startswith(codecs.BOM_UTF32_LE) and
+    if (data.startswith(codecs.BOM_UTF32_LE) and
         is_valid_code("utf_32_le")):
         return "utf_32_le"
-    if (line.startswith(codecs.BOM_UTF8) and
+    if (data.startswith(codecs.BOM_UTF8) and
         is_valid_code("utf_8_sig")):
         return "utf_8_sig"
-    if (line.startswith(codecs.BOM_UTF16_BE) and
+    if (data.startswith(codecs.BOM_UTF16_BE) and
         is_valid_code("utf_16_be")):
         return "utf_16_be"
-    if (line.startswith(codecs.BOM_UTF16_LE) and
+    if (data.startswith(codecs.BOM_UTF16_LE) and
         is_valid_code("utf_16_le")):
         return "utf_16_le"
     return None
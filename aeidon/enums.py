@@ -41,9 +41,13 @@ class AlignMethodNumber(aeidon.EnumerationItem):
 class AlignMethodPosition(aeidon.EnumerationItem):
     label = _("Subtitle position")
 
+class AlignMethodOverlap(aeidon.EnumerationItem):
+    label = _("Subtitle overlap")
+
 align_methods = aeidon.Enumeration()
 align_methods.NUMBER = AlignMethodNumber()
 align_methods.POSITION = AlignMethodPosition()
+align_methods.OVERLAP = AlignMethodOverlap()
 
 
 class DocumentMain(aeidon.EnumerationItem): pass
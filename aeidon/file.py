@@ -19,8 +19,8 @@
 
 import aeidon
 import codecs
+import itertools
 import os
-import re
 
 __all__ = ("SubtitleFile",)
 
@@ -45,9 +45,11 @@ class SubtitleFile:
     """
     format = aeidon.formats.NONE
     mode = aeidon.modes.NONE
+    _write_chunk_size = 1000
 
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubtitleFile` instance."""
+        self._blank_subtitle = None
         self.encoding = encoding
         self.has_utf_16_bom = False
         self.header = (aeidon.util.get_template_header(self.format)
@@ -64,65 +66,136 @@ class SubtitleFile:
 
     def _get_subtitle(self):
         """Return a new subtitle instance with proper properties."""
-        return aeidon.Subtitle(self.mode)
+        # Copying a blank subtitle is cheaper than instantiating one,
+        # which matters when reading a file creates one per cue.
+        if self._blank_subtitle is None:
+            self._blank_subtitle = aeidon.Subtitle(self.mode)
+        return self._blank_subtitle.copy()
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
         """
-        Read file and return subtitles.
+        Yield blocks of text to write for `subtitles` with text from `doc`.
+
+        `subtitles` can be any iterable of subtitles, which are rendered one
+        by one as blocks of complete lines, preceded by any header. Blocks
+        are written to file in large chunks by :meth:`write_to_file`.
+        """
+        raise NotImplementedError
 
+    def _iter_lines(self, sniff=None):
+        """
+        Read file and yield lines.
+
+        All newlines are stripped.
+        All blank lines from beginning and end are skipped.
+        The file is read only once and line by line, updating
+        :attr:`encoding`, :attr:`has_utf_16_bom` and :attr:`newline`
+        according to what is found on the way. If `sniff` is given,
+        bytes already read by :func:`aeidon.sniff` are not read again.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        f = (sniff.open(self.encoding) if sniff is not None else
+             open(self.path, "r", encoding=self.encoding))
+        with f:
+            lines = self._iter_stripped_lines(f)
+            if self.encoding.startswith("utf_16"):
+                lines = self._iter_undoubled_lines(lines)
+            blanks = []
+            for line in lines:
+                if not line.strip():
+                    # Hold blank lines until we know they're not at the end.
+                    blanks.append(line)
+                    continue
+                yield from blanks
+                blanks = []
+                yield line
+            newline = aeidon.util.get_newline(f.newlines)
+            if newline is not None:
+                self.newline = newline
+
+    def _iter_stripped_lines(self, f):
+        """Yield lines from `f` without newlines and leading blank lines."""
+        lines = iter(f)
+        for line in lines:
+            line = line.rstrip("\n")
+            if self.encoding == "utf_8":
+                bom = str(codecs.BOM_UTF8, "utf_8")
+                if line.startswith(bom):
+                    # If a UTF-8 BOM (a.k.a. signature) is found, use UTF-8-SIG
+                    # encoding, which automatically strips the BOM when
+                    # reading and adds it when writing.
+                    self.encoding = "utf_8_sig"
+                    line = line[len(bom):]
+            if self.encoding.startswith("utf_16"):
+                # Python automatically strips the UTF-16 BOM when reading, but
+                # only when using UTF-16. If using UTF-16-BE or UTF-16-LE, the
+                # BOM is kept at the beginning of the first line. It is read
+                # correctly, so it should FE FF for both BE and LE.
+                bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
+                if line.startswith(bom):
+                    self.has_utf_16_bom = True
+                    line = line.replace(bom, "")
+            newline = aeidon.util.get_newline(f.newlines)
+            if newline is not None:
+                self.newline = newline
+            if line.strip():
+                yield line
+                break
+        for line in lines:
+            yield line.rstrip("\n")
+
+    def iter_subtitles(self, sniff=None):
+        """
+        Read file and yield subtitles.
+
+        The file is read line by line, only lines of the subtitle being
+        parsed are held in memory. Properties of the file, e.g.
+        :attr:`header` and :attr:`newline` are updated as they are found and
+        are final only once all subtitles have been read. `sniff` can be
+        a :class:`aeidon.SniffResult` to avoid reading bytes again.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         raise NotImplementedError
 
-    def _read_lines(self):
+    def _iter_undoubled_lines(self, lines):
+        """Yield `lines` skipping every other line if those are all blank."""
+        # Handle erroneous (?) UTF-16 encoded subtitles that use
+        # NULL-character filled linebreaks '\x00\r\x00\n', which
+        # are read as two separate linebreaks. To keep memory use bounded,
+        # decide based on the first thousand lines.
+        head = list(itertools.islice(lines, 1000))
+        if any(head[1::2]):
+            yield from head
+            yield from lines
+            return
+        yield from head[0::2]
+        for i, line in enumerate(lines, len(head)):
+            if i % 2 == 0:
+                yield line
+
+    def _join_lines(self, lines):
+        """Return `lines` joined, skipping leading empty lines."""
+        return "\n".join(itertools.dropwhile(lambda x: not x, lines))
+
+    def read(self, sniff=None):
         """
-        Read file to a list of lines.
+        Read file and return subtitles.
 
-        All newlines are stripped.
-        All blank lines from beginning and end are removed.
+        `sniff` can be a :class:`aeidon.SniffResult` to avoid reading
+        bytes again that were already read when sniffing.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
-        Return a list of lines read.
         """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
-        if newline is not None:
-            self.newline = newline
-        if self.encoding == "utf_8":
-            bom = str(codecs.BOM_UTF8, "utf_8")
-            if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
-                # UTF-8-SIG encoding, which automatically strips the BOM when
-                # reading and adds it when writing.
-                self.encoding = "utf_8_sig"
-                return SubtitleFile._read_lines(self)
-        if self.encoding.startswith("utf_16"):
-            # Python automatically strips the UTF-16 BOM when reading, but only
-            # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
-            # kept at the beginning of the first line. It is read correctly, so
-            # it should FE FF for both BE and LE.
-            bom = str(codecs.BOM_UTF16_BE, "utf_16_be")
-            if lines and lines[0].startswith(bom):
-                self.has_utf_16_bom = True
-                lines[0] = lines[0].replace(bom, "")
-            # Handle erroneous (?) UTF-16 encoded subtitles that use
-            # NULL-character filled linebreaks '\x00\r\x00\n', which
-            # readlines interprets as two separate linebreaks.
-            if not any(lines[i] for i in range(1, len(lines), 2)):
-                lines = [lines[i] for i in range(0, len(lines), 2)]
-        return lines
+        return list(self.iter_subtitles(sniff))
 
     def write(self, subtitles, doc):
         """
         Write `subtitles` with text from `doc` to file.
 
+        `subtitles` can be any iterable of subtitles, e.g. a generator
+        to write subtitles without holding them all in memory.
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
@@ -148,4 +221,8 @@ class SubtitleFile:
         Raise :exc:`IOError` if writing fails.
         Raise :exc:`UnicodeError` if encoding fails.
         """
-        raise NotImplementedError
+        blocks = self.iter_blocks(subtitles, doc)
+        while True:
+            chunk = list(itertools.islice(blocks, self._write_chunk_size))
+            if not chunk: break
+            f.write("".join(chunk))
@@ -39,16 +39,17 @@ class AdvSubStationAlpha(aeidon.files.SubStationAlpha):
             "Layer", "Start", "End", "Style", "Name",
             "MarginL", "MarginR", "MarginV", "Effect", "Text")
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save `value` of field as a subtitle attribute."""
+    def _get_field_decoder(self, field_name):
+        """Return a function to save string value of field from file."""
         if field_name == "Layer":
-            return setattr(subtitle.ssa, "layer", int(value))
-        decode = aeidon.files.SubStationAlpha._decode_field
-        return decode(self, field_name, value, subtitle)
+            return lambda subtitle, value: setattr(
+                subtitle.ssa, "layer", int(value))
+        get = aeidon.files.SubStationAlpha._get_field_decoder
+        return get(self, field_name)
 
-    def _encode_field(self, field_name, subtitle, doc):
-        """Return value of field as string to be written to file."""
+    def _get_field_encoder(self, field_name):
+        """Return a function to encode the value of field as string."""
         if field_name == "Layer":
-            return str(subtitle.ssa.layer)
-        encode = aeidon.files.SubStationAlpha._encode_field
-        return encode(self, field_name, subtitle, doc)
+            return lambda subtitle, ssa, doc: str(ssa.layer)
+        get = aeidon.files.SubStationAlpha._get_field_encoder
+        return get(self, field_name)
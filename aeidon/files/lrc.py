@@ -35,45 +35,48 @@ class LRC(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile("^\[(-?\d\d:\d\d.\d\d)\](.*)$")
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        if self.header.strip():
+            yield self.header.strip() + "\n\n"
+        calc = aeidon.Calculator()
+        ms_to_time = calc.ms_to_time
+        round_ms = calc.round_ms
+        for subtitle in subtitles:
+            start = ms_to_time(round_ms(subtitle.start_ms, 2))
+            sign = ("-" if start.startswith("-") else "")
+            first = (4 if start.startswith("-") else 3)
+            start = sign + start[first:-1]
+            text = subtitle.get_text(doc).replace("\n", " ")
+            yield "[{}]{}\n".format(start, text)
+
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        header = []
+        prev = None
+        for line in self._iter_lines(sniff):
             match = self._re_line.match(line)
-            if match is None and len(subtitles) == 1:
+            if match is None and prev is None:
                 # Read line into file header.
-                if self.header:
-                    self.header += "\n"
-                self.header += line
+                header.append(line)
+                self.header = self._join_lines(header)
             elif match is not None:
                 subtitle = self._get_subtitle()
                 normalize = subtitle.calc.normalize_time
                 subtitle.start_time = normalize(match.group(1))
-                subtitles[-1].end_time = subtitle.start_time
                 subtitle.main_text = match.group(2) or ""
-                subtitles.append(subtitle)
-        subtitles[-1].duration_seconds = 5
-        return subtitles[1:]
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        if self.header.strip():
-            f.write(self.header.strip() + "\n\n")
-        for subtitle in subtitles:
-            start = subtitle.calc.round(subtitle.start_time, 2)
-            sign = ("-" if start.startswith("-") else "")
-            first = (4 if start.startswith("-") else 3)
-            start = sign + start[first:-1]
-            text = subtitle.get_text(doc).replace("\n", " ")
-            f.write("[{}]{}\n".format(start, text))
+                # Each subtitle ends when the next one starts,
+                # so only yield once the next one is found.
+                if prev is not None:
+                    prev.end_time = subtitle.start_time
+                    yield prev
+                prev = subtitle
+        if prev is not None:
+            prev.duration_seconds = 5
+            yield prev
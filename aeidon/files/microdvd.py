@@ -31,38 +31,29 @@ class MicroDVD(aeidon.SubtitleFile):
     mode = aeidon.modes.FRAME
     _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        if self.header.strip():
+            yield self.header + "\n"
+        template = "{{{:d}}}{{{:d}}}{}\n".format
+        for subtitle in subtitles:
+            text = subtitle.get_text(doc).replace("\n", "|")
+            yield template(subtitle.start_frame, subtitle.end_frame, text)
+
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines(sniff):
             match = self._re_line.match(line)
             if match is not None:
                 subtitle = self._get_subtitle()
                 subtitle.start_frame = int(match.group(1))
                 subtitle.end_frame = int(match.group(2))
                 subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
+                yield subtitle
             elif line.startswith("{DEFAULT}"):
                 self.header = line
-        return subtitles
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        if self.header.strip():
-            f.write(self.header + "\n")
-        for subtitle in subtitles:
-            text = subtitle.get_text(doc).replace("\n", "|")
-            f.write(("{{{:d}}}{{{:d}}}{}\n"
-                     .format(subtitle.start_frame,
-                             subtitle.end_frame,
-                             text)))
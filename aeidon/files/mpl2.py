@@ -31,34 +31,27 @@ class MPL2(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*?)$")
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        template = "[{:.0f}][{:.0f}]{}\n".format
+        for subtitle in subtitles:
+            text = subtitle.get_text(doc).replace("\n", "|")
+            yield template(subtitle.start_seconds*10,
+                           subtitle.end_seconds*10,
+                           text)
+
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines(sniff):
             match = self._re_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_seconds = float(match.group(1)) / 10
             subtitle.end_seconds = float(match.group(2)) / 10
             subtitle.main_text = match.group(3).replace("|", "\n")
-            subtitles.append(subtitle)
-        return subtitles
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        for subtitle in subtitles:
-            text = subtitle.get_text(doc).replace("\n", "|")
-            f.write(("[{:.0f}][{:.0f}]{}\n"
-                     .format(subtitle.start_seconds*10,
-                             subtitle.end_seconds*10,
-                             text)))
+            yield subtitle
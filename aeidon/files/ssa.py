@@ -34,9 +34,9 @@ class SubStationAlpha(aeidon.SubtitleFile):
     format = aeidon.formats.SSA
     mode = aeidon.modes.TIME
 
+    _calc = aeidon.Calculator()
     _re_file_time = re.compile(r"^(-?)(.+)$")
     _re_separator = re.compile(r",\s*")
-    _re_subtitle_time = re.compile(r"(-?)\d(.{10})\d")
 
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubStationAlpha` instance."""
@@ -51,95 +51,115 @@ class SubStationAlpha(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.event_fields = tuple(other.event_fields)
 
-    def _decode_field(self, field_name, value, subtitle):
-        """Save string `value` from file as a subtitle attribute."""
+    def _decode_text(self, value):
+        """Return text `value` from file with newlines decoded."""
+        return value.replace("\\n", "\n").replace("\\N", "\n")
+
+    def _decode_time(self, value):
+        """Return time string `value` from file in standard format."""
+        return self._re_file_time.sub(r"\1\060\2\060", value)
+
+    def _encode_time(self, ms):
+        """Return `ms` milliseconds as time string to be written to file."""
+        time = self._calc.ms_to_time(self._calc.round_ms(ms, 2))
+        # Drop the first digit of hours and the last of milliseconds.
+        sign = ("-" if time.startswith("-") else "")
+        return sign + time[len(sign)+1:-1]
+
+    def _get_field_decoder(self, field_name):
+        """
+        Return a function to save string value of field from file.
+
+        The returned function should be called with two arguments:
+        subtitle and value. Decoders are looked up once per read,
+        not per value.
+        """
         if field_name == "Marked":
-            value = int(value.split("=")[-1])
-            return setattr(subtitle.ssa, "marked", value)
+            return lambda subtitle, value: setattr(
+                subtitle.ssa, "marked", int(value.split("=")[-1]))
         if field_name == "Start":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "start_time", value)
+            return lambda subtitle, value: setattr(
+                subtitle, "start_time", self._decode_time(value))
         if field_name == "End":
-            value = self._re_file_time.sub(r"\1\060\2\060", value)
-            return setattr(subtitle, "end_time", value)
+            return lambda subtitle, value: setattr(
+                subtitle, "end_time", self._decode_time(value))
         if field_name == "Text":
-            value = value.replace("\\n", "\n")
-            value = value.replace("\\N", "\n")
-            return setattr(subtitle, "main_text", value)
+            return lambda subtitle, value: setattr(
+                subtitle, "main_text", self._decode_text(value))
+        name = aeidon.util.title_to_lower_case(field_name)
         if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            return setattr(subtitle.ssa, name, int(value))
+            return lambda subtitle, value: setattr(
+                subtitle.ssa, name, int(value))
         # Set plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        setattr(subtitle.ssa, name, value)
+        return lambda subtitle, value: setattr(subtitle.ssa, name, value)
+
+    def _get_field_encoder(self, field_name):
+        """
+        Return a function to encode the value of field as string.
 
-    def _encode_field(self, field_name, subtitle, doc):
-        """Return value of field as string to be written to file."""
+        The returned function should be called with three arguments:
+        subtitle, its :class:`aeidon.containers.SubStationAlpha` container
+        and document. Encoders are looked up once per write, not per value.
+        """
         if field_name == "Marked":
-            return "Marked={:d}".format(subtitle.ssa.marked)
+            return lambda subtitle, ssa, doc: "Marked={:d}".format(ssa.marked)
         if field_name == "Start":
-            value = subtitle.calc.round(subtitle.start_time, 2)
-            return self._re_subtitle_time.sub(r"\1\2", value)
+            return lambda subtitle, ssa, doc: self._encode_time(
+                subtitle.start_ms)
         if field_name == "End":
-            value = subtitle.calc.round(subtitle.end_time, 2)
-            return self._re_subtitle_time.sub(r"\1\2", value)
+            return lambda subtitle, ssa, doc: self._encode_time(
+                subtitle.end_ms)
         if field_name == "Text":
-            value = subtitle.get_text(doc)
-            return value.replace("\n", "\\N")
+            return lambda subtitle, ssa, doc: (
+                subtitle.get_text(doc).replace("\n", "\\N"))
+        name = aeidon.util.title_to_lower_case(field_name)
         if field_name in ("MarginL", "MarginR", "MarginV"):
-            name = aeidon.util.title_to_lower_case(field_name)
-            return "{:04d}".format(getattr(subtitle.ssa, name))
+            return lambda subtitle, ssa, doc: (
+                "{:04d}".format(getattr(ssa, name)))
         # Return plain string container attribute value.
-        name = aeidon.util.title_to_lower_case(field_name)
-        return getattr(subtitle.ssa, name)
+        return lambda subtitle, ssa, doc: getattr(ssa, name)
+
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        yield self.header + "\n\n"
+        yield "[Events]\n"
+        yield "Format: {}\n".format(", ".join(self.event_fields))
+        encoders = list(map(self._get_field_encoder, self.event_fields))
+        defaults = aeidon.containers.SubStationAlpha()
+        for subtitle in subtitles:
+            # Read defaults from a shared container rather than
+            # instantiate containers for subtitles that have none.
+            ssa = (subtitle.ssa if subtitle.has_container("ssa") else defaults)
+            yield "Dialogue: {}\n".format(",".join(
+                encode(subtitle, ssa, doc) for encode in encoders))
 
-    def read(self):
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        lines = self._read_lines()
-        self._read_header(lines)
+        header = []
+        fields = self.event_fields
+        decoders = list(map(self._get_field_decoder, fields))
+        max_split = len(fields) - 1
+        lines = self._iter_lines(sniff)
         for line in lines:
-            if not line.startswith("Format:"): continue
-            line = line.replace("Format:", "").strip()
-            fields = self._re_separator.split(line)
-            indices = dict((x, fields.index(x)) for x in fields)
-            max_split = len(fields) - 1
+            if line.startswith("[Events]"): break
+            header.append(line)
+        self.header = "\n".join(header).strip()
         for line in lines:
+            if line.startswith("Format:"):
+                line = line.replace("Format:", "").strip()
+                fields = self._re_separator.split(line)
+                decoders = list(map(self._get_field_decoder, fields))
+                max_split = len(fields) - 1
+                self.event_fields = tuple(fields)
             if not line.startswith("Dialogue:"): continue
             line = line.replace("Dialogue:", "").lstrip()
             values = self._re_separator.split(line, max_split)
             subtitle = self._get_subtitle()
-            for name, index in indices.items():
-                self._decode_field(name, values[index], subtitle)
-            subtitles.append(subtitle)
-        self.event_fields = tuple(fields)
-        return subtitles
-
-    def _read_header(self, lines):
-        """Read header and remove its lines."""
-        self.header = ""
-        while not lines[0].startswith("[Events]"):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.strip()
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        f.write(self.header + "\n\n")
-        f.write("[Events]\n")
-        fields = ", ".join(self.event_fields)
-        f.write("Format: {}\n".format(fields))
-        for subtitle in subtitles:
-            f.write("Dialogue: {}\n".format(",".join([
-                self._encode_field(x, subtitle, doc)
-                for x in self.event_fields])))
+            for decode, value in zip(decoders, values):
+                decode(subtitle, value)
+            yield subtitle
@@ -39,21 +39,51 @@ class SubRip(aeidon.SubtitleFile):
             r" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
             r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?\s*$"))
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        ms_to_time = aeidon.Calculator().ms_to_time
+        template = "{:d}\n{} --> {}{}\n{}\n".format
+        for i, subtitle in enumerate(subtitles):
+            start = ms_to_time(subtitle.start_ms).replace(".", ",")
+            end = ms_to_time(subtitle.end_ms).replace(".", ",")
+            coordinates = ""
+            # Write Extended SubRip coordinates only if the container
+            # has been initialized and the coordinates make some sense.
+            if subtitle.has_container("subrip"):
+                x1 = subtitle.subrip.x1
+                x2 = subtitle.subrip.x2
+                y1 = subtitle.subrip.y1
+                y2 = subtitle.subrip.y2
+                if not x1 == x2 == y1 == y2 == 0:
+                    coordinates = ("  X1:{:03d} X2:{:03d} Y1:{:03d} Y2:{:03d}"
+                                   .format(x1, x2, y1, y2))
+            text = subtitle.get_text(doc)
+            block = template(i+1, start, end, coordinates, text)
+            yield (block if i == 0 else "\n" + block)
+
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        lines = []
+        subtitle = None
+        for line in self._iter_lines(sniff):
             match = self._re_time_line.match(line)
             if match is None:
-                if subtitles[-1].main_text:
-                    subtitles[-1].main_text += "\n"
-                subtitles[-1].main_text += line
+                lines.append(line)
                 continue
+            # Remove numbers and blank lines above them.
+            if lines and lines[-1].strip().isdigit():
+                lines.pop()
+                if lines and not lines[-1].strip():
+                    lines.pop()
+            if subtitle is not None:
+                subtitle.main_text = self._join_lines(lines)
+                yield subtitle
+            lines = []
             subtitle = self._get_subtitle()
             subtitle.start_time = subtitle.calc.normalize_time(match.group(1))
             subtitle.end_time = subtitle.calc.normalize_time(match.group(2))
@@ -62,44 +92,6 @@ class SubRip(aeidon.SubtitleFile):
                 subtitle.subrip.x2 = int(match.group(5))
                 subtitle.subrip.y1 = int(match.group(6))
                 subtitle.subrip.y2 = int(match.group(7))
-            subtitles.append(subtitle)
-        return subtitles
-
-    def _read_lines(self):
-        """Read file to a unicoded list of lines."""
-        lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
-            lines.append(line)
-            match = self._re_time_line.match(line)
-            if match is None: continue
-            # Remove numbers and blank lines above them.
-            if lines[-2].strip().isdigit():
-                if not lines[-3].strip():
-                    lines.pop(-3)
-                lines.pop(-2)
-        return lines
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        for i, subtitle in enumerate(subtitles):
-            if i > 0: f.write("\n")
-            f.write("{:d}\n".format(i+1))
-            start = subtitle.start_time.replace(".", ",")
-            end = subtitle.end_time.replace(".", ",")
-            f.write("{} --> {}".format(start, end))
-            # Write Extended SubRip coordinates only if the container
-            # has been initialized and the coordinates make some sense.
-            if subtitle.has_container("subrip"):
-                x1 = subtitle.subrip.x1
-                x2 = subtitle.subrip.x2
-                y1 = subtitle.subrip.y1
-                y2 = subtitle.subrip.y2
-                if not x1 == x2 == y1 == y2 == 0:
-                    f.write("  X1:{:03d} X2:{:03d}".format(x1, x2))
-                    f.write( " Y1:{:03d} Y2:{:03d}".format(y1, y2))
-            f.write("\n{}\n".format(subtitle.get_text(doc)))
+        if subtitle is not None:
+            subtitle.main_text = self._join_lines(lines)
+            yield subtitle
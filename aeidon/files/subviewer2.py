@@ -18,6 +18,7 @@
 """SubViewer 2.0 file."""
 
 import aeidon
+import itertools
 import re
 
 __all__ = ("SubViewer2",)
@@ -32,41 +33,46 @@ class SubViewer2(aeidon.SubtitleFile):
     _re_time_line = re.compile((r"^(-?\d\d:\d\d:\d\d.\d\d)"
                                 r",(-?\d\d:\d\d:\d\d.\d\d)\s*$"))
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        yield self.header + "\n"
+        calc = aeidon.Calculator()
+        ms_to_time = calc.ms_to_time
+        round_ms = calc.round_ms
+        template = "\n{},{}\n{}\n".format
+        for subtitle in subtitles:
+            start = ms_to_time(round_ms(subtitle.start_ms, 2))[:-1]
+            end = ms_to_time(round_ms(subtitle.end_ms, 2))[:-1]
+            text = subtitle.get_text(doc).replace("\n", "[br]")
+            yield template(start, end, text)
+
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = []
-        lines = self._read_lines()
-        while lines[0].startswith("["):
-            self.header += "\n"
-            self.header += lines.pop(0)
-        self.header = self.header.lstrip()
-        for i, line in enumerate(lines + [""]):
+        header = []
+        subtitle = None
+        lines = self._iter_lines(sniff)
+        for line in lines:
+            if not line.startswith("["):
+                lines = itertools.chain((line,), lines)
+                break
+            header.append(line)
+        self.header = "\n".join(header)
+        for line in lines:
+            if subtitle is not None:
+                # Text is the line following the time line.
+                subtitle.main_text = line.replace("[br]", "\n")
+                yield subtitle
+                subtitle = None
             match = self._re_time_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_time = match.group(1) + "0"
             subtitle.end_time = match.group(2) + "0"
-            text = lines[i+1].replace("[br]", "\n")
-            subtitle.main_text = text
-            subtitles.append(subtitle)
-        return subtitles
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        f.write(self.header + "\n")
-        for subtitle in subtitles:
-            start = subtitle.calc.round(subtitle.start_time, 2)[:-1]
-            end = subtitle.calc.round(subtitle.end_time, 2)[:-1]
-            text = subtitle.get_text(doc).replace("\n", "[br]")
-            f.write("\n{},{}\n{}\n".format(start, end, text))
+        if subtitle is not None:
+            yield subtitle
@@ -35,3 +35,24 @@ class TestSubStationAlpha(aeidon.TestCase):
         self.file.write(self.file.read(), aeidon.documents.MAIN)
         text = open(self.file.path, "r").read().strip()
         assert text == self.get_sample_text(self.format)
+
+    def test_write__containers(self):
+        subtitle = aeidon.Subtitle()
+        subtitle.start_time = "-00:00:01.234"
+        subtitle.main_text = "test\ntest"
+        self.file.write([subtitle], aeidon.documents.MAIN)
+        assert not subtitle.has_container("ssa")
+        line = open(self.file.path, "r").read().strip().split("\n")[-1]
+        assert line.split(",")[1] == "-0:00:01.23"
+        assert line.split(",")[3] == "Default"
+        assert line.endswith("test\\Ntest")
+
+    def test_write__round(self):
+        subtitles = [aeidon.Subtitle(), aeidon.Subtitle()]
+        subtitles[0].start_time = "00:00:04.635"
+        subtitles[1].start_time = "00:00:14.445"
+        self.file.write(subtitles, aeidon.documents.MAIN)
+        lines = open(self.file.path, "r").read().strip().split("\n")[-2:]
+        assert lines[0].split(",")[1] == "0:00:04.64"
+        assert lines[1].split(",")[1] == "0:00:14.45"
+
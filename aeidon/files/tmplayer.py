@@ -43,15 +43,31 @@ class TMPlayer(aeidon.SubtitleFile):
         if self.format != other.format: return
         self.two_digit_hour = other.two_digit_hour
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
+        """Yield blocks of text to write for `subtitles` from `doc`."""
+        calc = aeidon.Calculator()
+        ms_to_time = calc.ms_to_time
+        round_ms = calc.round_ms
+        for subtitle in subtitles:
+            start = ms_to_time(round_ms(subtitle.start_ms, 0))
+            start = (start[:-4] if self.two_digit_hour
+                     else ("-" + start[2:-4]
+                           if start.startswith("-")
+                           else start[1:-4]))
+
+            text = subtitle.get_text(doc).replace("\n", "|")
+            yield "{}:{}\n".format(start, text)
+
+    def iter_subtitles(self, sniff=None):
         """
-        Read file and return subtitles.
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        prev = None
+        for line in self._iter_lines(sniff):
+            subtitle = None
             match = self._re_one_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
@@ -60,37 +76,23 @@ class TMPlayer(aeidon.SubtitleFile):
                 time = line[:i-1] + ".000"
                 if time.startswith("-"):
                     time = time[1:]
-                time = sign + "0" + time
-                subtitle.start_time = time
-                subtitles[-1].end_time = time
+                subtitle.start_time = sign + "0" + time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
                 self.two_digit_hour = False
             match = self._re_two_digit_hour.search(line)
             if match is not None:
                 i = match.span()[1]
                 subtitle = self._get_subtitle()
                 subtitle.start_time = line[:i-1] + ".000"
-                subtitles[-1].end_time = subtitle.start_time
                 subtitle.main_text = line[i:].replace("|", "\n")
-                subtitles.append(subtitle)
                 self.two_digit_hour = True
-        subtitles[-1].duration_seconds = 5
-        return subtitles[1:]
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        for subtitle in subtitles:
-            start = subtitle.calc.round(subtitle.start_time, 0)
-            start = (start[:-4] if self.two_digit_hour
-                     else ("-" + start[2:-4]
-                           if start.startswith("-")
-                           else start[1:-4]))
-
-            text = subtitle.get_text(doc).replace("\n", "|")
-            f.write("{}:{}\n".format(start, text))
+            if subtitle is None: continue
+            # Each subtitle ends when the next one starts,
+            # so only yield once the next one is found.
+            if prev is not None:
+                prev.end_time = subtitle.start_time
+                yield prev
+            prev = subtitle
+        if prev is not None:
+            prev.duration_seconds = 5
+            yield prev
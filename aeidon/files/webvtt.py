@@ -45,32 +45,67 @@ class WebVTT(aeidon.SubtitleFile):
             r" (-?(?:\d{1,2}:)?\d{1,2}:\d{1,2}\.\d{1,3})"
             r"(\s+.+)?\s*$"))
 
-    def read(self):
+    def iter_blocks(self, subtitles, doc):
         """
-        Read file and return subtitles.
+        Yield blocks of text to write for `subtitles` from `doc`.
+
+        `subtitles` are gathered in a list before yielding anything,
+        since the time format used depends on the last subtitle.
+        """
+        subtitles = list(subtitles)
+        yield (self.header.strip() or "WEBVTT") + "\n"
+        # Write times as MM:SS.SSS if all times are less
+        # than an hour, else the usual HH:MM:SS.SSS.
+        first = (3 if subtitles and subtitles[-1].end_seconds < 3600 else 0)
+        ms_to_time = aeidon.Calculator().ms_to_time
+        defaults = aeidon.containers.WebVTT()
+        for subtitle in subtitles:
+            webvtt = (subtitle.webvtt
+                      if subtitle.has_container("webvtt")
+                      else defaults)
+            lines = []
+            if webvtt.style:
+                lines.append("\n{}\n".format(webvtt.style))
+            if webvtt.comment:
+                lines.append("\n{}\n".format(webvtt.comment))
+            lines.append("\n")
+            if webvtt.id:
+                lines.append("{}\n".format(webvtt.id))
+            start = ms_to_time(subtitle.start_ms)[first:]
+            end = ms_to_time(subtitle.end_ms)[first:]
+            lines.append("{} --> {}".format(start, end))
+            if webvtt.settings:
+                lines.append(" {}".format(webvtt.settings.strip()))
+            lines.append("\n{}\n".format(subtitle.get_text(doc)))
+            yield "".join(lines)
+
+    def iter_subtitles(self, sniff=None):
+        """
+        Read file and yield subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
+        subtitle = None
         current = "header"
-        self.header = ""
-        lines = list(self._read_lines()) + [""]
-        for i, line in enumerate(lines):
+        header = []
+        prev = ""
+        for line in self._iter_lines(sniff):
             if not line.strip():
                 # A blank line terminates the preceding block.
+                if current == "header":
+                    self.header = self._join_lines(header)
+                if current == "text":
+                    yield subtitle
                 if current in ("header", "text"):
-                    subtitles.append(self._get_subtitle())
+                    subtitle = self._get_subtitle()
                 current = None
             elif current == "header":
                 # Header should be one line, but allow a block.
-                if self.header:
-                    self.header += "\n"
-                self.header += line
+                header.append(line)
             elif (self._re_style.match(line) or
                   current == "style"):
                 # Bind CSS styles to following subtitle.
-                subtitle = subtitles[-1]
                 if subtitle.webvtt.style:
                     subtitle.webvtt.style += "\n"
                 subtitle.webvtt.style += line
@@ -78,7 +113,6 @@ class WebVTT(aeidon.SubtitleFile):
             elif (self._re_comment.match(line) or
                   current == "comment"):
                 # Bind comments to following subtitle.
-                subtitle = subtitles[-1]
                 if subtitle.webvtt.comment:
                     subtitle.webvtt.comment += "\n"
                 subtitle.webvtt.comment += line
@@ -86,9 +120,8 @@ class WebVTT(aeidon.SubtitleFile):
             elif self._re_time_line.match(line):
                 # Time lines form a block with an optional preceding
                 # cue identifier and following text.
-                subtitle = subtitles[-1]
-                if lines[i-1].strip():
-                    subtitle.webvtt.id = lines[i-1]
+                if prev.strip():
+                    subtitle.webvtt.id = prev
                 match = self._re_time_line.match(line)
                 normalize = subtitle.calc.normalize_time
                 subtitle.start_time = normalize(match.group(1))
@@ -97,39 +130,13 @@ class WebVTT(aeidon.SubtitleFile):
                 current = "text"
             elif current == "text":
                 # Append inividual lines to text block.
-                subtitle = subtitles[-1]
                 if subtitle.main_text:
                     subtitle.main_text += "\n"
                 subtitle.main_text += line
-        # The last blank line has opened a new subtitle without times or text,
-        # which we skip. This also means that any possible styles or comments
-        # after the last actual subtitle are thrown out as well.
-        return subtitles[:-1]
-
-    def write_to_file(self, subtitles, doc, f):
-        """
-        Write `subtitles` from `doc` to file `f`.
-
-        Raise :exc:`IOError` if writing fails.
-        Raise :exc:`UnicodeError` if encoding fails.
-        """
-        writen = lambda x: f.write(x + "\n")
-        nwriten = lambda x: f.write("\n" + x + "\n")
-        writen(self.header.strip() or "WEBVTT")
-        first = (3 if subtitles[-1].end_seconds < 3600 else 0)
-        for i, subtitle in enumerate(subtitles):
-            if subtitle.webvtt.style:
-                nwriten(subtitle.webvtt.style)
-            if subtitle.webvtt.comment:
-                nwriten(subtitle.webvtt.comment)
-            f.write("\n")
-            if subtitle.webvtt.id:
-                writen(subtitle.webvtt.id)
-            # Write times as MM:SS.SSS if all times are less
-            # than an hour, else the usual HH:MM:SS.SSS.
-            start = subtitle.start_time[first:]
-            end = subtitle.end_time[first:]
-            f.write("{} --> {}".format(start, end))
-            if subtitle.webvtt.settings:
-                f.write(" {}".format(subtitle.webvtt.settings.strip()))
-            f.write("\n{}\n".format(subtitle.get_text(doc)))
+            prev = line
+        if current == "header":
+            self.header = self._join_lines(header)
+        # Any possible styles or comments after the last actual subtitle
+        # are thrown out, since there's no subtitle to bind them to.
+        if current == "text":
+            yield subtitle
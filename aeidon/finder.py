@@ -32,7 +32,7 @@ class Finder:
     :ivar match_span: Tuple of start and end position for match
     :ivar pattern: String or regular expression object to find
     :ivar pos: Current offset from the beginning of the text
-    :ivar replacement: Plain- or regular expression replacement string
+    :ivar replacement: Replacement string or function of match object
     :ivar text: Target text to find matches of pattern in
     """
 
@@ -137,7 +137,9 @@ class Finder:
         a, z = self.match_span
         orig_length = len(self.text)
         replacement = self.replacement
-        if not isinstance(self.pattern, str):
+        if callable(replacement):
+            replacement = replacement(self.match)
+        elif not isinstance(self.pattern, str):
             replacement = self.match.expand(self.replacement)
         self.text = self.text[:a] + replacement + self.text[z:]
         shift = len(self.text) - orig_length
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Index of intervals for finding those active at a position."""
+
+import bisect
+import itertools
+import math
+
+__all__ = ("IntervalIndex",)
+
+
+class IntervalIndex:
+
+    """
+    Index of intervals for finding those active at a position.
+
+    Intervals are given by index, like subtitles in a project, and can be
+    inserted, removed and changed by index to follow changes in the project.
+    Internally intervals are kept sorted by start position along with a tree
+    of maximum end positions, which allows finding all intervals containing
+    a position in logarithmic time, however much intervals overlap.
+
+    Changing an interval without changing its order in relation to other
+    intervals updates the tree in-place; inserting and removing intervals
+    marks the tree to be rebuilt on the next lookup.
+    """
+
+    def __init__(self, items=()):
+        """
+        Initialize an :class:`IntervalIndex` instance.
+
+        `items` should be an iterable of start, end, value.
+        """
+        self._entries = []
+        self._keys = []
+        self._serials = itertools.count()
+        self._size = 0
+        self._tree = None
+        self._values = {}
+        for start, end, value in items:
+            key = (start, end, next(self._serials))
+            self._keys.append(key)
+            self._values[key[2]] = value
+        self._entries = sorted(self._keys)
+
+    def __len__(self):
+        """Return the amount of intervals."""
+        return len(self._keys)
+
+    def find(self, pos):
+        """Return a list of values of intervals containing `pos`."""
+        # Only intervals up to k can start before pos.
+        k = bisect.bisect_right(self._entries, (pos, math.inf))
+        tree, size = self._get_tree()
+        found = []
+        stack = [(1, 0, size)]
+        while stack:
+            node, a, z = stack.pop()
+            if a >= k or tree[node] < pos: continue
+            if node >= size:
+                found.append(self._values[self._entries[a][2]])
+                continue
+            # Push right child first to find intervals in order.
+            m = (a + z) // 2
+            stack.append((2*node + 1, m, z))
+            stack.append((2*node, a, m))
+        return found
+
+    def find_next(self, pos):
+        """
+        Return start, end, value of first interval starting after `pos`.
+
+        Return ``None`` if no interval starts after `pos`.
+        """
+        i = bisect.bisect_right(self._entries, (pos, math.inf))
+        if i == len(self._entries): return None
+        return self._get_item(self._entries[i])
+
+    def find_previous(self, pos):
+        """
+        Return start, end, value of last interval ending before `pos`.
+
+        Return ``None`` if no interval ends before `pos`.
+        """
+        i = bisect.bisect_left(self._entries, (pos,))
+        # Intervals passed before one ending before position
+        # are all active at position, usually zero or a few.
+        for i in reversed(range(i)):
+            if self._entries[i][1] < pos:
+                return self._get_item(self._entries[i])
+        return None
+
+    def _get_item(self, entry):
+        """Return start, end, value of interval of `entry`."""
+        return entry[0], entry[1], self._values[entry[2]]
+
+    def _get_tree(self):
+        """Return tree of maximum end positions and amount of leaves."""
+        if self._tree is not None:
+            return self._tree, self._size
+        size = 1
+        while size < len(self._entries):
+            size *= 2
+        tree = [-math.inf] * (2*size)
+        tree[size:size+len(self._entries)] = [x[1] for x in self._entries]
+        for i in reversed(range(1, size)):
+            tree[i] = max(tree[2*i], tree[2*i + 1])
+        self._tree = tree
+        self._size = size
+        return self._tree, self._size
+
+    def insert(self, index, start, end, value):
+        """Insert interval from `start` to `end` at `index`."""
+        key = (start, end, next(self._serials))
+        self._keys.insert(index, key)
+        self._values[key[2]] = value
+        bisect.insort(self._entries, key)
+        self._tree = None
+
+    def pop(self, index):
+        """Remove and return value of interval at `index`."""
+        key = self._keys.pop(index)
+        del self._entries[bisect.bisect_left(self._entries, key)]
+        self._tree = None
+        return self._values.pop(key[2])
+
+    def set(self, index, start, end, value):
+        """Set interval at `index` to be from `start` to `end`."""
+        old = self._keys[index]
+        new = (start, end, old[2])
+        self._keys[index] = new
+        self._values[new[2]] = value
+        i = bisect.bisect_left(self._entries, old)
+        if ((i == 0 or self._entries[i-1] < new) and
+            (i == len(self._entries) - 1 or new < self._entries[i+1])):
+            # Order remains, update tree in-place.
+            self._entries[i] = new
+            return self._update_tree(i)
+        del self._entries[i]
+        bisect.insort(self._entries, new)
+        self._tree = None
+
+    def set_value(self, index, value):
+        """Set value of interval at `index`."""
+        self._values[self._keys[index][2]] = value
+
+    def _update_tree(self, i):
+        """Update tree of maximum end positions at entry `i`."""
+        if self._tree is None: return
+        node = self._size + i
+        self._tree[node] = self._entries[i][1]
+        while node > 1:
+            node //= 2
+            self._tree[node] = max(self._tree[2*node],
+                                   self._tree[2*node + 1])
@@ -18,6 +18,7 @@
 """Breaking lines to a specified width."""
 
 import aeidon
+import collections
 import re
 import sys
 
@@ -32,6 +33,7 @@ class Liner(aeidon.Parser):
     :ivar length_func: A function that returns the length of its argument
     :ivar max_length: Maximum length of a line in units of :attr:`length_func`
     :ivar max_lines: Maximum preferred amount of lines (may be exceeded)
+    :ivar _cache: Dictionary mapping texts and settings to break points
     :ivar _penalties: List of penalty pattern dictionaries
     """
 
@@ -44,11 +46,13 @@ class Liner(aeidon.Parser):
     # application, which is a lot simpler, but also more ambiguous and
     # subjective in terms of the minimized demerit measure.
 
+    _cache_limit = 1000
     _re_multi_space = re.compile(r" {2,}")
 
     def __init__(self, re_tag=None, clean_func=None):
         """Initialize a :class:`Liner` instance."""
         aeidon.Parser.__init__(self, re_tag, clean_func)
+        self._cache = collections.OrderedDict()
         self._penalties = []
         self.length_func = len
         self.max_length = 40
@@ -60,49 +64,37 @@ class Liner(aeidon.Parser):
         return  [" ".join(boxes[edges[i]:edges[i+1]])
                  for i in range(len(edges) - 1)]
 
-    def _break_lines(self, boxes, penalties, nlines):
+    def _break_lines(self, boxes, penalties):
         """
-        Break `boxes` into lines and return break points and demerit.
+        Break `boxes` into lines and return break points.
 
-        If keeping all boxes on a single line results in a valid and better
-        result than splitting to `nlines` return an empty list. If no
-        valid break points can be found, return ``None``.
+        Return an empty list if keeping all boxes on a single line is the
+        best result and ``None`` if no valid break points can be found.
         """
-        breaks = self._list_possible_breaks(boxes, penalties, nlines)
+        get_length = self._get_length_func(boxes)
+        ends = self._list_line_ends(boxes, get_length)
+        min_nlines = self._count_min_lines(ends)
+        if min_nlines[0] is None: return None
         best_breaks = None
         best_demerit = sys.maxsize
-        text = " ".join(boxes)
-        if self.length_func(text) <= self.max_length:
-            # Use a valid one-line solution as the benchmark,
-            # that any more-line solution must beat.
-            best_breaks = []
-            best_demerit = self._calculate_demerit(boxes, penalties, [])
-        if nlines == 1:
-            return best_breaks, best_demerit
-        if nlines == 2:
-            for i in breaks:
-                if penalties[i] > best_demerit: break
-                demerit = self._calculate_demerit(boxes, penalties, [i])
-                if demerit < best_demerit:
-                    best_breaks = [i]
-                    best_demerit = demerit
-            return best_breaks, best_demerit
-        # For more than two lines, loop over first break points and
-        # recursively figure out rest of the breaks in each case.
-        for i in breaks:
-            # Use the maximum total negative penalty
-            # that can accumulate from all later breaks.
-            negpen = sorted(x for x in penalties[i+1:] if x < 0)
-            negpen = sum(negpen[:min(len(negpen), nlines - 2)])
-            if (penalties[i] + negpen) > best_demerit: break
-            value = self._break_lines(boxes[i+1:], penalties[i+1:], nlines-1)
-            if value[0] is None: continue
-            later = [i+1+x for x in value[0]]
-            demerit = self._calculate_demerit(boxes, penalties, [i] + later)
+        # Consider all line counts up to the preferred maximum, or if that
+        # is not possible, up to the least amount of lines possible.
+        for nlines in range(min_nlines[0], max(self.max_lines,
+                                               min_nlines[0]) + 1):
+
+            breaks = self._break_lines_to(boxes,
+                                          penalties,
+                                          nlines,
+                                          get_length,
+                                          ends,
+                                          min_nlines)
+
+            if breaks is None: continue
+            demerit = self._calculate_demerit(boxes, penalties, breaks)
             if demerit < best_demerit:
-                best_breaks = [i] + later
+                best_breaks = breaks
                 best_demerit = demerit
-        return best_breaks, best_demerit
+        return best_breaks
 
     def break_lines(self):
         """Break lines and return text."""
@@ -113,32 +105,81 @@ class Liner(aeidon.Parser):
         boxes = self.text.split(" ")
         if len(boxes) == 1:
             return self.get_text()
-        penalties = self._detect_penalties(boxes)
-        best_breaks = None
-        best_demerit = sys.maxsize
-        # We can probably handle up to ten lines of text
-        # before finding break points gets intolerably slow.
-        min_nlines = min(2, self.max_lines)
-        max_nlines = min(10, len(boxes))
-        for nlines in range(min_nlines, max_nlines+1):
-            breaks, demerit = self._break_lines(boxes, penalties, nlines)
-            if breaks is None: continue
-            if demerit < best_demerit:
-                best_breaks = breaks
-                best_demerit = demerit
-            if nlines < self.max_lines:
-                continue
-            pos = -1
-            for i in range(len(boxes)):
-                pos = pos + 1 + len(boxes[i])
-                text = self.text
-                if i in best_breaks:
-                    text = text[:pos] + "\n" + text[pos+1:]
-                self.text = text
-            return self.get_text()
+        key = (self.text, self.length_func, self.max_length, self.max_lines)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            breaks = self._cache[key]
+        else:
+            penalties = self._detect_penalties(boxes)
+            breaks = self._break_lines(boxes, penalties)
+            self._cache[key] = breaks
+            while len(self._cache) > self._cache_limit:
+                self._cache.popitem(last=False)
         # If text cannot be broken, return original text.
+        if breaks is None:
+            return self.get_text()
+        chars = list(self.text)
+        pos = -1
+        for i in range(len(boxes) - 1):
+            pos = pos + 1 + len(boxes[i])
+            if i in breaks:
+                chars[pos] = "\n"
+        self.text = "".join(chars)
         return self.get_text()
 
+    def _break_lines_to(self, boxes, penalties, nlines, get_length,
+                        ends, min_nlines):
+        """
+        Return break points to break `boxes` into exactly `nlines`.
+
+        Return ``None`` if no valid break points can be found.
+        """
+        # Find the optimal breaks by dynamic programming over states of the
+        # start and end of the latest line, which are needed to evaluate the
+        # deviation and pyramid measures of :meth:`_calculate_demerit`. The
+        # deviation from the mean line length can be evaluated one line at a
+        # time, since for a known amount of lines the mean is known as well,
+        # at least for length functions that are additive over boxes.
+        nboxes = len(boxes)
+        xlength = self.max_length
+        mlength = get_length(0, nboxes) - (nlines-1) * self.length_func(" ")
+        mlength = mlength / nlines
+        # Map latest line (start, end) to (cost, previous line).
+        states = {(0, z): (50 * ((get_length(0, z) - mlength) / xlength)**2,
+                           None) for z in ends[0]}
+
+        history = [states]
+        for i in range(1, nlines):
+            remaining = nlines - i
+            new_states = {}
+            for (a, z), (cost, prev) in states.items():
+                if min_nlines[z] is None: continue
+                if min_nlines[z] > remaining: continue
+                if nboxes - z < remaining: continue
+                length = get_length(a, z)
+                for zz in ends[z]:
+                    new_length = get_length(z, zz)
+                    new_cost = (cost
+                                + penalties[z-1]
+                                + 50 * ((new_length - mlength) / xlength)**2
+                                + 50 * (max(0, length - new_length)
+                                        / xlength)**2)
+
+                    key = (z, zz)
+                    if (not key in new_states or
+                        new_cost < new_states[key][0]):
+                        new_states[key] = (new_cost, (a, z))
+            states = new_states
+            history.append(states)
+        final = [(v[0], k) for k, v in states.items() if k[1] == nboxes]
+        if not final: return None
+        key = min(final)[1]
+        breaks = []
+        for states in reversed(history[1:]):
+            breaks.insert(0, key[0] - 1)
+            key = states[key][1]
+        return breaks
+
     def _calculate_demerit(self, boxes, penalties, breaks):
         """Return demerit measure for `boxes` broken by `breaks`."""
         nlines = len(breaks) + 1
@@ -160,6 +201,23 @@ class Liner(aeidon.Parser):
                 + 100 * (nlines-1)**3
                 + 1000 * max(0, nlines - self.max_lines)**3)
 
+    def _count_min_lines(self, ends):
+        """
+        Return a list of the least amount of lines needed from each box.
+
+        `ends` should be a list as returned by :meth:`_list_line_ends`.
+        The list returned has one item more than boxes, the last of which
+        is zero. ``None`` is used for boxes from which the remaining boxes
+        cannot be broken into valid lines.
+        """
+        min_nlines = [None] * len(ends) + [0]
+        for a in reversed(range(len(ends))):
+            counts = [min_nlines[z] for z in ends[a]]
+            counts = [x for x in counts if x is not None]
+            if counts:
+                min_nlines[a] = min(counts) + 1
+        return min_nlines
+
     def _detect_penalties(self, boxes):
         """Detect penalties for break points following `boxes`."""
         text = " ".join(self._boxes_to_lines(boxes, breaks=[]))
@@ -183,56 +241,41 @@ class Liner(aeidon.Parser):
             penalties[i] = textpen[pos]
         return penalties
 
-    @aeidon.deco.memoize(100)
-    def _list_possible_breaks(self, boxes, penalties, nlines):
+    def _get_length_func(self, boxes):
+        """
+        Return a function that returns the length of a line of boxes.
+
+        The returned function takes the start and end indices of boxes and
+        returns the length of those boxes joined to a line. Lengths are
+        calculated from prefix sums if :attr:`length_func` is :func:`len`,
+        otherwise :attr:`length_func` is called once for each line.
+        """
+        if self.length_func is len:
+            prefix = [0]
+            for box in boxes:
+                prefix.append(prefix[-1] + len(box) + 1)
+            return lambda a, z: prefix[z] - prefix[a] - 1
+        lengths = {}
+        def get_length(a, z):
+            if not (a, z) in lengths:
+                line = " ".join(boxes[a:z])
+                lengths[a, z] = self.length_func(line)
+            return lengths[a, z]
+        return get_length
+
+    def _list_line_ends(self, boxes, get_length):
         """
-        Return a list of all possible break points for `boxes`.
+        Return a list of valid line ends for lines starting at each box.
 
-        All break points that would necessarily cause `max_length` to be
-        violated are discarded. Breaks are returned sorted in ascending order
-        of associated `penalties`, so that all remaining breaks can be
-        discarded once a demerit threshold is crossed.
+        Line ends are exclusive box indices and only ends that would not
+        cause :attr:`max_length` to be violated are included.
         """
-        breaks = list(range(len(boxes) - (nlines - 1)))
-        breakpen = penalties[:len(breaks)]
-        if nlines == 1:
-            return []
-        if nlines == 2:
-            keep = [False] * len(breaks)
-            for i in range(len(breaks)):
-                lines = self._boxes_to_lines(boxes, breaks=[i])
-                lengths = map(self.length_func, lines)
-                keep[i] = max(lengths) <= self.max_length
-            breaks = [breaks[i] for i in range(len(breaks)) if keep[i]]
-            breakpen = [breakpen[i] for i in range(len(breakpen)) if keep[i]]
-            # Sort breaks in ascending order by penalties,
-            # so that all remaining breaks can be discarded once
-            # a demerit threshold is crossed.
-            if not breaks: return []
-            points = sorted(zip(breakpen, breaks))
-            breakpen, breaks = zip(*points)
-            return(breaks)
-        # For more than two lines, loop over first break points and
-        # recursively figure out rest of the breaks in each case.
-        keep = [False] * len(breaks)
-        for i in range(len(breaks)):
-            lines = self._boxes_to_lines(boxes, breaks=[i])
-            alength = self.length_func(lines[0])
-            if alength > self.max_length: break
-            later = self._list_possible_breaks(boxes[i+1:],
-                                               penalties[i+1:],
-                                               nlines-1)
-
-            keep[i] = bool(later)
-        breaks = [breaks[i] for i in range(len(breaks)) if keep[i]]
-        breakpen = [breakpen[i] for i in range(len(breakpen)) if keep[i]]
-        # Sort breaks in ascending order by penalties,
-        # so that all remaining breaks can be discarded once
-        # a demerit threshold is crossed.
-        if not breaks: return []
-        points = sorted(zip(breakpen, breaks))
-        breakpen, breaks = zip(*points)
-        return(breaks)
+        ends = [[] for x in boxes]
+        for a in range(len(boxes)):
+            for z in range(a + 1, len(boxes) + 1):
+                if get_length(a, z) > self.max_length: break
+                ends[a].append(z)
+        return ends
 
     def set_penalties(self, penalties):
         """
@@ -244,6 +287,7 @@ class Liner(aeidon.Parser):
         in pattern to hold the penalty of value. A negative penalty encourages
         a break and a positive penalty discourages.
         """
+        self._cache.clear()
         self._penalties = []
         for penalty in penalties:
             regex = re.compile(penalty["pattern"], penalty["flags"])
@@ -18,13 +18,25 @@
 """Subtitle text markup converter."""
 
 import aeidon
+import collections
+import re
 
 __all__ = ("MarkupConverter",)
 
 
 class MarkupConverter:
 
-    """Subtitle text markup converter."""
+    """
+    Subtitle text markup converter.
+
+    Markup of all formats starts with one of the characters ``<``, ``{``
+    or, at the beginning of a line, one of ``/``, ``\\`` and ``_``. Texts
+    without any of those are returned as-is without trying to convert them
+    and converted texts are cached, since subtitles often repeat.
+    """
+
+    _cache_limit = 1000
+    _re_markup = re.compile(r"[<{]|^[/\\_]", re.MULTILINE)
 
     def __init__(self, from_format, to_format):
         """
@@ -33,9 +45,18 @@ class MarkupConverter:
         `from_format` and `to_format` should be :attr:`aeidon.formats`
         enumeration items.
         """
+        self._cache = collections.OrderedDict()
         self._from = aeidon.markups.new(from_format)
         self._to = aeidon.markups.new(to_format)
 
     def convert(self, text):
         """Return `text` with markup converted."""
-        return self._to.encode(self._from.decode(text))
+        if self._re_markup.search(text) is None:
+            return text
+        if text in self._cache:
+            self._cache.move_to_end(text)
+            return self._cache[text]
+        self._cache[text] = self._to.encode(self._from.decode(text))
+        while len(self._cache) > self._cache_limit:
+            self._cache.popitem(last=False)
+        return self._cache[text]
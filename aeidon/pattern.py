@@ -31,6 +31,7 @@ class Pattern(aeidon.MetadataItem):
     :ivar enabled: ``True`` if pattern should be used, ``False`` if not
     :ivar fields: Dictionary of all data field names and values
     :ivar local: ``True`` if pattern is defined by user, ``False`` if system
+    :ivar _regex: Tuple of pattern, flags and compiled regular expression
     """
 
     def __init__(self, fields=None):
@@ -38,6 +39,7 @@ class Pattern(aeidon.MetadataItem):
         aeidon.MetadataItem.__init__(self, fields)
         self.enabled = True
         self.local = False
+        self._regex = None
 
     def get_flags(self):
         """Return the evaluated value of the ``Flags`` field."""
@@ -45,3 +47,17 @@ class Pattern(aeidon.MetadataItem):
         for name in self.get_field_list("Flags"):
             flags = flags | getattr(re, name)
         return flags
+
+    def get_regex(self):
+        """
+        Return the compiled regular expression of the ``Pattern`` field.
+
+        The compiled regular expression is cached and only recompiled if the
+        ``Pattern`` or ``Flags`` field is changed. Raise :exc:`re.error` if
+        bad pattern.
+        """
+        string = self.get_field("Pattern")
+        flags = self.get_flags()
+        if self._regex is None or self._regex[:2] != (string, flags):
+            self._regex = (string, flags, re.compile(string, flags))
+        return self._regex[2]
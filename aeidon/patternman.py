@@ -30,17 +30,26 @@ class PatternManager:
     """
     Managing regular expression substitutions for subtitle texts.
 
+    :ivar _cache: Dictionary mapping paths to parsed pattern files
+    :ivar _cache_changed: ``True`` if :attr:`_cache` needs to be written
     :ivar _patterns: Dictionary mapping codes to pattern lists
     :ivar pattern_type: String to indentify what the pattern matches
 
     :attr:`pattern_type` should be a string with value "line-break",
     "common-error", "capitalization" or "hearing-impaired". Codes are of form
     ``Script[-language-[COUNTRY]]`` using the corresponding ISO codes.
+
+    Fields of patterns parsed from files are cached on disk in
+    :attr:`aeidon.CACHE_HOME_DIR` and reused as long as the modification time
+    and size of the pattern file remain the same.
     """
+    _cache_version = 1
     _re_comment = re.compile(r"^\s*#.*$")
 
     def __init__(self, pattern_type):
         """Initialize a :class:`PatternManager` instance."""
+        self._cache = {}
+        self._cache_changed = False
         self.pattern_type = pattern_type
         self._patterns = {}
         self._read_patterns()
@@ -70,6 +79,11 @@ class PatternManager:
                 filtered_patterns.remove(None)
         return filtered_patterns
 
+    def _get_cache_path(self):
+        """Return path to the file to cache parsed patterns in."""
+        basename = "{}.json".format(self.pattern_type)
+        return os.path.join(aeidon.CACHE_HOME_DIR, "patterns", basename)
+
     def _get_codes(self, script=None, language=None, country=None):
         """Return a sequence of all codes to be used by arguments."""
         codes = ["Zyyy"]
@@ -97,6 +111,11 @@ class PatternManager:
         languages = [x.split("-")[1] for x in codes]
         return tuple(aeidon.util.get_unique(languages))
 
+    def get_pattern_set(self, script=None, language=None, country=None):
+        """Return a :class:`aeidon.PatternSet` of enabled patterns."""
+        patterns = self.get_patterns(script, language, country)
+        return aeidon.PatternSet(patterns)
+
     def get_patterns(self, script=None, language=None, country=None):
         """Return patterns for `script`, `language` and `country`."""
         patterns = []
@@ -118,6 +137,14 @@ class PatternManager:
         scripts = [x.split("-")[0] for x in codes]
         return tuple(aeidon.util.get_unique(scripts))
 
+    def _read_cache(self):
+        """Read parsed pattern files from cache."""
+        path = self._get_cache_path()
+        key = dict(version=self._cache_version)
+        cache = aeidon.util.read_cache(path, key)
+        if not isinstance(cache, dict): return
+        self._cache = cache
+
     def _read_config_from_directory(self, directory, encoding):
         """Read configurations from files in `directory`."""
         if not os.path.isdir(directory): return
@@ -144,16 +171,50 @@ class PatternManager:
                 if pattern.get_name(localize=False) == name:
                     pattern.enabled = enabled
 
+    def _read_fields_from_file(self, path, encoding):
+        """Return a list of field dictionaries of patterns in file."""
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        mtime = stat.st_mtime_ns
+        cached = self._cache.get(key, {})
+        if (isinstance(cached, dict) and
+            cached.get("mtime") == mtime and
+            cached.get("size") == stat.st_size and
+            cached.get("encoding") == encoding and
+            isinstance(cached.get("fields"), list)):
+            return [dict(x) for x in cached["fields"]]
+        fields = []
+        lines = aeidon.util.readlines(path, encoding)
+        lines = [self._re_comment.sub("", x) for x in lines]
+        lines = [x.strip() for x in lines]
+        for line in (x for x in lines if x):
+            if line.startswith("["): # [HEADER]
+                fields.append({})
+            else: # [_]KEY=VALUE
+                name, value = line.split("=", 1)
+                name = (name[1:] if name.startswith("_") else name)
+                fields[-1][name] = value
+        self._cache[key] = dict(encoding=encoding,
+                                fields=fields,
+                                mtime=mtime,
+                                size=stat.st_size)
+
+        self._cache_changed = True
+        return [dict(x) for x in fields]
+
     def _read_patterns(self):
         """Read all patterns of :attr:`pattern_type` from files."""
         data_dir = os.path.join(aeidon.DATA_DIR, "patterns")
         data_home_dir = os.path.join(aeidon.DATA_HOME_DIR, "patterns")
         config_home_dir = os.path.join(aeidon.CONFIG_HOME_DIR, "patterns")
         encoding = aeidon.util.get_default_encoding()
+        self._read_cache()
         self._read_patterns_from_directory(data_dir, "utf_8")
         self._read_patterns_from_directory(data_home_dir, encoding)
         self._read_config_from_directory(data_dir, "utf_8")
         self._read_config_from_directory(config_home_dir, encoding)
+        if self._cache_changed:
+            self._write_cache()
 
     def _read_patterns_from_directory(self, directory, encoding):
         """Read all patterns from files in `directory`."""
@@ -182,17 +243,9 @@ class PatternManager:
         code = basename.replace(extension, "")
         local = path.startswith(aeidon.DATA_HOME_DIR)
         patterns = self._patterns.setdefault(code, [])
-        lines = aeidon.util.readlines(path, encoding)
-        lines = [self._re_comment.sub("", x) for x in lines]
-        lines = [x.strip() for x in lines]
-        for line in (x for x in lines if x):
-            if line.startswith("["): # [HEADER]
-                patterns.append(aeidon.Pattern())
-                patterns[-1].local = local
-            else: # [_]KEY=VALUE
-                name, value = line.split("=", 1)
-                name = (name[1:] if name.startswith("_") else name)
-                patterns[-1].set_field(name, value)
+        for fields in self._read_fields_from_file(path, encoding):
+            patterns.append(aeidon.Pattern(fields))
+            patterns[-1].local = local
 
     def save_config(self, script=None, language=None, country=None):
         """Save pattern configurations to files."""
@@ -200,6 +253,13 @@ class PatternManager:
         for code in (x for x in codes if x in self._patterns):
             self._write_config_to_file(code, "utf_8")
 
+    def _write_cache(self):
+        """Write parsed pattern files to cache."""
+        path = self._get_cache_path()
+        key = dict(version=self._cache_version)
+        if aeidon.util.write_cache(path, key, self._cache):
+            self._cache_changed = False
+
     def _write_config_to_file(self, code, encoding):
         """Write configurations of all patterns to file."""
         local_dir = os.path.join(aeidon.CONFIG_HOME_DIR, "patterns")
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Compiled set of regular expression substitutions."""
+
+import re
+
+__all__ = ("PatternSet",)
+
+
+class PatternSet:
+
+    """
+    Compiled set of regular expression substitutions.
+
+    :ivar patterns: List of enabled :class:`aeidon.Pattern` instances
+    :ivar regexes: List of compiled regular expressions of :attr:`patterns`
+    :ivar substitutions: List of regular expression, replacement, repeat
+
+    All enabled patterns are compiled once on initialization, after which the
+    set can be used to process any amount of texts. In :attr:`substitutions`,
+    consecutive patterns that match plain strings are merged into a single
+    alternation regular expression if applying them all in one pass gives the
+    same result as applying them one after another. Replacements of such
+    merged items are functions of the match object.
+    """
+
+    _mergeable_flags = re.DOTALL | re.MULTILINE | re.UNICODE
+    _re_special = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+    def __init__(self, patterns):
+        """
+        Initialize a :class:`PatternSet` instance.
+
+        Raise :exc:`re.error` if a bad regular expression among `patterns`.
+        """
+        self.patterns = [x for x in patterns if x.enabled]
+        self.regexes = [x.get_regex() for x in self.patterns]
+        self.substitutions = []
+        self._init_substitutions()
+
+    def _flush_group(self, group):
+        """Add substitution for `group` of literal patterns."""
+        if len(group) == 1:
+            regex = group[0].get_regex()
+            replacement = group[0].get_field("Replacement")
+        else:
+            table = {x.get_field("Pattern"): x.get_field("Replacement")
+                     for x in group}
+            flags = group[0].get_flags()
+            regex = re.compile("|".join(map(re.escape, table)), flags)
+            replacement = lambda match: table[match.group()]
+        self.substitutions.append((regex, replacement, False))
+
+    def _init_substitutions(self):
+        """Initialize :attr:`substitutions` from :attr:`patterns`."""
+        group = []
+        for pattern, regex in zip(self.patterns, self.regexes):
+            if (group and
+                self._is_mergeable(pattern) and
+                self._is_mergeable_to(pattern, group)):
+                group.append(pattern)
+                continue
+            if group:
+                self._flush_group(group)
+                group = []
+            if self._is_mergeable(pattern):
+                group.append(pattern)
+                continue
+            replacement = pattern.get_field("Replacement")
+            repeat = pattern.get_field_boolean("Repeat", False)
+            self.substitutions.append((regex, replacement, repeat))
+        if group:
+            self._flush_group(group)
+
+    def _is_mergeable(self, pattern):
+        """Return ``True`` if `pattern` can be merged with others."""
+        string = pattern.get_field("Pattern", "")
+        replacement = pattern.get_field("Replacement", "")
+        return (bool(string) and
+                bool(replacement) and
+                self._re_special.search(string) is None and
+                not "\\" in replacement and
+                not pattern.get_field_boolean("Repeat", False) and
+                not pattern.get_flags() & ~self._mergeable_flags)
+
+    def _is_mergeable_to(self, pattern, group):
+        """Return ``True`` if `pattern` can be merged to `group`."""
+        # Merging is safe if no two strings in group share characters,
+        # which would allow them to overlap, and if no earlier replacement
+        # shares characters with a string, which would allow a replacement
+        # to create a new match. Replacements are non-empty, so a new match
+        # cannot be formed from text surrounding a replacement either.
+        chars = set(pattern.get_field("Pattern"))
+        if pattern.get_flags() != group[0].get_flags(): return False
+        for item in group:
+            if chars & set(item.get_field("Pattern")): return False
+            if chars & set(item.get_field("Replacement")): return False
+        return True
@@ -30,12 +30,18 @@ class ProjectMeta(type):
     Public methods are added to the class dictionary during :meth:`__new__`
     in order to fool Sphinx (and perhaps other API documentation generators)
     into thinking that the resulting instantiated class actually contains those
-    methods, which it does not since the methods are removed during
-    :meth:`Project.__init__`.
+    methods, which it does not since the methods are removed when the first
+    instance is initialized.
+
+    Names of methods exported by agents are found once for the class and
+    stored as ``_exports``, a tuple of agent classes and method names, leaving
+    instances only to bind those methods to their agents.
     """
 
     def __new__(meta, class_name, bases, dic):
         new_dict = dic.copy()
+        exports = []
+        delegated = set()
         for agent_class_name in aeidon.agents.__all__:
             agent_class = getattr(aeidon.agents, agent_class_name)
             def is_delegate_method(name):
@@ -44,9 +50,17 @@ class ProjectMeta(type):
                         hasattr(value, "export") and
                         value.export is True)
 
-            attr_names = list(filter(is_delegate_method, dir(agent_class)))
+            attr_names = tuple(filter(is_delegate_method, dir(agent_class)))
             for attr_name in attr_names:
+                if attr_name in delegated:
+                    raise ValueError("Multiple definitions of {}"
+                                     .format(repr(attr_name)))
+
+                delegated.add(attr_name)
                 new_dict[attr_name] = getattr(agent_class, attr_name)
+            exports.append((agent_class, attr_names))
+        new_dict["_exports"] = tuple(exports)
+        new_dict["_exports_in_class"] = True
         return type.__new__(meta, class_name, bases, new_dict)
 
 
@@ -57,6 +71,7 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
+    :ivar columnar: ``True`` to keep subtitles in a :class:`aeidon.SubtitleStore`
     :ivar _delegations: Dictionary mapping method names to agent methods
     :ivar framerate: :attr:`aeidon.framerates` item corresponding to video
     :ivar main_changed: Integer, status of main document
@@ -66,8 +81,13 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one and undoing decreases value by one.
 
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
-    :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar redoables: :class:`aeidon.RevertableActionStack` of undone actions
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
+
+       If :attr:`columnar` is ``True``, any list assigned is converted to
+       a :class:`aeidon.SubtitleStore`, which uses far less memory for large
+       files and allows bulk operations on columns of data.
+
     :ivar tran_changed: Integer, status of translation document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -75,8 +95,10 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one  and undoing decreases value by one.
 
     :ivar tran_file: Translation instance of :class:`aeidon.SubtitleFile`
-    :ivar undo_limit: Maximum size of undo/redo stacks or None for no limit
-    :ivar undoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar undo_limit: Maximum length of undo/redo stacks or None for no limit
+    :ivar undo_memory_limit: Maximum approximate memory in bytes used by undo
+       and redo stacks together or None for no limit
+    :ivar undoables: :class:`aeidon.RevertableActionStack` of done actions
     :ivar video_path: Full, absolute path to the video file on disk
 
     Signals and their arguments for callback functions:
@@ -85,14 +107,19 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
      * ``action-undone``: project, action
      * ``main-file-opened``: project, main_file
      * ``main-file-saved``: project, main_file
-     * ``main-texts-changed``: project, indices
-     * ``positions-changed``: project, indices
-     * ``subtitles-changed``: project, indices
-     * ``subtitles-inserted``: project, indices
-     * ``subtitles-removed``: project, indices
+     * ``main-texts-changed``: project, ranges
+     * ``positions-changed``: project, ranges
+     * ``subtitles-changed``: project, ranges
+     * ``subtitles-inserted``: project, ranges
+     * ``subtitles-moved``: project, order of old indices at new indices
+     * ``subtitles-removed``: project, ranges
      * ``translation-file-opened``: project, tran_file
      * ``translation-file-saved``: project, tran_file
-     * ``translation-texts-changed``: project, indices
+     * ``translation-texts-changed``: project, ranges
+
+    Signals of changes to subtitles give indices as `ranges`, a sorted list
+    of :class:`range` objects of consecutive indices, see
+    :func:`aeidon.util.get_index_ranges`.
     """
 
     signals = (
@@ -104,6 +131,7 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "main-texts-changed",
         "positions-changed",
         "subtitles-inserted",
+        "subtitles-moved",
         "subtitles-removed",
         "subtitles-changed",
         "translation-file-opened",
@@ -111,22 +139,25 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "translation-texts-changed",
     )
 
-    def __init__(self, framerate=None):
+    def __init__(self, framerate=None, columnar=False):
         """Initialize a :class:`Project` instance."""
         aeidon.Observable.__init__(self)
+        self._change_batch = None
         framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
+        self.columnar = columnar
         self._delegations = {}
         self.framerate = framerate
         self.main_changed = 0
         self.main_file = None
-        self.redoables = []
+        self.redoables = aeidon.RevertableActionStack()
         self.subtitles = []
         self.tran_changed = None
         self.tran_file = None
         self.undo_limit = 100000
-        self.undoables = []
+        self.undo_memory_limit = 256 * 1024**2
+        self.undoables = aeidon.RevertableActionStack()
         self.video_path = None
         self._init_delegations()
 
@@ -137,24 +168,74 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         except LookupError:
             raise AttributeError
 
+    def emit(self, signal, *args):
+        """Send notification of ``signal`` to all registered observers."""
+        if (self._change_batch is not None and
+            not self._blocked_state and
+            not signal in self._blocked_signals and
+            (signal in self._change_batch.signals or
+             signal.startswith("notify::"))):
+            return self._change_batch.add(signal, *args)
+        if (signal in aeidon.ChangeBatch.signals and
+            signal != "subtitles-moved"):
+            args = (aeidon.util.get_index_ranges(args[0]),) + args[1:]
+        return aeidon.Observable.emit(self, signal, *args)
+
+    def freeze_changes(self):
+        """
+        Accumulate signals of changes to subtitles instead of emitting them.
+
+        Signals of subtitles inserted, removed and changed, as well as notify
+        signals, are accumulated into a :class:`aeidon.ChangeBatch` and
+        emitted once each when thawed, with indices corresponding to the state
+        of subtitles at that time. Revertable actions are run in frozen state.
+
+        Return ``False`` if already frozen, otherwise ``True``.
+        """
+        if self._change_batch is None:
+            self._change_batch = aeidon.ChangeBatch(len(self.subtitles))
+            return True
+        return False
+
     def _init_delegations(self):
         """Initialize the delegation mappings."""
-        for agent_class_name in aeidon.agents.__all__:
-            agent = getattr(aeidon.agents, agent_class_name)(self)
-            def is_delegate_method(name):
-                value = getattr(agent, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
-
-            attr_names = list(filter(is_delegate_method, dir(agent)))
+        for agent_class, attr_names in self._exports:
+            agent = agent_class(self)
             for attr_name in attr_names:
-                attr_value = getattr(agent, attr_name)
-                if attr_name in self._delegations:
-                    raise ValueError("Multiple definitions of {}"
-                                     .format(repr(attr_name)))
-
-                self._delegations[attr_name] = attr_value
-                # Remove class-level function added by ProjectMeta.
-                if hasattr(self.__class__, attr_name):
-                    delattr(self.__class__, attr_name)
+                self._delegations[attr_name] = getattr(agent, attr_name)
+        for cls in type(self).__mro__:
+            # Remove class-level functions added by ProjectMeta.
+            if not cls.__dict__.get("_exports_in_class", False): continue
+            for agent_class, attr_names in cls._exports:
+                for attr_name in attr_names:
+                    delattr(cls, attr_name)
+            cls._exports_in_class = False
+
+    def thaw_changes(self, do=True):
+        """
+        Emit all accumulated signals and accumulate no more.
+
+        The optional `do` keyword argument should be the return value from
+        :meth:`freeze_changes` to avoid problems with nested functions where
+        changes were frozen at a higher level. If `do` is ``False``, nothing
+        will be done.
+
+        Return ``False`` if already thawed, otherwise ``True``.
+        """
+        if do and self._change_batch is not None:
+            batch = self._change_batch
+            self._change_batch = None
+            for signal, ranges in batch.get_signals():
+                aeidon.Observable.emit(self, signal, ranges)
+            for signal in batch.get_notify_signals():
+                self.emit(signal)
+            return True
+        return False
+
+    def _validate(self, name, value):
+        """Return `value` or an observable version if `value` is mutable."""
+        if name == "subtitles" and self.columnar:
+            if isinstance(value, aeidon.SubtitleStore):
+                return value
+            return aeidon.SubtitleStore(value)
+        return aeidon.Observable._validate(self, name, value)
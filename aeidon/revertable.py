@@ -18,8 +18,33 @@
 """Actions that can be reverted, i.e. undone and redone."""
 
 import aeidon
-
-__all__ = ("RevertableAction", "RevertableActionGroup",)
+import array
+import collections
+import sys
+
+__all__ = ("RevertableAction",
+           "RevertableActionGroup",
+           "RevertableActionStack",)
+
+
+def _get_size(obj, seen):
+    """Return approximate memory used by `obj` in bytes."""
+    if id(obj) in seen: return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, array.array)):
+        return size
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(_get_size(x, seen) for x in obj)
+    if isinstance(obj, dict):
+        return size + sum(_get_size(k, seen) + _get_size(v, seen)
+                          for k, v in obj.items())
+
+    if isinstance(obj, aeidon.Subtitle):
+        # Positions are small integers, count texts and containers.
+        return size + sum(_get_size(x, seen) for x in (
+            obj.main_text, obj.tran_text, obj._get_containers()))
+    return size
 
 
 class RevertableAction:
@@ -46,6 +71,7 @@ class RevertableAction:
         """
         self.description = None
         self.docs = None
+        self._nbytes = None
         self.register = None
         self.revert_args = ()
         self.revert_function = None
@@ -62,6 +88,15 @@ class RevertableAction:
         raise ValueError("Invalid register: {}"
                          .format(repr(self.register)))
 
+    @property
+    def nbytes(self):
+        """Return approximate memory used by reversion arguments in bytes."""
+        if self._nbytes is None:
+            seen = set()
+            self._nbytes = (_get_size(self.revert_args, seen) +
+                            _get_size(self.revert_kwargs, seen))
+        return self._nbytes
+
     def revert(self):
         """Call the reversion function."""
         kwargs = self.revert_kwargs.copy()
@@ -90,3 +125,99 @@ class RevertableActionGroup:
         self.description = None
         for key, value in kwargs.items():
             setattr(self, key, value)
+
+    @property
+    def nbytes(self):
+        """Return approximate memory used by actions in bytes."""
+        return sum(x.nbytes for x in self.actions)
+
+
+class RevertableActionStack:
+
+    """
+    Stack of :class:`RevertableAction` and :class:`RevertableActionGroup`.
+
+    The most recently registered item is at index zero. Items are kept in
+    a :class:`collections.deque`, which makes pushing and popping at either
+    end O(1), and the approximate total memory used by items is kept track
+    of in :attr:`nbytes`, which makes cutting to a memory limit cheap.
+
+    :ivar nbytes: Approximate memory used by items in bytes
+    """
+
+    def __init__(self, items=()):
+        """Initialize a :class:`RevertableActionStack` instance."""
+        self._items = collections.deque()
+        self.nbytes = 0
+        for item in items:
+            self.insert(len(self), item)
+
+    def __delitem__(self, index):
+        """Remove item(s) at `index`."""
+        if isinstance(index, slice):
+            for i in reversed(range(*index.indices(len(self)))):
+                self.pop(i)
+            return
+        self.pop(index)
+
+    def __getitem__(self, index):
+        """Return item(s) at `index`."""
+        if isinstance(index, slice):
+            return [self._items[i] for i in range(*index.indices(len(self)))]
+        return self._items[index]
+
+    def __iter__(self):
+        """Return an iterator over items, the most recent first."""
+        return iter(self._items)
+
+    def __len__(self):
+        """Return the amount of items."""
+        return len(self._items)
+
+    def clear(self):
+        """Remove all items."""
+        self._items.clear()
+        self.nbytes = 0
+
+    def cut(self, length=None, nbytes=None):
+        """
+        Remove the oldest items to not exceed `length` and `nbytes`.
+
+        Either limit can be ``None`` for no limit. The most recent item is
+        never removed to satisfy `nbytes`, since that would make the action
+        just done impossible to revert. Return the amount of items removed.
+        """
+        count = 0
+        while length is not None and len(self) > length:
+            self.pop(-1)
+            count += 1
+        while nbytes is not None and self.nbytes > nbytes and len(self) > 1:
+            self.pop(-1)
+            count += 1
+        return count
+
+    def insert(self, index, item):
+        """Insert `item` at `index`."""
+        if index == 0:
+            self._items.appendleft(item)
+        elif index >= len(self):
+            self._items.append(item)
+        else:
+            self._items.insert(index, item)
+        self.nbytes += item.nbytes
+
+    def pop(self, index=0):
+        """Remove and return item at `index`."""
+        if index == 0:
+            item = self._items.popleft()
+        elif index in (-1, len(self) - 1):
+            item = self._items.pop()
+        else:
+            item = self._items[index]
+            del self._items[index]
+        self.nbytes -= item.nbytes
+        return item
+
+    def push(self, item):
+        """Add `item` as the most recent item."""
+        self.insert(0, item)
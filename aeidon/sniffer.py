@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Detecting properties of subtitle files in a single read."""
+
+import aeidon
+import codecs
+import io
+import re
+import time
+
+__all__ = ("SniffResult", "sniff")
+
+# Amount of bytes to read at a time, enough to hold most subtitle
+# files in whole, in which case they need not be read again.
+CHUNK_SIZE = 1048576
+
+
+class _HeadReader(io.RawIOBase):
+
+    """Raw binary stream reading `head` before rest of file `f`."""
+
+    def __init__(self, head, f):
+        """Initialize a :class:`_HeadReader` instance."""
+        io.RawIOBase.__init__(self)
+        self._f = f
+        self._head = memoryview(head)
+        self._pos = 0
+
+    def close(self):
+        """Close the underlying file."""
+        self._f.close()
+        io.RawIOBase.close(self)
+
+    def readable(self):
+        """Return ``True``."""
+        return True
+
+    def readinto(self, b):
+        """Read bytes into `b` and return amount read."""
+        if self._pos < len(self._head):
+            n = min(len(b), len(self._head) - self._pos)
+            b[:n] = self._head[self._pos:self._pos+n]
+            self._pos += n
+            return n
+        return self._f.readinto(b)
+
+
+def _decode(data, encoding):
+    """Return `data` decoded with `encoding` or ``None`` if that fails."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    view = memoryview(data)
+    chunks = []
+    try:
+        # Decode in chunks to stop early at the first invalid byte.
+        for i in range(0, len(view), CHUNK_SIZE):
+            chunks.append(decoder.decode(view[i:i+CHUNK_SIZE]))
+        chunks.append(decoder.decode(b"", final=True))
+    except UnicodeError:
+        return None
+    return "".join(chunks)
+
+
+def _detect_format(lines):
+    """Return format of first of `lines` matching one or ``None``."""
+    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
+    for line in lines:
+        for format, re_id in re_ids:
+            if re_id.search(line) is not None:
+                return format
+    return None
+
+
+def _read_chunk(f):
+    """Read and return :data:`CHUNK_SIZE` bytes from raw file `f`."""
+    chunks = []
+    size = 0
+    while size < CHUNK_SIZE:
+        # Raw reads can return less than requested.
+        data = f.read(CHUNK_SIZE - size)
+        if not data: break
+        chunks.append(data)
+        size += len(data)
+    return b"".join(chunks)
+
+
+class SniffResult:
+
+    """
+    Properties of a subtitle file detected by :func:`sniff`.
+
+    :ivar attempts: List of encodings tried and seconds spent on each
+    :ivar bom_encoding: Encoding corresponding to BOM found or ``None``
+    :ivar complete: ``True`` if :attr:`head` contains the whole file
+    :ivar encoding: Character encoding to use to read the file
+    :ivar format: :attr:`aeidon.formats` item or ``None`` if not detected
+    :ivar head: Bytes read from the beginning of the file
+    :ivar newline: :attr:`aeidon.newlines` item or ``None`` if not detected
+    :ivar path: Full, absolute path to the file on disk
+    :ivar text: Whole file decoded with :attr:`encoding` or ``None``
+    """
+
+    def __init__(self, path):
+        """Initialize a :class:`SniffResult` instance."""
+        self.attempts = []
+        self.bom_encoding = None
+        self.complete = False
+        self.encoding = None
+        self.format = None
+        self.head = b""
+        self.newline = None
+        self.path = path
+        self.text = None
+
+    def open(self, encoding=None):
+        """
+        Return a text file object for reading the file from the beginning.
+
+        Bytes in :attr:`head` are not read from disk again. If the whole file
+        is in :attr:`head`, the file is not opened at all and if already
+        decoded to :attr:`text` with `encoding`, not decoded again.
+        Raise :exc:`IOError` if opening fails.
+        """
+        encoding = encoding or self.encoding
+        if self.text is not None and encoding == self.encoding:
+            return io.StringIO(self.text, newline=None)
+        if self.complete:
+            return io.TextIOWrapper(io.BytesIO(self.head), encoding)
+        f = open(self.path, "rb", buffering=0)
+        f.seek(len(self.head))
+        raw = _HeadReader(self.head, f)
+        return io.TextIOWrapper(io.BufferedReader(raw), encoding)
+
+
+def sniff(path, encoding=None):
+    """
+    Detect BOM, encoding, newlines and format of file at `path`.
+
+    `encoding` can be ``None`` to use the system default encoding. A BOM
+    found in the file overrides `encoding`. Chunks of :data:`CHUNK_SIZE`
+    bytes are read until format is detected and all bytes read are kept in
+    :attr:`SniffResult.head` to avoid reading them again.
+
+    `encoding` can also be a sequence of encodings to try in order, of which
+    ``"auto"`` detects encoding with :mod:`chardet` if available. The whole
+    file is then read once and candidates are tried by decoding those bytes
+    until the first that succeeds, which is kept as :attr:`SniffResult.text`
+    to avoid decoding again.
+
+    Raise :exc:`IOError` if reading fails.
+    Raise :exc:`UnicodeError` if decoding fails.
+    Return a :class:`SniffResult` instance.
+    """
+    if encoding is not None and not isinstance(encoding, str):
+        return _sniff_encodings(path, encoding)
+    result = SniffResult(path)
+    chunks = []
+    pending = ""
+    # Read unbuffered to not read more than needed.
+    with open(path, "rb", buffering=0) as f:
+        while result.format is None and not result.complete:
+            chunk = _read_chunk(f)
+            result.complete = len(chunk) < CHUNK_SIZE
+            if not chunks:
+                result.bom_encoding = aeidon.encodings.get_bom_encoding(chunk)
+                result.encoding = (result.bom_encoding or
+                                   encoding or
+                                   aeidon.util.get_default_encoding())
+
+                decoder = codecs.getincrementaldecoder(result.encoding)()
+            chunks.append(chunk)
+            text = pending + decoder.decode(chunk, final=result.complete)
+            if len(chunks) == 1:
+                text = text.lstrip("\ufeff")
+            stream = io.StringIO(text, newline=None)
+            lines = list(stream)
+            if result.newline is None:
+                result.newline = aeidon.util.get_newline(stream.newlines)
+            pending = ""
+            if lines and not result.complete:
+                # Last line can be incomplete, hold it until next chunk.
+                pending = lines.pop()
+            result.format = _detect_format(lines)
+    result.head = b"".join(chunks)
+    return result
+
+
+def _sniff_encodings(path, encodings):
+    """Return a :class:`SniffResult` trying `encodings` in order."""
+    result = SniffResult(path)
+    with open(path, "rb") as f:
+        result.head = f.read()
+    result.complete = True
+    result.bom_encoding = aeidon.encodings.get_bom_encoding(result.head)
+    if result.bom_encoding is not None:
+        encodings = [result.bom_encoding]
+    for encoding in encodings:
+        start = time.perf_counter()
+        if encoding == "auto":
+            if not aeidon.util.chardet_available(): continue
+            encoding = aeidon.encodings.detect_data(result.head)
+        text = (_decode(result.head, encoding)
+                if encoding is not None else None)
+        result.attempts.append((encoding, time.perf_counter() - start))
+        if text is None: continue
+        result.encoding = encoding
+        result.text = text
+        break
+    else:
+        raise UnicodeError("Failed to decode file {} with {}"
+                           .format(repr(path), repr(tuple(encodings))))
+    # Format is usually found near the beginning, look there first.
+    head = result.text[:CHUNK_SIZE].lstrip("\ufeff")
+    stream = io.StringIO(head, newline=None)
+    result.newline = aeidon.util.get_newline(stream.newlines)
+    result.format = _detect_format(stream)
+    if result.format is None and len(result.text) > CHUNK_SIZE:
+        result.format = _detect_format(io.StringIO(result.text))
+    return result
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Spell-checker with cached word checks and suggestions."""
+
+import collections
+import re
+
+__all__ = ("SpellChecker",)
+
+
+class SpellChecker:
+
+    """
+    Spell-checker with cached word checks and suggestions.
+
+    :ivar dictionary: :class:`enchant.Dict` instance used
+    :ivar hits: Amount of checks and suggestions found in cache
+    :ivar language: Language code for :attr:`dictionary`
+    :ivar misses: Amount of checks and suggestions not found in cache
+
+    Only one instance of :class:`SpellChecker` exists for a given language,
+    which allows everything checking spelling to share the same caches of
+    recently checked words and suggestions. Words in subtitles repeat a lot,
+    and suggestions in particular are slow to look up from dictionaries.
+    """
+
+    _check_limit = 10000
+    _instances = {}
+    _re_word = re.compile(r"\w+(?:['’]\w+)*")
+    _suggest_limit = 1000
+
+    def __new__(cls, language):
+        """
+        Return possibly existing instance for `language`.
+
+        Raise :exc:`enchant.Error` if dictionary instantiation fails.
+        """
+        if not language in cls._instances:
+            checker = object.__new__(cls)
+            checker._init_dictionary(language)
+            cls._instances[language] = checker
+        return cls._instances[language]
+
+    def add(self, word):
+        """Add `word` to the user's personal dictionary."""
+        self.dictionary.add(word)
+        self._checks[word] = True
+
+    def check(self, word):
+        """Return ``True`` if `word` is correctly spelled."""
+        if word in self._checks:
+            self._checks.move_to_end(word)
+            self.hits += 1
+            return self._checks[word]
+        self.misses += 1
+        self._checks[word] = self.dictionary.check(word)
+        while len(self._checks) > self._check_limit:
+            self._checks.popitem(last=False)
+        return self._checks[word]
+
+    def get_hit_rate(self):
+        """Return the fraction of checks and suggestions found in cache."""
+        total = self.hits + self.misses
+        return (self.hits / total if total > 0 else 0.0)
+
+    def _init_dictionary(self, language):
+        """Initialize dictionary and caches for `language`."""
+        import enchant
+        dictionary = enchant.Dict(language)
+        # Sometimes enchant will initialize a dictionary that will not
+        # actually work when trying to use it, hence check something.
+        dictionary.check("aeidon")
+        self._checks = collections.OrderedDict()
+        self._suggestions = collections.OrderedDict()
+        self.dictionary = dictionary
+        self.hits = 0
+        self.language = language
+        self.misses = 0
+
+    def split(self, text):
+        """Return a list of positions and words in `text`."""
+        return [(x.start(), x.group())
+                for x in self._re_word.finditer(text)
+                if not x.group().isdigit()]
+
+    def suggest(self, word):
+        """Return a list of suggestions for `word`."""
+        if word in self._suggestions:
+            self._suggestions.move_to_end(word)
+            self.hits += 1
+            return list(self._suggestions[word])
+        self.misses += 1
+        self._suggestions[word] = tuple(self.dictionary.suggest(word))
+        while len(self._suggestions) > self._suggest_limit:
+            self._suggestions.popitem(last=False)
+        return list(self._suggestions[word])
@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Columnar, array-backed storage of subtitle data."""
+
+import aeidon
+import array
+import collections.abc
+import copy
+import sys
+import weakref
+
+__all__ = ("StoredSubtitle", "SubtitleStore",)
+
+
+def _column_property(name):
+    """Return a property that reads and writes a column of the store."""
+    def fget(self):
+        if self._store is None:
+            return self._values[name]
+        return self._store._get_value(self._slot, name)
+    def fset(self, value):
+        if self._store is None:
+            self._values[name] = value
+        else:
+            self._store._set_value(self._slot, name, value)
+    return property(fget, fset)
+
+
+class StoredSubtitle(aeidon.Subtitle):
+
+    """
+    :class:`aeidon.Subtitle` view to a row of :class:`SubtitleStore`.
+
+    While attached, all reads and writes go directly to the columns of the
+    store. Once the row is removed from the store, the view is detached and
+    keeps a private copy of its values, i.e. it behaves like a plain
+    :class:`aeidon.Subtitle` and can be inserted back to a store later.
+    """
+
+    _start = _column_property("_start")
+    _end = _column_property("_end")
+    _main_text = _column_property("_main_text")
+    _tran_text = _column_property("_tran_text")
+    _mode = _column_property("_mode")
+    _framerate = _column_property("_framerate")
+
+    def __init__(self, store, slot):
+        """Initialize a :class:`StoredSubtitle` instance."""
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_slot", slot)
+        object.__setattr__(self, "_values", None)
+        object.__setattr__(self, "_exposed", False)
+        object.__setattr__(self, "_shared", False)
+        for name in self._container_names:
+            object.__setattr__(self, "_" + name, None)
+
+    def __setattr__(self, name, value):
+        """Set value of attribute, redirecting containers to the store."""
+        if self._store is not None and name in self._store._containers:
+            self._store._containers[name][self._slot] = value
+            return
+        return object.__setattr__(self, name, value)
+
+    def _attach(self, store, slot):
+        """Attach to `slot` of `store`, moving values to its columns."""
+        if self._shared:
+            # Copies might refer to the same containers.
+            self._unshare()
+        for name, container in self._get_containers():
+            store._containers[name][slot] = container
+            object.__setattr__(self, "_" + name, None)
+        object.__setattr__(self, "_store", store)
+        object.__setattr__(self, "_slot", slot)
+        object.__setattr__(self, "_values", None)
+
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance for framerate."""
+        return aeidon.Calculator(self._framerate)
+
+    @calc.setter
+    def calc(self, value):
+        """Ignore `value`, calculator is defined by framerate."""
+        pass
+
+    def copy(self):
+        """Return a new subtitle instance with the same values."""
+        if self._store is None:
+            return aeidon.Subtitle.copy(self)
+        subtitle = aeidon.Subtitle(self._mode, self._framerate)
+        subtitle._start = self._start
+        subtitle._end = self._end
+        subtitle._main_text = self._main_text
+        subtitle._tran_text = self._tran_text
+        # Containers in the store are not shared, but copied.
+        for name, container in self._get_containers():
+            setattr(subtitle, name, copy.copy(container))
+        return subtitle
+
+    def _detach(self):
+        """Detach from store, copying values to private storage."""
+        values = dict(_start=self._start,
+                      _end=self._end,
+                      _main_text=self._main_text,
+                      _tran_text=self._tran_text,
+                      _mode=self._mode,
+                      _framerate=self._framerate)
+
+        for name, container in self._get_containers():
+            object.__setattr__(self, "_" + name, container)
+        # Containers might have been handed out while attached.
+        object.__setattr__(self, "_exposed", True)
+        object.__setattr__(self, "_store", None)
+        object.__setattr__(self, "_slot", None)
+        object.__setattr__(self, "_values", values)
+
+    def _get_container(self, name):
+        """Return container `name`, instantiating it if needed."""
+        if self._store is None:
+            return aeidon.Subtitle._get_container(self, name)
+        containers = self._store._containers[name]
+        if not self._slot in containers:
+            containers[self._slot] = aeidon.containers.new(name)
+        return containers[self._slot]
+
+    def _get_containers(self):
+        """Return a list of names and instantiated containers."""
+        if self._store is None:
+            return aeidon.Subtitle._get_containers(self)
+        return [(name, x[self._slot])
+                for name, x in self._store._containers.items()
+                if self._slot in x]
+
+    def has_container(self, name):
+        """Return ``True`` if container has been instantiated."""
+        if self._store is not None and name in self._store._containers:
+            return self._slot in self._store._containers[name]
+        return aeidon.Subtitle.has_container(self, name)
+
+
+class SubtitleStore(collections.abc.MutableSequence):
+
+    """
+    Columnar, array-backed storage of subtitle data.
+
+    :class:`SubtitleStore` is a mutable sequence that can be used in place of
+    a list of :class:`aeidon.Subtitle` instances, e.g. as
+    :attr:`aeidon.Project.subtitles`. Positions are stored in contiguous
+    integer arrays, as milliseconds for time-based and as frames for
+    frame-based subtitles. Texts are stored in lists of interned strings and
+    format-specific containers in sparse mappings of only those rows that
+    have them instantiated.
+
+    Items are :class:`StoredSubtitle` views to the columns, instantiated upon
+    access and kept only as long as referenced elsewhere. The same view
+    instance is returned for a row as long as it exists. Removing a row
+    detaches possible existing views from the store.
+    """
+
+    def __init__(self, subtitles=()):
+        """Initialize a :class:`SubtitleStore` instance."""
+        self._containers = {}
+        self._ends = array.array("q")
+        self._framerate_table = []
+        self._framerates = array.array("B")
+        self._free_slots = []
+        self._main_texts = []
+        self._modes = array.array("B")
+        self._order = array.array("q")
+        self._starts = array.array("q")
+        self._tran_texts = []
+        self._views = weakref.WeakValueDictionary()
+        for format in aeidon.formats:
+            if format.container is not None:
+                self._containers[format.container] = {}
+        self.extend(subtitles)
+
+    def __delitem__(self, index):
+        """Remove subtitle at `index`."""
+        if isinstance(index, slice):
+            for i in sorted(range(*index.indices(len(self))), reverse=True):
+                del self[i]
+            return
+        index = self._normalize_index(index)
+        slot = self._order.pop(index)
+        self._release_slot(slot)
+
+    def __eq__(self, other):
+        """Compare subtitles equality by value."""
+        if not isinstance(other, (list, SubtitleStore)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __getitem__(self, index):
+        """Return subtitle view at `index`."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        slot = self._order[self._normalize_index(index)]
+        return self._get_view(slot)
+
+    def __iter__(self):
+        """Iterate over subtitle views."""
+        for slot in self._order:
+            yield self._get_view(slot)
+
+    def __len__(self):
+        """Return the amount of subtitles."""
+        return len(self._order)
+
+    def __setitem__(self, index, subtitle):
+        """Replace subtitle at `index` with `subtitle`."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            if index.step not in (None, 1):
+                for i, value in zip(indices, list(subtitle)):
+                    self[i] = value
+                return
+            return self._splice(indices.start,
+                                max(indices.start, indices.stop),
+                                list(subtitle))
+
+        index = self._normalize_index(index)
+        old_slot = self._order[index]
+        if self._views.get(old_slot) is subtitle: return
+        self._order[index] = self._write_slot(subtitle)
+        self._release_slot(old_slot)
+
+    def _allocate_slot(self):
+        """Return index of a free slot in the columns."""
+        if self._free_slots:
+            return self._free_slots.pop()
+        self._starts.append(0)
+        self._ends.append(0)
+        self._modes.append(0)
+        self._framerates.append(0)
+        self._main_texts.append("")
+        self._tran_texts.append("")
+        return len(self._starts) - 1
+
+    def _convert_position(self, slot, value, mode_in, mode_out):
+        """Return `value` of row at `slot` converted between modes."""
+        if mode_in == mode_out: return value
+        framerate = self._framerate_table[self._framerates[slot]]
+        calc = aeidon.Calculator(framerate)
+        if mode_out == aeidon.modes.TIME:
+            return calc.frame_to_ms(value)
+        if mode_out == aeidon.modes.FRAME:
+            return calc.ms_to_frame(value)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(mode_out)))
+
+    def _get_framerate_index(self, framerate):
+        """Return index of `framerate` in the table of framerates."""
+        try:
+            return self._framerate_table.index(framerate)
+        except ValueError:
+            self._framerate_table.append(framerate)
+            return len(self._framerate_table) - 1
+
+    def get_positions(self, indices=None, mode=None):
+        """
+        Return arrays of start and end positions at `indices`.
+
+        `indices` can be ``None`` to return positions of all subtitles.
+        Positions are integers, milliseconds for time mode and frames for
+        frame mode. `mode` can be ``None`` to return the positions of each
+        row in its own mode.
+        """
+        if indices is None:
+            indices = range(len(self))
+        slots = [self._order[i] for i in indices]
+        starts = array.array("q", [self._starts[x] for x in slots])
+        ends = array.array("q", [self._ends[x] for x in slots])
+        if mode is None:
+            return starts, ends
+        for i, slot in enumerate(slots):
+            row_mode = aeidon.modes[self._modes[slot]]
+            if row_mode == mode: continue
+            starts[i] = self._convert_position(slot, starts[i], row_mode, mode)
+            ends[i] = self._convert_position(slot, ends[i], row_mode, mode)
+        return starts, ends
+
+    def get_texts(self, doc, indices=None):
+        """
+        Return a list of texts of `doc` at `indices`.
+
+        `indices` can be ``None`` to return texts of all subtitles.
+        """
+        if indices is None:
+            indices = range(len(self))
+        texts = self._get_text_column(doc)
+        return [texts[self._order[i]] for i in indices]
+
+    def _get_text_column(self, doc):
+        """Return text column corresponding to `doc`."""
+        if doc == aeidon.documents.MAIN:
+            return self._main_texts
+        if doc == aeidon.documents.TRAN:
+            return self._tran_texts
+        raise ValueError("Invalid document: {}"
+                         .format(repr(doc)))
+
+    def _get_value(self, slot, name):
+        """Return value of field `name` of row at `slot`."""
+        if name == "_start":
+            return self._starts[slot]
+        if name == "_end":
+            return self._ends[slot]
+        if name == "_main_text":
+            return self._main_texts[slot]
+        if name == "_tran_text":
+            return self._tran_texts[slot]
+        if name == "_mode":
+            return aeidon.modes[self._modes[slot]]
+        if name == "_framerate":
+            return self._framerate_table[self._framerates[slot]]
+        raise ValueError("Invalid name: {}"
+                         .format(repr(name)))
+
+    def _get_view(self, slot):
+        """Return the view corresponding to row at `slot`."""
+        view = self._views.get(slot)
+        if view is not None: return view
+        view = StoredSubtitle(self, slot)
+        self._views[slot] = view
+        return view
+
+    def insert(self, index, subtitle):
+        """Insert `subtitle` at `index`."""
+        index = min(max(0, index + len(self) if index < 0 else index),
+                    len(self))
+
+        self._order.insert(index, self._write_slot(subtitle))
+
+    def _normalize_index(self, index):
+        """Return non-negative `index` or raise :exc:`IndexError`."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range: {}"
+                             .format(repr(index)))
+
+        return index
+
+    @property
+    def nbytes(self):
+        """Return the approximate size of the columns in bytes."""
+        texts = self._main_texts + self._tran_texts
+        texts = dict((id(x), x) for x in texts).values()
+        return sum((self._order.itemsize * len(self._order),
+                    self._starts.itemsize * len(self._starts),
+                    self._ends.itemsize * len(self._ends),
+                    self._modes.itemsize * len(self._modes),
+                    self._framerates.itemsize * len(self._framerates),
+                    sys.getsizeof(self._main_texts),
+                    sys.getsizeof(self._tran_texts),
+                    sum(map(sys.getsizeof, texts))))
+
+    def _release_slot(self, slot):
+        """Mark `slot` free, detaching its possible view."""
+        view = self._views.pop(slot, None)
+        if view is not None:
+            view._detach()
+        for containers in self._containers.values():
+            containers.pop(slot, None)
+        self._main_texts[slot] = ""
+        self._tran_texts[slot] = ""
+        self._free_slots.append(slot)
+
+    def set_framerate(self, framerate):
+        """Set `framerate` of all subtitles."""
+        index = self._get_framerate_index(framerate)
+        self._framerates = array.array("B", [index] * len(self._framerates))
+
+    def set_positions(self, indices, starts, ends, mode=None):
+        """
+        Set start and end positions at `indices`.
+
+        `starts` and `ends` should be sequences of integers of the same units
+        as returned by :meth:`get_positions` for `mode`.
+        """
+        for i, index in enumerate(indices):
+            slot = self._order[index]
+            start, end = starts[i], ends[i]
+            if mode is not None:
+                row_mode = aeidon.modes[self._modes[slot]]
+                start = self._convert_position(slot, start, mode, row_mode)
+                end = self._convert_position(slot, end, mode, row_mode)
+            self._starts[slot] = start
+            self._ends[slot] = end
+
+    def set_texts(self, doc, indices, texts):
+        """Set texts of `doc` at `indices` to `texts`."""
+        column = self._get_text_column(doc)
+        for i, index in enumerate(indices):
+            column[self._order[index]] = sys.intern(texts[i])
+
+    def _set_value(self, slot, name, value):
+        """Set value of field `name` of row at `slot`."""
+        if name == "_start":
+            self._starts[slot] = value
+        elif name == "_end":
+            self._ends[slot] = value
+        elif name == "_main_text":
+            self._main_texts[slot] = sys.intern(value)
+        elif name == "_tran_text":
+            self._tran_texts[slot] = sys.intern(value)
+        elif name == "_mode":
+            self._modes[slot] = value
+        elif name == "_framerate":
+            self._framerates[slot] = self._get_framerate_index(value)
+        else:
+            raise ValueError("Invalid name: {}"
+                             .format(repr(name)))
+
+    def _splice(self, start, stop, subtitles):
+        """Replace rows from `start` to `stop` with `subtitles` at once."""
+        old_slots = set(self._order[start:stop])
+        new_slots = [None] * len(subtitles)
+        for i, subtitle in enumerate(subtitles):
+            # Keep rows whose views are put back in the same range.
+            if (isinstance(subtitle, StoredSubtitle) and
+                subtitle._store is self and
+                subtitle._slot in old_slots):
+                new_slots[i] = subtitle._slot
+                old_slots.discard(subtitle._slot)
+        for slot in old_slots:
+            self._release_slot(slot)
+        for i, subtitle in enumerate(subtitles):
+            if new_slots[i] is not None: continue
+            new_slots[i] = self._write_slot(subtitle)
+        self._order[start:stop] = array.array("q", new_slots)
+
+    def _write_slot(self, subtitle):
+        """Write values of `subtitle` to a free slot and return slot."""
+        slot = self._allocate_slot()
+        self._modes[slot] = subtitle.mode
+        self._framerates[slot] = self._get_framerate_index(subtitle.framerate)
+        self._starts[slot] = subtitle._start
+        self._ends[slot] = subtitle._end
+        self._main_texts[slot] = sys.intern(subtitle.main_text)
+        self._tran_texts[slot] = sys.intern(subtitle.tran_text)
+        if (isinstance(subtitle, StoredSubtitle) and
+            subtitle._store is None):
+            # Reattach a previously removed view to keep identity.
+            subtitle._attach(self, slot)
+            self._views[slot] = subtitle
+            return slot
+        # Rows of a store must not share containers, which would happen
+        # if writing a view still attached to this or another store.
+        attached = (isinstance(subtitle, StoredSubtitle) and
+                    subtitle._store is not None)
+        for name, containers in self._containers.items():
+            if subtitle.has_container(name):
+                container = getattr(subtitle, name)
+                if attached:
+                    container = copy.copy(container)
+                containers[slot] = container
+        return slot
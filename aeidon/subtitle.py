@@ -18,11 +18,26 @@
 """Data store and basic position manipulation of a single subtitle."""
 
 import aeidon
-import copy
 
 __all__ = ("Subtitle",)
 
 
+def _container_property(name):
+    """Return a property for lazily instantiated container `name`."""
+    def fget(self):
+        return self._get_container(name)
+    def fset(self, value):
+        self._set_container(name, value)
+    return property(fget, fset)
+
+def _copy_container(container):
+    """Return a shallow copy of `container`."""
+    # Faster than copy.copy, containers are plain instances.
+    new = object.__new__(container.__class__)
+    new.__dict__.update(container.__dict__)
+    return new
+
+
 class Subtitle:
 
     """
@@ -32,10 +47,12 @@ class Subtitle:
     :ivar start_time: Start time as string
     :ivar start_frame: Start frame as integer
     :ivar start_seconds: Start seconds as float
+    :ivar start_ms: Start milliseconds as integer, read-only
     :ivar end: End position in native units
     :ivar end_time: End time as string
     :ivar end_frame: End frame as integer
     :ivar end_seconds: End seconds as float
+    :ivar end_ms: End milliseconds as integer, read-only
     :ivar duration: Duration in native units
     :ivar duration_time: Duration in time as string
     :ivar duration_frame: Duration in frames as integer
@@ -50,45 +67,65 @@ class Subtitle:
     Use :func:`aeidon.as_time`, :func:`aeidon.as_frame` or
     :func:`aeidon.as_seconds` if necessary to ensure correct type.
 
+    Positions are stored internally as integers, milliseconds for time mode
+    and frames for frame mode, and converted to strings only when accessed
+    as times, e.g. when writing a file or displaying positions.
+
     Additional format-specific attributes are kept under separate containers,
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
     instantiation and excessive memory use when handling simpler formats.
+    Copies share containers with the original until either one accesses
+    them, at which point that subtitle gets containers of its own. If the
+    original has already handed out its containers, copies get containers
+    of their own right away, since those can be changed via references held
+    elsewhere, e.g. ``ssa = subtitle.ssa``.
     """
 
+    __slots__ = ("_end",
+                 "_exposed",
+                 "_framerate",
+                 "_main_text",
+                 "_mode",
+                 "_shared",
+                 "_ssa",
+                 "_start",
+                 "_subrip",
+                 "_tran_text",
+                 "_webvtt",
+                 "calc")
+
+    _container_names = ("ssa", "subrip", "webvtt")
+    ssa = _container_property("ssa")
+    subrip = _container_property("subrip")
+    webvtt = _container_property("webvtt")
+
     def __init__(self, mode=None, framerate=None):
         """Initialize a :class:`Subtitle` instance."""
-        self._start = None
-        self._end = None
+        self._start = 0
+        self._end = 0
         self._main_text = ""
         self._tran_text = ""
         self._mode = mode or aeidon.modes.TIME
         self._framerate = framerate or aeidon.framerates.FPS_23_976
+        self._ssa = None
+        self._subrip = None
+        self._webvtt = None
+        self._exposed = False
+        self._shared = False
         self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
         if not isinstance(other, Subtitle):
             raise NotImplementedError
-        return (self.start == other.start and
-                self.end == other.end and
+        return (self._start == other._start and
+                self._end == other._end and
                 self.main_text == other.main_text and
                 self.tran_text == other.tran_text and
                 self.framerate == other.framerate and
                 self.mode == other.mode)
 
-    def __getattr__(self, name):
-        """Return lazily instantiated format-specific attribute container."""
-        if name in (x.container for x in aeidon.formats):
-            # Lazily instantiate a new container.
-            container = aeidon.containers.new(name)
-            object.__setattr__(self, name, container)
-            return container
-        raise AttributeError("Invalid container name: {}"
-                             .format(repr(name)))
-
     def __ge__(self, other):
         """Compare start positions."""
         if self._mode == aeidon.modes.TIME:
@@ -129,45 +166,45 @@ class Subtitle:
         """Set framerate and convert positions to it."""
         coefficient = framerate.value / self._framerate.value
         if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds / coefficient
-            self.end_seconds = self.end_seconds / coefficient
+            self._start = int(round(self._start / coefficient))
+            self._end = int(round(self._end / coefficient))
         if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(coefficient * self.start_frame)
-            self.end_frame = round(coefficient * self.end_frame)
+            self._start = int(round(coefficient * self._start))
+            self._end = int(round(coefficient * self._end))
         self.framerate = framerate
 
     def _convert_position(self, value):
-        """Return `value` of position in correct mode."""
-        if aeidon.is_time(value):
-            if self._mode == aeidon.modes.TIME:
-                return value
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.time_to_frame(value)
-        if aeidon.is_frame(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.frame_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return value
-        if aeidon.is_seconds(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.seconds_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.seconds_to_frame(value)
-        raise ValueError("Invalid type for value: {}"
-                         .format(repr(type(value))))
+        """Return `value` of position in internal units of correct mode."""
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.to_ms(value)
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.to_frame(value)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     def copy(self):
         """Return a new subtitle instance with the same values."""
-        subtitle = Subtitle(self._mode, self._framerate)
+        subtitle = Subtitle.__new__(Subtitle)
         subtitle._start = self._start
         subtitle._end = self._end
         subtitle._main_text = self._main_text
         subtitle._tran_text = self._tran_text
-        # Copy all containers that have been instantiated.
-        containers = (x.container for x in aeidon.formats)
-        for name in set(dir(self)) & set(containers):
-            container = copy.deepcopy(getattr(self, name))
-            setattr(subtitle, name, container)
+        subtitle._mode = self._mode
+        subtitle._framerate = self._framerate
+        subtitle._ssa = self._ssa
+        subtitle._subrip = self._subrip
+        subtitle._webvtt = self._webvtt
+        subtitle.calc = self.calc
+        subtitle._exposed = False
+        subtitle._shared = False
+        if self._exposed:
+            # Containers handed out could be changed via outside
+            # references after copying, which must not show in the copy.
+            subtitle._unshare()
+            return subtitle
+        # Share containers until either subtitle accesses them.
+        subtitle._shared = bool(self._ssa or self._subrip or self._webvtt)
+        self._shared = self._shared or subtitle._shared
         return subtitle
 
     @property
@@ -183,12 +220,13 @@ class Subtitle:
     @duration.setter
     def duration(self, value):
         """Set duration from `value`."""
-        value = self._convert_position(value)
-        self._end = self.calc.add(self._start, value)
+        self._end = self._start + self._convert_position(value)
 
     @property
     def duration_frame(self):
         """Return duration as frames."""
+        if self._mode == aeidon.modes.FRAME:
+            return self._end - self._start
         return self.end_frame - self.start_frame
 
     @duration_frame.setter
@@ -209,7 +247,7 @@ class Subtitle:
     @property
     def duration_time(self):
         """Return duration as time."""
-        return self.calc.seconds_to_time(self.duration_seconds)
+        return self.calc.ms_to_time(self.end_ms - self.start_ms)
 
     @duration_time.setter
     def duration_time(self, value):
@@ -219,7 +257,12 @@ class Subtitle:
     @property
     def end(self):
         """Return end position in correct mode."""
-        return self._end
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.ms_to_time(self._end)
+        if self._mode == aeidon.modes.FRAME:
+            return self._end
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     @end.setter
     def end(self, value):
@@ -230,7 +273,7 @@ class Subtitle:
     def end_frame(self):
         """Return end position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._end)
+            return self.calc.ms_to_frame(self._end)
         if self._mode == aeidon.modes.FRAME:
             return self._end
         raise ValueError("Invalid mode: {}"
@@ -241,10 +284,20 @@ class Subtitle:
         """Set end position from `value`."""
         self.end = aeidon.as_frame(value)
 
+    @property
+    def end_ms(self):
+        """Return end position as milliseconds."""
+        if self._mode == aeidon.modes.TIME:
+            return self._end
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_ms(self._end)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
+
     @property
     def end_seconds(self):
         """Return end position as seconds."""
-        return self.calc.time_to_seconds(self.end_time)
+        return self.end_ms / 1000
 
     @end_seconds.setter
     def end_seconds(self, value):
@@ -254,12 +307,7 @@ class Subtitle:
     @property
     def end_time(self):
         """Return end position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._end
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._end)
-        raise ValueError("Invalid mode: {}"
-                         .format(repr(self._mode)))
+        return self.calc.ms_to_time(self.end_ms)
 
     @end_time.setter
     def end_time(self, value):
@@ -277,6 +325,23 @@ class Subtitle:
         self._framerate = value
         self.calc = aeidon.Calculator(value)
 
+    def _get_container(self, name):
+        """Return container `name`, instantiating it if needed."""
+        if self._shared:
+            self._unshare()
+        container = getattr(self, "_" + name)
+        if container is None:
+            container = aeidon.containers.new(name)
+            setattr(self, "_" + name, container)
+        self._exposed = True
+        return container
+
+    def _get_containers(self):
+        """Return a list of names and instantiated containers."""
+        containers = [(x, getattr(self, "_" + x))
+                      for x in self._container_names]
+        return [x for x in containers if x[1] is not None]
+
     def get_duration(self, mode):
         """Return duration in `mode`."""
         if mode == aeidon.modes.TIME:
@@ -315,7 +380,7 @@ class Subtitle:
 
     def has_container(self, name):
         """Return ``True`` if container has been instantiated."""
-        return name in dir(self)
+        return getattr(self, "_" + name, None) is not None
 
     @property
     def main_text(self):
@@ -336,21 +401,22 @@ class Subtitle:
     def mode(self, mode):
         """Set current position mode."""
         if mode == aeidon.modes.TIME:
-            self._start = self.start_time
-            self._end = self.end_time
+            self._start, self._end = self.start_ms, self.end_ms
         if mode == aeidon.modes.FRAME:
-            self._start = self.start_frame
-            self._end = self.end_frame
+            self._start, self._end = self.start_frame, self.end_frame
         self._mode = mode
 
     def scale_positions(self, value):
         """Multiply start and end positions by `value`."""
-        if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds * value
-            self.end_seconds = self.end_seconds * value
-        if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(self._start * value)
-            self.end_frame = round(self._end * value)
+        self._start = int(round(self._start * value))
+        self._end = int(round(self._end * value))
+
+    def _set_container(self, name, value):
+        """Set container `name` to `value`."""
+        if self._shared:
+            self._unshare()
+        setattr(self, "_" + name, value)
+        self._exposed = True
 
     def set_text(self, doc, value):
         """Set text corresponding to `doc` to `value`."""
@@ -361,13 +427,19 @@ class Subtitle:
 
     def shift_positions(self, value):
         """Add `value` to start and end positions."""
-        self._start = self.calc.add(self._start, value)
-        self._end = self.calc.add(self._end, value)
+        value = self._convert_position(value)
+        self._start += value
+        self._end += value
 
     @property
     def start(self):
         """Return start position in correct mode."""
-        return self._start
+        if self._mode == aeidon.modes.TIME:
+            return self.calc.ms_to_time(self._start)
+        if self._mode == aeidon.modes.FRAME:
+            return self._start
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
 
     @start.setter
     def start(self, value):
@@ -378,7 +450,7 @@ class Subtitle:
     def start_frame(self):
         """Return start position as frames."""
         if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._start)
+            return self.calc.ms_to_frame(self._start)
         if self._mode == aeidon.modes.FRAME:
             return self._start
         raise ValueError("Invalid mode: {}"
@@ -389,10 +461,20 @@ class Subtitle:
         """Set start position from `value`."""
         self.start = aeidon.as_frame(value)
 
+    @property
+    def start_ms(self):
+        """Return start position as milliseconds."""
+        if self._mode == aeidon.modes.TIME:
+            return self._start
+        if self._mode == aeidon.modes.FRAME:
+            return self.calc.frame_to_ms(self._start)
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self._mode)))
+
     @property
     def start_seconds(self):
         """Return start position as seconds."""
-        return self.calc.time_to_seconds(self.start_time)
+        return self.start_ms / 1000
 
     @start_seconds.setter
     def start_seconds(self, value):
@@ -402,12 +484,7 @@ class Subtitle:
     @property
     def start_time(self):
         """Return start position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._start
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._start)
-        raise ValueError("Invalid mode: {}"
-                         .format(repr(self._mode)))
+        return self.calc.ms_to_time(self.start_ms)
 
     @start_time.setter
     def start_time(self, value):
@@ -423,3 +500,9 @@ class Subtitle:
     def tran_text(self, value):
         """Set translation text from `value`."""
         self._tran_text = value
+
+    def _unshare(self):
+        """Copy containers shared with other subtitles."""
+        for name, container in self._get_containers():
+            setattr(self, "_" + name, _copy_container(container))
+        self._shared = False
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+import shutil
+import tempfile
+
+
+class TestModule(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.directory = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.directory, "output")
+        self.paths = []
+        for i, format in enumerate((aeidon.formats.SUBRIP,
+                                    aeidon.formats.MICRODVD,
+                                    aeidon.formats.SUBRIP)):
+
+            path = os.path.join(self.directory,
+                                "sub", "{:d}{}".format(i, format.extension))
+
+            aeidon.util.makedirs(os.path.dirname(path))
+            shutil.copyfile(self.new_temp_file(format), path)
+            self.paths.append(path)
+
+    def teardown_method(self, method):
+        shutil.rmtree(self.directory)
+
+    def run_convert(self, *args, processes=1):
+        args = self.paths + ["-o", self.output_dir, "-e", "ascii"] + list(args)
+        options = aeidon.batch.parse_args(args)
+        return list(aeidon.batch.convert(self.paths, options, processes))
+
+    def test_convert(self):
+        results = self.run_convert("--shift", "1", "-f", "webvtt")
+        assert all(x.error is None for x in results)
+        assert all(x.count > 0 for x in results)
+        for result in results:
+            assert result.out_path.startswith(self.output_dir)
+            assert result.out_path.endswith(".vtt")
+            assert os.path.isfile(result.out_path)
+
+    def test_convert__error(self):
+        with open(self.paths[1], "w") as f:
+            f.write("not a subtitle file\n")
+        results = self.run_convert("--correct-errors", processes=2)
+        results = sorted(results, key=lambda x: x.path)
+        assert results[0].error is None
+        assert results[1].error is not None
+        assert results[2].error is None
+
+    def test_convert__overwrite(self):
+        directory = os.path.dirname(self.paths[0])
+        with open(self.paths[0], "rb") as f:
+            text = f.read()
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            path = os.path.basename(self.paths[0])
+            options = aeidon.batch.parse_args([path, "--shift", "1", "-o", "."])
+            results = list(aeidon.batch.convert([path], options, 1))
+        finally:
+            os.chdir(cwd)
+        assert results[0].error is not None
+        with open(self.paths[0], "rb") as f:
+            assert f.read() == text
+
+    def test_convert__operations(self):
+        results = self.run_convert("--shift", "1",
+                                   "--framerate", "23.976:25",
+                                   "--break-lines",
+                                   "--correct-errors",
+                                   "-f", "subrip",
+                                   processes=2)
+
+        assert all(x.error is None for x in results)
+        project = aeidon.Project()
+        project.open_main(self.paths[0], "ascii")
+        start = project.subtitles[0].start_seconds
+        project.open_main(results[0].out_path, "ascii")
+        assert project.subtitles[0].start_seconds > start
+
+    def test_find_files(self):
+        paths = aeidon.batch.find_files([self.directory])
+        assert paths == sorted(self.paths)
+
+    def test_find_files__glob(self):
+        pattern = os.path.join(self.directory, "**", "*.srt")
+        paths = aeidon.batch.find_files([pattern])
+        assert paths == [self.paths[0], self.paths[2]]
+
+    def test_main(self):
+        args = self.paths + ["-o", self.output_dir, "-q", "-j", "1"]
+        assert aeidon.batch.main(args) == 0
+
+    def test_parse_args(self):
+        options = aeidon.batch.parse_args(["--break-lines",
+                                           "--shift", "-1.5",
+                                           "--framerate", "25:23.976",
+                                           "x.srt"])
+
+        assert options.operations == [
+            ("break_lines", []),
+            ("shift", -1.5),
+            ("framerate", ("FPS_25_000", "FPS_23_976")),
+        ]
@@ -44,6 +44,10 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.add("00:00:10.000",
                              "00:00:10.000") == "00:00:20.000"
 
+    def test_frame_to_ms(self):
+        calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert calc.frame_to_ms(127) == 5080
+
     def test_frame_to_seconds(self):
         calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert calc.frame_to_seconds(127) == 5.08
@@ -99,6 +103,17 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.is_valid_time("12:34:56.789")
         assert self.calc.is_valid_time("-12:34:56.789")
 
+    def test_ms_to_frame(self):
+        assert self.calc.ms_to_frame(6552000) == 157091
+
+    def test_ms_to_seconds(self):
+        assert self.calc.ms_to_seconds(13522117) == 13522.117
+
+    def test_ms_to_time(self):
+        assert self.calc.ms_to_time(68951154) == "19:09:11.154"
+        assert self.calc.ms_to_time(-1500) == "-00:00:01.500"
+        assert self.calc.ms_to_time(10**9) == "99:59:59.999"
+
     def test_normalize_time(self):
         assert self.calc.normalize_time("1:2:3.4") == "01:02:03.400"
         assert self.calc.normalize_time("-1:2:3,4") == "-01:02:03.400"
@@ -113,15 +128,35 @@ class TestCalculator(aeidon.TestCase):
     def test_round__time(self):
         assert self.calc.round("12:34:56.789", 1) == "12:34:56.800"
 
+    def test_round__time__half(self):
+        assert self.calc.round("00:00:04.635", 2) == "00:00:04.640"
+        assert self.calc.round("00:00:14.445", 2) == "00:00:14.450"
+        assert self.calc.round("-00:00:14.445", 2) == "-00:00:14.450"
+
+    def test_round_ms(self):
+        assert self.calc.round_ms(4635, 2) == 4640
+        assert self.calc.round_ms(14445, 2) == 14450
+        assert self.calc.round_ms(-14445, 2) == -14450
+        assert self.calc.round_ms(14499, 0) == 14000
+        assert self.calc.round_ms(14500, 0) == 15000
+        assert self.calc.round_ms(14445, 3) == 14445
+
     def test_seconds_to_frame(self):
         assert self.calc.seconds_to_frame(6552) == 157091
 
+    def test_seconds_to_ms(self):
+        assert self.calc.seconds_to_ms(68951.15388) == 68951154
+
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
+    def test_time_to_ms(self):
+        assert self.calc.time_to_ms("03:45:22.117") == 13522117
+        assert self.calc.time_to_ms("-00:00:01.500") == -1500
+
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
@@ -131,6 +166,12 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.to_frame(25) == 25
         assert self.calc.to_frame(1.0) == 25
 
+    def test_to_ms(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_ms("00:00:01.000") == 1000
+        assert self.calc.to_ms(25) == 1000
+        assert self.calc.to_ms(1.0) == 1000
+
     def test_to_seconds(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_seconds("00:00:01.000") == 1.0
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import random
+
+
+class TestChangeBatch(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.batch = aeidon.ChangeBatch(10)
+
+    def test_add(self):
+        self.batch.add("main-texts-changed", (3, 1))
+        self.batch.add("main-texts-changed", [1, 5])
+        self.batch.add("positions-changed", (2,))
+        assert self.batch.get_signals() == [
+            ("positions-changed", [range(2, 3)]),
+            ("main-texts-changed", [range(1, 2), range(3, 4), range(5, 6)]),
+        ]
+
+    def test_add__insert(self):
+        self.batch.add("main-texts-changed", (1, 5))
+        self.batch.add("subtitles-inserted", (0, 5))
+        self.batch.add("subtitles-inserted", (0,))
+        assert self.batch.get_signals() == [
+            ("subtitles-inserted", [range(0, 2), range(6, 7)]),
+            ("main-texts-changed", [range(3, 4), range(8, 9)]),
+        ]
+
+    def test_add__move(self):
+        self.batch.add("main-texts-changed", (3, 5))
+        self.batch.add("subtitles-moved", [3, 0, 1, 2] + list(range(4, 10)))
+        self.batch.add("subtitles-removed", (1,))
+        self.batch.add("subtitles-inserted", (0,))
+        assert self.batch.get_signals() == [
+            ("subtitles-removed", [range(0, 1)]),
+            ("subtitles-moved", [2, 0, 1] + list(range(3, 9))),
+            ("subtitles-inserted", [range(0, 1)]),
+            ("main-texts-changed", [range(1, 2), range(5, 6)]),
+        ]
+
+    def test_add__move_back(self):
+        order = [3, 0, 1, 2] + list(range(4, 10))
+        self.batch.add("subtitles-moved", order)
+        self.batch.add("subtitles-moved", [1, 2, 3, 0] + list(range(4, 10)))
+        assert self.batch.get_signals() == []
+
+    def test_add__move_remove_insert(self):
+        self.batch.add("subtitles-removed", (3,))
+        self.batch.add("subtitles-inserted", (0,))
+        self.batch.add("positions-changed", (0,))
+        assert self.batch.get_signals() == [
+            ("subtitles-removed", [range(3, 4)]),
+            ("subtitles-inserted", [range(0, 1)]),
+            ("positions-changed", [range(0, 1)]),
+        ]
+
+    def test_add__notify(self):
+        self.batch.add("notify::subtitles", [])
+        self.batch.add("notify::main_changed", 1)
+        self.batch.add("notify::subtitles", [])
+        assert self.batch.get_signals() == []
+        assert self.batch.get_notify_signals() == [
+            "notify::subtitles", "notify::main_changed"]
+
+    def test_add__random(self):
+        # Apply signals to a copy of original items
+        # and check that the result matches changes.
+        items = [[i, False] for i in range(10)]
+        original = [list(x) for x in items]
+        for i in range(100):
+            choice = random.choice(("insert", "remove", "move", "change"))
+            if choice == "insert":
+                indices = sorted(random.sample(range(len(items) + 3), 3))
+                for index in indices:
+                    items.insert(index, [-1, False])
+                self.batch.add("subtitles-inserted", indices)
+            if choice == "remove" and len(items) > 3:
+                indices = random.sample(range(len(items)), 3)
+                for index in sorted(indices, reverse=True):
+                    items.pop(index)
+                self.batch.add("subtitles-removed", indices)
+            if choice == "move":
+                order = list(range(len(items)))
+                random.shuffle(order)
+                items = [items[i] for i in order]
+                self.batch.add("subtitles-moved", order)
+            if choice == "change" and items:
+                index = random.randrange(len(items))
+                items[index][1] = True
+                self.batch.add("main-texts-changed", (index,))
+        copy = [list(x) for x in original]
+        for signal, ranges in self.batch.get_signals():
+            if signal == "subtitles-removed":
+                for rows in reversed(ranges):
+                    for index in reversed(rows):
+                        copy.pop(index)
+            if signal == "subtitles-moved":
+                copy = [copy[i] for i in ranges]
+            if signal == "subtitles-inserted":
+                for rows in ranges:
+                    for index in rows:
+                        copy.insert(index, list(items[index]))
+            if signal == "main-texts-changed":
+                for rows in ranges:
+                    for index in rows:
+                        copy[index] = list(items[index])
+        assert copy == items
+
+    def test_add__remove(self):
+        self.batch.add("main-texts-changed", (1, 3, 5))
+        self.batch.add("subtitles-removed", (3, 4))
+        self.batch.add("subtitles-removed", (0,))
+        assert self.batch.get_signals() == [
+            ("subtitles-removed", [range(0, 1), range(3, 5)]),
+            ("main-texts-changed", [range(0, 1), range(2, 3)]),
+        ]
+
+
+class TestProject(aeidon.TestCase):
+
+    def on_signal(self, project, *args):
+        self.signals.append((args[-1], list(args[0])))
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.signals = []
+        for signal in aeidon.ChangeBatch.signals:
+            self.project.connect(signal, self.on_signal, signal)
+
+    def test_freeze_changes(self):
+        assert self.project.freeze_changes()
+        assert not self.project.freeze_changes()
+        self.project.set_main_text(0, "a")
+        self.project.set_main_text(2, "b")
+        assert self.signals == []
+        assert self.project.thaw_changes()
+        assert self.signals == [("main-texts-changed",
+                                 [range(0, 1), range(2, 3)])]
+
+    def test_freeze_changes__blocked(self):
+        self.project.freeze_changes()
+        self.project.block("main-texts-changed")
+        self.project.set_main_text(0, "a")
+        self.project.unblock("main-texts-changed")
+        self.project.thaw_changes()
+        assert self.signals == []
+
+    def test_revertable(self):
+        self.project.set_start(3, -1000)
+        order = [3, 0, 1, 2] + list(range(4, len(self.project.subtitles)))
+        assert self.signals == [("subtitles-moved", order),
+                                ("positions-changed", [range(0, 1)])]
+
+    def test_revertable__undo(self):
+        self.project.replace_texts((0, 1),
+                                   aeidon.documents.MAIN,
+                                   ("a", "b"))
+        self.project.remove_subtitles((0, 2))
+        self.signals = []
+        self.project.undo(2)
+        assert self.signals == [("subtitles-inserted",
+                                 [range(0, 1), range(2, 3)]),
+                                ("main-texts-changed", [range(0, 2)])]
+
+    def test_thaw_changes(self):
+        assert not self.project.thaw_changes()
+        frozen = self.project.freeze_changes()
+        assert not self.project.thaw_changes(False)
+        assert self.project.thaw_changes(frozen)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestModule(aeidon.TestCase):
+
+    def test_adjust_durations__gap(self):
+        ends = aeidon.columns.adjust_durations(starts=[1000, 2000],
+                                               ends=[2000, 3000],
+                                               limits=[2000, 4000],
+                                               lengths=[0, 0],
+                                               gap=300)
+
+        assert list(ends) == [1700, 3000]
+
+    def test_adjust_durations__maximum(self):
+        ends = aeidon.columns.adjust_durations(starts=[0, 0],
+                                               ends=[1000, 5000],
+                                               limits=[9000, 9000],
+                                               lengths=[0, 0],
+                                               maximum=2000)
+
+        assert list(ends) == [1000, 2000]
+
+    def test_adjust_durations__speed(self):
+        ends = aeidon.columns.adjust_durations(starts=[0, 0],
+                                               ends=[1000, 5000],
+                                               limits=[9000, 9000],
+                                               lengths=[20, 20],
+                                               speed=10,
+                                               lengthen=True)
+
+        assert list(ends) == [2000, 5000]
+
+    def test_scale(self):
+        column = aeidon.columns.scale([100, 200], 1.5, 10)
+        assert list(column) == [160, 310]
+
+    def test_shift(self):
+        column = aeidon.columns.shift([100, 200], -50)
+        assert list(column) == [50, 150]
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import concurrent.futures
+import multiprocessing
+import pickle
+
+
+class TestTextSnapshot(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test___init__(self):
+        snapshot = aeidon.TextSnapshot(self.project, aeidon.documents.TRAN)
+        assert snapshot.doc == "TRAN"
+        assert snapshot.format == "MICRODVD"
+        assert snapshot.texts == [x.tran_text for x in self.project.subtitles]
+
+    def test___init____columnar(self):
+        project = aeidon.Project(columnar=True)
+        project.open_main(self.new_subrip_file(), "ascii")
+        snapshot = aeidon.TextSnapshot(project, aeidon.documents.MAIN)
+        assert snapshot.texts == [x.main_text for x in project.subtitles]
+
+    def test_new_project(self):
+        snapshot = aeidon.TextSnapshot(self.project, aeidon.documents.MAIN)
+        snapshot = pickle.loads(pickle.dumps(snapshot))
+        project = snapshot.new_project()
+        assert project.get_format(aeidon.documents.MAIN) == aeidon.formats.SUBRIP
+        assert ([x.main_text for x in project.subtitles] ==
+                [x.main_text for x in self.project.subtitles])
+
+
+class TestModule(aeidon.TestCase):
+
+    def get_corrections(self):
+        manager = aeidon.PatternManager("hearing-impaired")
+        hi_patterns = manager.get_patterns("Latn", "en")
+        for pattern in hi_patterns:
+            pattern.enabled = True
+        manager = aeidon.PatternManager("common-error")
+        ce_patterns = manager.get_patterns("Latn", "en")
+        manager = aeidon.PatternManager("capitalization")
+        cap_patterns = manager.get_patterns("Latn", "en")
+        manager = aeidon.PatternManager("line-break")
+        lb_patterns = manager.get_patterns("Latn", "en")
+        return [("remove_hearing_impaired", dict(patterns=hi_patterns)),
+                ("correct_common_errors", dict(patterns=ce_patterns)),
+                ("capitalize", dict(patterns=cap_patterns)),
+                ("break_lines", dict(patterns=lb_patterns,
+                                     length_func=len,
+                                     max_length=30,
+                                     max_lines=2))]
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.project.subtitles[1].main_text = "[LAUGHS]"
+        self.project.subtitles[2].main_text = "hello ,world."
+
+    def test_correct_texts(self):
+        doc = aeidon.documents.MAIN
+        corrections = self.get_corrections()
+        snapshot = aeidon.TextSnapshot(self.project, doc)
+        changes = aeidon.correction.correct_texts(snapshot, None, corrections)
+        subtitles = list(self.project.subtitles)
+        texts = [x.main_text for x in subtitles]
+        for name, kwargs in corrections:
+            getattr(self.project, name)(None, doc, **kwargs)
+        expected = [(i, x, subtitles[i].main_text)
+                    for i, x in enumerate(texts)
+                    if subtitles[i].main_text != x]
+        assert changes == expected
+        assert (1, "[LAUGHS]", "") in changes
+
+    def test_correct_texts__indices(self):
+        doc = aeidon.documents.MAIN
+        corrections = self.get_corrections()
+        self.project.subtitles[3].main_text = "hello ,world."
+        snapshot = aeidon.TextSnapshot(self.project, doc)
+        changes = aeidon.correction.correct_texts(snapshot, [1, 2], corrections)
+        # Removal of subtitle 1 must not shift corrections to subtitle 3.
+        assert [x[0] for x in changes] == [1, 2]
+        assert changes[1][2].lower() == "hello, world."
+
+    def test_correct_texts__process(self):
+        doc = aeidon.documents.MAIN
+        corrections = self.get_corrections()
+        snapshot = aeidon.TextSnapshot(self.project, doc)
+        expected = aeidon.correction.correct_texts(snapshot, None, corrections)
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(
+                2, mp_context=context) as executor:
+            future = executor.submit(aeidon.correction.correct_texts,
+                                     snapshot, None, corrections)
+
+            assert future.result() == expected
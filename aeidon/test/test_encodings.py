@@ -90,6 +90,12 @@ class TestModule(aeidon.TestCase):
         encoding = aeidon.encodings.detect_bom(path)
         assert encoding == "utf_8_sig"
 
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_data__bom(self):
+        data = codecs.BOM_UTF8 + b"test"
+        encoding = aeidon.encodings.detect_data(data)
+        assert encoding == "utf_8_sig"
+
     def test_get_locale_code(self):
         code = aeidon.encodings.get_locale_code()
         assert aeidon.encodings.is_valid_code(code)
@@ -32,6 +32,27 @@ class TestSubtitleFile(aeidon.TestCase):
         newline = aeidon.newlines.UNIX
         self.file = PuppetSubtitleFile(path, "ascii", newline)
 
+    def test_iter_subtitles(self):
+        for format in aeidon.formats:
+            if format == aeidon.formats.NONE: continue
+            path = self.new_temp_file(format)
+            file = aeidon.files.new(format, path, "ascii")
+            subtitles = file.iter_subtitles()
+            assert next(subtitles).main_text
+            assert list(file.iter_subtitles()) == file.read()
+
+    def test_read__newline(self):
+        path = self.new_subrip_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", newline="\r\n") as f:
+            f.write("\n\n" + text + "\n\n")
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        assert file.newline == aeidon.newlines.WINDOWS
+        assert subtitles[-1].main_text.strip()
+        assert not subtitles[-1].main_text.endswith("\n")
+
     def test_read__utf_16(self):
         path = self.new_subrip_file()
         with open(path, "r") as f:
@@ -68,4 +89,17 @@ class TestSubtitleFile(aeidon.TestCase):
         with open(path, "w", encoding="utf_8_sig") as f:
             f.write(text)
         file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
-        file.read()
+        assert not file.read()[0].main_text.startswith("\ufeff")
+        assert file.encoding == "utf_8_sig"
+
+    def test_write__iterator(self):
+        for format in aeidon.formats:
+            if format == aeidon.formats.NONE: continue
+            path = self.new_temp_file(format)
+            file = aeidon.files.new(format, path, "ascii")
+            subtitles = file.read()
+            file.write(subtitles, aeidon.documents.MAIN)
+            text = open(path, "r").read()
+            file.write(iter(subtitles), aeidon.documents.MAIN)
+            assert open(path, "r").read() == text
+
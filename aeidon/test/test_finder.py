@@ -194,6 +194,15 @@ class TestFinder(aeidon.TestCase):
             "Oneonlyrisksit,because"
             "one'ssurvivaldependsonit.")
 
+    def test_replace_all__function(self):
+        self.finder.set_regex(r"[io]")
+        self.finder.replacement = lambda match: match.group().upper()
+        count = self.finder.replace_all()
+        assert count == 7
+        assert self.finder.text == (
+            "One Only rIsks It, because\n"
+            "One's survIval depends On It.")
+
     def test_replace_all__string(self):
         self.finder.pattern = "i"
         self.finder.replacement = "-"
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import random
+
+
+class TestIntervalIndex(aeidon.TestCase):
+
+    def assert_find(self, pos):
+        expected = [x for x in self.items if x[0] <= pos <= x[1]]
+        expected = [x[2] for x in sorted(expected, key=lambda x: x[0])]
+        assert self.index.find(pos) == expected
+
+    def setup_method(self, method):
+        self.items = [(0.0, 1.0, "a"),
+                      (2.0, 3.0, "b"),
+                      (2.5, 10.0, "c"),
+                      (4.0, 5.0, "d"),
+                      (6.0, 7.0, "e")]
+
+        self.index = aeidon.IntervalIndex(self.items)
+
+    def test___len__(self):
+        assert len(self.index) == 5
+
+    def test_find(self):
+        assert self.index.find(0.5) == ["a"]
+        assert self.index.find(1.5) == []
+        assert self.index.find(2.7) == ["b", "c"]
+        assert self.index.find(4.5) == ["c", "d"]
+        assert self.index.find(8.0) == ["c"]
+        assert self.index.find(11.0) == []
+
+    def test_find__empty(self):
+        index = aeidon.IntervalIndex()
+        assert index.find(1.0) == []
+        assert index.find_next(1.0) is None
+        assert index.find_previous(1.0) is None
+
+    def test_find__endpoints(self):
+        assert self.index.find(2.0) == ["b"]
+        assert self.index.find(3.0) == ["b", "c"]
+
+    def test_find__random(self):
+        for i in range(100):
+            start = random.uniform(0, 100)
+            end = start + random.expovariate(0.2)
+            self.items.append((start, end, str(i)))
+        self.index = aeidon.IntervalIndex(self.items)
+        for i in range(200):
+            self.assert_find(random.uniform(-1, 120))
+
+    def test_find_next(self):
+        assert self.index.find_next(2.0) == (2.5, 10.0, "c")
+        assert self.index.find_next(6.0) is None
+
+    def test_find_previous(self):
+        assert self.index.find_previous(4.5) == (2.0, 3.0, "b")
+        assert self.index.find_previous(0.5) is None
+
+    def test_insert(self):
+        self.index.find(0.5)
+        self.index.insert(1, 0.5, 1.5, "x")
+        self.items.insert(1, (0.5, 1.5, "x"))
+        assert self.index.find(1.2) == ["x"]
+        assert self.index.find(0.7) == ["a", "x"]
+        assert len(self.index) == 6
+
+    def test_pop(self):
+        self.index.find(0.5)
+        assert self.index.pop(2) == "c"
+        assert self.index.find(4.5) == ["d"]
+        assert len(self.index) == 4
+
+    def test_set(self):
+        self.index.find(0.5)
+        self.index.set(2, 2.5, 4.0, "c")
+        assert self.index.find(4.5) == ["d"]
+        assert self.index.find(3.5) == ["c"]
+
+    def test_set__move(self):
+        self.index.find(0.5)
+        self.index.set(0, 6.5, 8.0, "a")
+        assert self.index.find(0.5) == []
+        assert self.index.find(6.7) == ["c", "e", "a"]
+        self.index.pop(0)
+        assert self.index.find(6.7) == ["c", "e"]
+
+    def test_set__random(self):
+        for i in range(100):
+            start = random.uniform(0, 100)
+            end = start + random.expovariate(0.2)
+            self.items.append((start, end, str(i)))
+        self.index = aeidon.IntervalIndex(self.items)
+        for i in range(200):
+            j = random.randrange(len(self.items))
+            operation = random.choice(("insert", "pop", "set"))
+            start = random.uniform(0, 100)
+            item = (start, start + random.expovariate(0.2), "x{:d}".format(i))
+            if operation == "insert":
+                self.index.insert(j, *item)
+                self.items.insert(j, item)
+            if operation == "pop":
+                assert self.index.pop(j) == self.items.pop(j)[2]
+            if operation == "set":
+                self.index.set(j, *item)
+                self.items[j] = item
+            self.assert_find(random.uniform(-1, 120))
+
+    def test_set_value(self):
+        self.index.set_value(0, "x")
+        assert self.index.find(0.5) == ["x"]
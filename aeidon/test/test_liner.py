@@ -89,3 +89,37 @@ class TestLiner(aeidon.TestCase):
             "was bored she took a golden ball,\n"
             "and threw it up high and caught it; and\n"
             "this ball was her favorite plaything.")
+
+    def test_break_lines__cache(self):
+        text = ("- Isn't he off on Saturdays? "
+                "- Didn't he tell you?")
+
+        self.liner.set_text(text)
+        first = self.liner.break_lines()
+        self.liner._detect_penalties = None
+        self.liner.set_text(text)
+        assert self.liner.break_lines() == first
+
+    def test_break_lines__length_func(self):
+        text = ("Close by the king's castle "
+                "lay a great dark forest.")
+
+        self.liner.length_func = lambda x: len(x) * 2
+        self.liner.max_length = 80
+        self.liner.set_text(text)
+        assert self.liner.break_lines() == (
+            "Close by the king's castle\n"
+            "lay a great dark forest.")
+
+    def test_break_lines__long(self):
+        text = " ".join(["Lorem ipsum dolor sit amet."] * 50)
+        self.liner.set_text(text)
+        lines = self.liner.break_lines().split("\n")
+        assert len(lines) > 10
+        assert all(len(x) <= self.liner.max_length for x in lines)
+
+    def test_break_lines__unbreakable(self):
+        text = "Supercalifragilisticexpialidocious " * 2
+        self.liner.max_length = 20
+        self.liner.set_text(text)
+        assert self.liner.break_lines() == text.strip()
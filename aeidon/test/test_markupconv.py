@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestMarkupConverter(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.converter = aeidon.MarkupConverter(aeidon.formats.SUBRIP,
+                                                aeidon.formats.MICRODVD)
+
+    def test_convert(self):
+        text = self.converter.convert("<i>test</i>")
+        assert text == "{Y:i}test"
+
+    def test_convert__all(self):
+        texts = ("test", "<b>test</b>", "{Y:i}test", "/test\n_test",
+                 "{\\i1}test{\\i0}", "a < b", "test\n<i>test</i>")
+        for from_format in aeidon.formats:
+            for to_format in aeidon.formats:
+                converter = aeidon.MarkupConverter(from_format, to_format)
+                decoder = aeidon.markups.new(from_format)
+                encoder = aeidon.markups.new(to_format)
+                for text in texts:
+                    expected = encoder.encode(decoder.decode(text))
+                    assert converter.convert(text) == expected
+                    assert converter.convert(text) == expected
+
+    def test_convert__plain(self):
+        text = "test\ntest"
+        assert self.converter.convert(text) is text
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import json
+import os
+import re
+import shutil
+import tempfile
+
+
+class TestPatternSet(aeidon.TestCase):
+
+    def new_pattern(self, string, replacement, repeat=False):
+        return aeidon.Pattern(dict(Pattern=string,
+                                   Flags="DOTALL;MULTILINE;",
+                                   Replacement=replacement,
+                                   Repeat=str(repeat)))
+
+    def substitute(self, pattern_set, text):
+        parser = aeidon.Parser(re.compile(r"<.+?>"))
+        parser.set_text(text)
+        for regex, replacement, repeat in pattern_set.substitutions:
+            parser.pattern = regex
+            parser.replacement = replacement
+            parser.replace_all()
+        return parser.get_text()
+
+    def test___init____disabled(self):
+        patterns = [self.new_pattern("a", "b"), self.new_pattern("c", "d")]
+        patterns[0].enabled = False
+        pattern_set = aeidon.PatternSet(patterns)
+        assert pattern_set.patterns == patterns[1:]
+        assert len(pattern_set.regexes) == 1
+
+    def test_substitutions__merge(self):
+        patterns = [self.new_pattern("ab", "x"),
+                    self.new_pattern("cd", "y"),
+                    self.new_pattern("ef", "z")]
+
+        pattern_set = aeidon.PatternSet(patterns)
+        assert len(pattern_set.substitutions) == 1
+        text = self.substitute(pattern_set, "<i>abcd</i> ef abc")
+        assert text == "<i>xy</i> z xc"
+
+    def test_substitutions__merge_overlap(self):
+        # Replacement of the first creates a match of the second.
+        patterns = [self.new_pattern("ab", "c"), self.new_pattern("cd", "y")]
+        pattern_set = aeidon.PatternSet(patterns)
+        assert len(pattern_set.substitutions) == 2
+        assert self.substitute(pattern_set, "abd") == "y"
+
+    def test_substitutions__merge_regex(self):
+        patterns = [self.new_pattern("a", "b"),
+                    self.new_pattern(r"\bc", "d"),
+                    self.new_pattern("e", "f")]
+
+        pattern_set = aeidon.PatternSet(patterns)
+        assert len(pattern_set.substitutions) == 3
+
+    def test_substitutions__repeat(self):
+        pattern = self.new_pattern("  ", " ", repeat=True)
+        pattern_set = aeidon.PatternSet([pattern])
+        assert pattern_set.substitutions[0][2] is True
+
+    def test_substitutions__shipped(self):
+        texts = ["''Test'' l'm 1st", "<i>lt's 0K ok</i>", "123o456o789"]
+        for pattern_type in ("common-error", "hearing-impaired"):
+            manager = aeidon.PatternManager(pattern_type)
+            patterns = manager.get_patterns("Latn", "en", "US")
+            pattern_set = aeidon.PatternSet(patterns)
+            parser = aeidon.Parser(re.compile(r"<.+?>"))
+            for text in texts:
+                parser.set_text(text)
+                for pattern in (x for x in patterns if x.enabled):
+                    parser.set_regex(pattern.get_field("Pattern"),
+                                     pattern.get_flags())
+                    parser.replacement = pattern.get_field("Replacement")
+                    count = parser.replace_all()
+                    while pattern.get_field_boolean("Repeat") and count:
+                        count = parser.replace_all()
+                expected = parser.get_text()
+                parser.set_text(text)
+                for regex, replacement, repeat in pattern_set.substitutions:
+                    parser.pattern = regex
+                    parser.replacement = replacement
+                    count = parser.replace_all()
+                    while repeat and count:
+                        count = parser.replace_all()
+                assert parser.get_text() == expected
+
+
+class TestPatternManager(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.cache_home_dir = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = tempfile.mkdtemp()
+
+    def teardown_method(self, method):
+        shutil.rmtree(aeidon.CACHE_HOME_DIR)
+        aeidon.CACHE_HOME_DIR = self.cache_home_dir
+
+    def test_get_pattern_set(self):
+        manager = aeidon.PatternManager("common-error")
+        pattern_set = manager.get_pattern_set("Latn", "en")
+        assert isinstance(pattern_set, aeidon.PatternSet)
+        assert pattern_set.substitutions
+
+    def test_read_cache(self):
+        manager = aeidon.PatternManager("common-error")
+        path = manager._get_cache_path()
+        assert os.path.isfile(path)
+        with open(path, "r", encoding="utf_8") as f:
+            cache = json.load(f)
+        # Mark cached fields to ensure they are used on next read.
+        for item in cache["data"].values():
+            for fields in item["fields"]:
+                fields["Cached"] = "True"
+        with open(path, "w", encoding="utf_8") as f:
+            json.dump(cache, f)
+        manager = aeidon.PatternManager("common-error")
+        patterns = manager.get_patterns("Latn")
+        assert all(x.get_field("Cached") == "True" for x in patterns)
+
+    def test_read_cache__stale(self):
+        manager = aeidon.PatternManager("common-error")
+        path = manager._get_cache_path()
+        with open(path, "r", encoding="utf_8") as f:
+            cache = json.load(f)
+        for item in cache["data"].values():
+            item["mtime"] -= 1
+            for fields in item["fields"]:
+                fields["Cached"] = "True"
+        with open(path, "w", encoding="utf_8") as f:
+            json.dump(cache, f)
+        manager = aeidon.PatternManager("common-error")
+        patterns = manager.get_patterns("Latn")
+        assert not any(x.has_field("Cached") for x in patterns)
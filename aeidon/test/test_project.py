@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test___getattr__(self):
+        agent = self.project.open_main.__self__
+        assert isinstance(agent, aeidon.agents.OpenAgent)
+        assert agent.master is self.project
+
+    def test___getattr____separate(self):
+        project = aeidon.Project()
+        assert project.open_main.__self__ is not self.project.open_main.__self__
+
+    def test___getattr____undefined(self):
+        self.assert_raises(AttributeError, getattr, self.project, "xxx")
+
+    def test__init_delegations(self):
+        assert not "open_main" in vars(aeidon.Project)
+        names = [x for agent, names in self.project._exports for x in names]
+        assert len(names) == len(set(names))
+        assert "open_main" in names
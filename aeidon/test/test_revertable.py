@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestRevertableActionStack(aeidon.TestCase):
+
+    def new_action(self, text):
+        return aeidon.RevertableAction(description=text,
+                                       revert_args=((0,), [text]))
+
+    def setup_method(self, method):
+        self.actions = [self.new_action(str(i) * 100) for i in range(5)]
+        self.stack = aeidon.RevertableActionStack(self.actions)
+
+    def test___delitem__(self):
+        del self.stack[3:]
+        assert list(self.stack) == self.actions[:3]
+        assert self.stack.nbytes == sum(x.nbytes for x in self.actions[:3])
+
+    def test___getitem__(self):
+        assert self.stack[0] is self.actions[0]
+        assert self.stack[-1] is self.actions[-1]
+        assert self.stack[1:3] == self.actions[1:3]
+
+    def test_clear(self):
+        self.stack.clear()
+        assert len(self.stack) == 0
+        assert self.stack.nbytes == 0
+
+    def test_cut__length(self):
+        assert self.stack.cut(length=2) == 3
+        assert list(self.stack) == self.actions[:2]
+
+    def test_cut__nbytes(self):
+        self.stack.cut(nbytes=self.actions[0].nbytes * 2)
+        assert list(self.stack) == self.actions[:2]
+        self.stack.cut(nbytes=0)
+        assert list(self.stack) == self.actions[:1]
+
+    def test_insert(self):
+        action = self.new_action("x")
+        self.stack.insert(2, action)
+        assert self.stack[2] is action
+        assert len(self.stack) == 6
+
+    def test_nbytes(self):
+        action = self.new_action("x" * 1000)
+        assert action.nbytes > 1000
+        assert self.stack.nbytes == sum(x.nbytes for x in self.actions)
+
+    def test_pop(self):
+        assert self.stack.pop() is self.actions[0]
+        assert self.stack.pop(-1) is self.actions[-1]
+        assert self.stack.pop(1) is self.actions[2]
+        assert self.stack.nbytes == sum(x.nbytes for x in self.actions[1:4:2])
+
+    def test_push(self):
+        action = self.new_action("x")
+        self.stack.push(action)
+        assert self.stack[0] is action
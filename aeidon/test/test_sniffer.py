@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import builtins
+import codecs
+import io
+import os
+
+
+class CountingFileIO(io.FileIO):
+
+    def read(self, size=-1):
+        data = io.FileIO.read(self, size)
+        self.counts["reads"] += 1
+        self.counts["bytes"] += len(data or b"")
+        return data
+
+    def readall(self):
+        data = io.FileIO.readall(self)
+        self.counts["reads"] += 1
+        self.counts["bytes"] += len(data)
+        return data
+
+    def readinto(self, b):
+        n = io.FileIO.readinto(self, b)
+        self.counts["reads"] += 1
+        self.counts["bytes"] += n or 0
+        return n
+
+
+class TestModule(aeidon.TestCase):
+
+    def count_reads(self, path, function, *args):
+        counts = dict(opens=0, reads=0, bytes=0)
+        builtin_open = builtins.open
+        def open(file, mode="r", *args, **kwargs):
+            if file != path:
+                return builtin_open(file, mode, *args, **kwargs)
+            counts["opens"] += 1
+            raw = CountingFileIO(file, "r")
+            raw.counts = counts
+            if kwargs.get("buffering") == 0: return raw
+            f = io.BufferedReader(raw)
+            if "b" in mode: return f
+            return io.TextIOWrapper(f, *args, **kwargs)
+        builtins.open = open
+        try:
+            function(*args)
+        finally:
+            builtins.open = builtin_open
+        return counts
+
+    def setup_method(self, method):
+        self.chunk_size = aeidon.sniffer.CHUNK_SIZE
+
+    def teardown_method(self, method):
+        aeidon.sniffer.CHUNK_SIZE = self.chunk_size
+
+    def test_open_main__read_once(self):
+        path = self.new_subrip_file()
+        project = aeidon.Project()
+        counts = self.count_reads(path, project.open_main, path, "ascii")
+        assert counts["opens"] == 1
+        assert counts["bytes"] == os.path.getsize(path)
+        assert counts["reads"] == 2
+
+    def test_open_main__read_once__chunked(self):
+        aeidon.sniffer.CHUNK_SIZE = 64
+        path = self.new_subrip_file()
+        project = aeidon.Project()
+        counts = self.count_reads(path, project.open_main, path, "ascii")
+        assert counts["opens"] == 2
+        assert counts["bytes"] == os.path.getsize(path)
+        reference = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        assert project.subtitles == reference.read()
+
+    def test_sniff(self):
+        path = self.new_subrip_file()
+        result = aeidon.sniff(path, "ascii")
+        assert result.bom_encoding is None
+        assert result.complete
+        assert result.encoding == "ascii"
+        assert result.format == aeidon.formats.SUBRIP
+        assert result.newline == aeidon.newlines.UNIX
+
+    def test_sniff__bom(self):
+        path = self.new_microdvd_file()
+        with open(path, "r") as f:
+            text = f.read()
+        with open(path, "w", encoding="utf_16_le", newline="\r\n") as f:
+            f.write(str(codecs.BOM_UTF16_LE, "utf_16_le"))
+            f.write(text)
+        result = aeidon.sniff(path, "ascii")
+        assert result.bom_encoding == "utf_16_le"
+        assert result.encoding == "utf_16_le"
+        assert result.format == aeidon.formats.MICRODVD
+        assert result.newline == aeidon.newlines.WINDOWS
+
+    def test_sniff__chunked(self):
+        aeidon.sniffer.CHUNK_SIZE = 16
+        path = self.new_temp_file(aeidon.formats.ASS)
+        result = aeidon.sniff(path, "ascii")
+        assert not result.complete
+        assert result.format == aeidon.formats.ASS
+        with result.open() as f:
+            assert f.read() == open(path, "r").read()
+
+    def test_sniff__unknown(self):
+        path = aeidon.temp.create(".txt")
+        with open(path, "w") as f:
+            f.write("lorem ipsum\n")
+        assert aeidon.sniff(path).format is None
+
+    def test_sniff__encodings(self):
+        path = self.new_subrip_file()
+        with open(path, "a", encoding="utf_8") as f:
+            f.write("\u00e4\n")
+        result = aeidon.sniff(path, ("ascii", "utf_8", "latin_1"))
+        assert result.encoding == "utf_8"
+        assert [x[0] for x in result.attempts] == ["ascii", "utf_8"]
+        assert result.format == aeidon.formats.SUBRIP
+        assert result.newline == aeidon.newlines.UNIX
+        with result.open() as f:
+            assert f.read() == open(path, "r", encoding="utf_8").read()
+
+    def test_sniff__encodings__bom(self):
+        path = self.new_subrip_file()
+        blob = open(path, "rb").read()
+        open(path, "wb").write(codecs.BOM_UTF8 + blob)
+        result = aeidon.sniff(path, ("ascii",))
+        assert result.encoding == "utf_8_sig"
+        assert result.format == aeidon.formats.SUBRIP
+
+    def test_sniff__encodings__fail(self):
+        path = self.new_subrip_file()
+        with open(path, "a", encoding="utf_8") as f:
+            f.write("\u00e4\n")
+        self.assert_raises(UnicodeError,
+                           aeidon.sniff,
+                           path, ("ascii",))
+
+    def test_sniff__encodings__read_once(self):
+        path = self.new_subrip_file()
+        project = aeidon.Project()
+        encodings = ("ascii", "utf_8")
+        counts = self.count_reads(path, project.open_main, path, encodings)
+        assert counts["opens"] == 1
+        assert counts["bytes"] == os.path.getsize(path)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestSpellChecker(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.checker = aeidon.SpellChecker("en")
+
+    def test___new__(self):
+        assert aeidon.SpellChecker("en") is self.checker
+
+    def test_check(self):
+        assert self.checker.check("test")
+        assert not self.checker.check("tset")
+
+    def test_check__cache(self):
+        self.checker.check("gnaw")
+        hits = self.checker.hits
+        self.checker.check("gnaw")
+        assert self.checker.hits == hits + 1
+
+    def test_get_hit_rate(self):
+        self.checker.check("gnaw")
+        self.checker.check("gnaw")
+        assert 0 < self.checker.get_hit_rate() <= 1
+
+    def test_split(self):
+        words = self.checker.split("I don't know, 2 of them.")
+        assert words == [(0, "I"),
+                         (2, "don't"),
+                         (8, "know"),
+                         (16, "of"),
+                         (19, "them")]
+
+    def test_suggest(self):
+        suggestions = self.checker.suggest("tset")
+        assert "test" in suggestions
+        assert self.checker.suggest("tset") == suggestions
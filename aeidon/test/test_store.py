@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+MAIN = aeidon.documents.MAIN
+TRAN = aeidon.documents.TRAN
+
+
+class TestSubtitleStore(aeidon.TestCase):
+
+    def new_subtitle(self, i, mode=aeidon.modes.TIME):
+        subtitle = aeidon.Subtitle(mode)
+        subtitle.start_seconds = float(i)
+        subtitle.end_seconds = float(i) + 0.5
+        subtitle.main_text = "main {:d}".format(i)
+        subtitle.tran_text = "tran {:d}".format(i)
+        return subtitle
+
+    def setup_method(self, method):
+        self.subtitles = [self.new_subtitle(i) for i in range(5)]
+        self.store = aeidon.SubtitleStore(self.subtitles)
+
+    def test___delitem__(self):
+        del self.store[1]
+        assert len(self.store) == 4
+        assert self.store[1].main_text == "main 2"
+
+    def test___delitem____slice(self):
+        del self.store[1:3]
+        assert self.store == [self.subtitles[0]] + self.subtitles[3:]
+
+    def test___eq__(self):
+        assert self.store == self.subtitles
+        assert self.store != self.subtitles[1:]
+
+    def test___getitem__(self):
+        assert self.store[0] == self.subtitles[0]
+        assert self.store[-1] == self.subtitles[-1]
+        assert self.store[0] is self.store[0]
+        self.assert_raises(IndexError, lambda: self.store[5])
+
+    def test___getitem____slice(self):
+        assert self.store[1:3] == self.subtitles[1:3]
+
+    def test___setitem__(self):
+        subtitle = self.new_subtitle(9)
+        self.store[2] = subtitle
+        assert self.store[2] == subtitle
+        assert len(self.store) == 5
+
+    def test___setitem____slice(self):
+        views = list(self.store)
+        subtitle = self.new_subtitle(9)
+        self.store[:] = views[:2] + [subtitle] + views[3:]
+        assert self.store[0] is views[0]
+        assert self.store[2] == subtitle
+        assert self.store[3] is views[3]
+        assert views[2]._store is None
+        assert len(self.store) == 5
+
+    def test_container(self):
+        self.store[0].ssa.style = "Custom"
+        assert self.store[0].has_container("ssa")
+        assert not self.store[1].has_container("ssa")
+        assert self.store[0].ssa.style == "Custom"
+        copy = self.store[0].copy()
+        assert copy.ssa.style == "Custom"
+
+    def test_container__detach(self):
+        self.store[0].ssa.style = "Custom"
+        subtitle = self.store.pop(0)
+        assert subtitle.ssa.style == "Custom"
+        self.store.insert(0, subtitle)
+        assert self.store[0] is subtitle
+        assert self.store[0].ssa.style == "Custom"
+
+    def test_container__view(self):
+        self.store[0].ssa.style = "Custom"
+        self.store.insert(1, self.store[0])
+        self.store[1].ssa.style = "Changed"
+        assert self.store[0].ssa.style == "Custom"
+        self.store[2] = self.store[0]
+        self.store[2].ssa.style = "Changed"
+        assert self.store[0].ssa.style == "Custom"
+
+    def test_frame(self):
+        subtitles = [self.new_subtitle(i, aeidon.modes.FRAME)
+                     for i in range(5)]
+
+        store = aeidon.SubtitleStore(subtitles)
+        assert store == subtitles
+        store[0].start = 10
+        assert store[0].start == 10
+        assert store[0].start_time == "00:00:00.417"
+
+    def test_get_positions(self):
+        starts, ends = self.store.get_positions((1, 2))
+        assert list(starts) == [1000, 2000]
+        assert list(ends) == [1500, 2500]
+
+    def test_get_texts(self):
+        assert self.store.get_texts(MAIN, (3,)) == ["main 3"]
+        assert self.store.get_texts(TRAN)[0] == "tran 0"
+
+    def test_insert(self):
+        subtitle = self.new_subtitle(9)
+        self.store.insert(1, subtitle)
+        assert len(self.store) == 6
+        assert self.store[1] == subtitle
+        assert self.store[2] == self.subtitles[1]
+
+    def test_pop(self):
+        subtitle = self.store[1]
+        assert self.store.pop(1) is subtitle
+        assert subtitle.main_text == "main 1"
+        subtitle.main_text = "detached"
+        assert self.store[1].main_text == "main 2"
+
+    def test_set_framerate(self):
+        self.store.set_framerate(aeidon.framerates.FPS_25_000)
+        assert self.store[0].framerate == aeidon.framerates.FPS_25_000
+        assert self.store[4].framerate == aeidon.framerates.FPS_25_000
+
+    def test_set_positions(self):
+        self.store.set_positions((0, 4), (100, 200), (300, 400))
+        assert self.store[0].start_time == "00:00:00.100"
+        assert self.store[4].end_time == "00:00:00.400"
+
+    def test_set_texts(self):
+        self.store.set_texts(TRAN, (0, 1), ("a", "b"))
+        assert self.store[0].tran_text == "a"
+        assert self.store[1].tran_text == "b"
+
+    def test_shift_positions(self):
+        self.store[0].shift_positions(1.0)
+        assert self.store[0].start_time == "00:00:01.000"
+        assert self.store[0].end_time == "00:00:01.500"
+
+
+class TestColumnarProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project(columnar=True)
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        self.project.open_translation(self.new_microdvd_file(), "ascii")
+
+    def test_open_main(self):
+        assert isinstance(self.project.subtitles, aeidon.SubtitleStore)
+        assert self.project.subtitles[0].main_text
+        assert self.project.subtitles[0].tran_text
+
+    @aeidon.deco.reversion_test
+    def test_remove_subtitles(self):
+        self.project.remove_subtitles((1, 2))
+
+    def test_save_main(self):
+        self.project.save_main()
+
+    @aeidon.deco.reversion_test
+    def test_convert_framerate(self):
+        self.project.convert_framerate(None,
+                                       aeidon.framerates.FPS_23_976,
+                                       aeidon.framerates.FPS_25_000)
+
+    @aeidon.deco.reversion_test
+    def test_shift_positions(self):
+        self.project.shift_positions(None, 1.0)
@@ -60,6 +60,50 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start == "00:00:01.043"
         assert self.tsub.end == "00:00:02.085"
 
+    def test_copy(self):
+        subtitle = self.tsub.copy()
+        assert subtitle == self.tsub
+        assert subtitle is not self.tsub
+        assert not subtitle.has_container("ssa")
+
+    def test_copy__containers(self):
+        self.tsub.ssa.style = "Default"
+        subtitle = self.tsub.copy()
+        assert subtitle.ssa.style == "Default"
+        subtitle.ssa.style = "Other"
+        assert self.tsub.ssa.style == "Default"
+        self.tsub.ssa.style = "Another"
+        assert subtitle.ssa.style == "Other"
+
+    def test_copy__containers_handed_out(self):
+        ssa = self.tsub.ssa
+        subtitle = self.tsub.copy()
+        ssa.style = "Other"
+        assert subtitle.ssa.style == "Default"
+        assert self.tsub.ssa.style == "Other"
+
+    def test_copy__containers_all(self):
+        for name in aeidon.Subtitle._container_names:
+            getattr(self.tsub, name).test = name
+        # Copy twice to test both copying and sharing containers.
+        subtitle = self.tsub.copy().copy()
+        for name in aeidon.Subtitle._container_names:
+            assert getattr(subtitle, name).test == name
+
+    def test_container_names(self):
+        # Names must match aeidon.containers or containers would be
+        # silently dropped when copying subtitles.
+        names = aeidon.Subtitle._container_names
+        classes = [x for x in vars(aeidon.containers).values()
+                   if isinstance(x, type)]
+        assert (sorted(type(aeidon.containers.new(x)).__name__ for x in names)
+                == sorted(x.__name__ for x in classes))
+        for format in (x for x in aeidon.formats if x.container):
+            assert format.container in names
+        for name in names:
+            assert "_{}".format(name) in aeidon.Subtitle.__slots__
+            assert isinstance(getattr(aeidon.Subtitle, name), property)
+
     def test_duration__get(self):
         assert self.tsub.duration == "00:00:02.000"
         assert self.fsub.duration == 200
@@ -132,6 +176,10 @@ class TestSubtitle(aeidon.TestCase):
         self.fsub.end_frame = 300
         assert self.fsub.end_frame == 300
 
+    def test_end_ms(self):
+        assert self.tsub.end_ms == 3000
+        assert self.fsub.end_ms == 12000
+
     def test_end_seconds__get(self):
         assert self.tsub.end_seconds == 3.0
         assert self.fsub.end_seconds == 12.0
@@ -178,6 +226,11 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.get_text(MAIN) == "main"
         assert self.tsub.get_text(TRAN) == "translation"
 
+    def test_has_container(self):
+        assert not self.tsub.has_container("ssa")
+        self.tsub.ssa.style = "Default"
+        assert self.tsub.has_container("ssa")
+
     def test_main_text__get(self):
         assert self.tsub.main_text == "main"
         assert self.fsub.main_text == "main"
@@ -193,14 +246,14 @@ class TestSubtitle(aeidon.TestCase):
     def test_mode__set_frame(self):
         self.fsub.mode = FRAME
         self.fsub.mode = TIME
-        assert self.fsub._start == "00:00:04.000"
-        assert self.fsub._end == "00:00:12.000"
+        assert self.fsub.start == "00:00:04.000"
+        assert self.fsub.end == "00:00:12.000"
 
     def test_mode__set_time(self):
         self.tsub.mode = TIME
         self.tsub.mode = FRAME
-        assert self.tsub._start == 25
-        assert self.tsub._end == 75
+        assert self.tsub.start == 25
+        assert self.tsub.end == 75
 
     def test_scale_positions__frame(self):
         self.fsub.scale_positions(2.0)
@@ -220,18 +273,18 @@ class TestSubtitle(aeidon.TestCase):
 
     def test_shift_positions__frame(self):
         self.fsub.shift_positions(-10)
-        assert self.fsub._start == 90
-        assert self.fsub._end == 290
+        assert self.fsub.start == 90
+        assert self.fsub.end == 290
 
     def test_shift_positions__seconds(self):
         self.tsub.shift_positions(1.0)
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub.start == "00:00:02.000"
+        assert self.tsub.end == "00:00:04.000"
 
     def test_shift_positions__time(self):
         self.tsub.shift_positions("00:00:01.000")
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub.start == "00:00:02.000"
+        assert self.tsub.end == "00:00:04.000"
 
     def test_start__get(self):
         assert self.tsub.start == "00:00:01.000"
@@ -261,6 +314,10 @@ class TestSubtitle(aeidon.TestCase):
         self.fsub.start_frame = 25
         assert self.fsub.start_frame == 25
 
+    def test_start_ms(self):
+        assert self.tsub.start_ms == 1000
+        assert self.fsub.start_ms == 4000
+
     def test_start_seconds__get(self):
         assert self.tsub.start_seconds == 1.0
         assert self.fsub.start_seconds == 4.0
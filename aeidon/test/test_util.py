@@ -16,6 +16,12 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import json
+import os
+import shutil
+import tempfile
+
+from unittest.mock import patch
 
 
 class TestModule(aeidon.TestCase):
@@ -79,6 +85,14 @@ class TestModule(aeidon.TestCase):
         assert aeidon.util.get_encoding_alias("utf8") == "utf_8"
         assert aeidon.util.get_encoding_alias("johab") == "johab"
 
+    def test_get_index_ranges(self):
+        lst = [0, 0, 4, 5, 3, 7, 8, 2, 7]
+        lst = aeidon.util.get_index_ranges(lst)
+        assert lst == [range(0, 1), range(2, 6), range(7, 9)]
+
+    def test_get_index_ranges__empty(self):
+        assert aeidon.util.get_index_ranges(()) == []
+
     def test_get_ranges(self):
         lst = [0, 0, 4, 5, 3, 7, 8, 2, 7]
         lst = aeidon.util.get_ranges(lst)
@@ -104,6 +118,48 @@ class TestModule(aeidon.TestCase):
         open(path, "w", encoding="utf_8").write("\xc3\xb6\n")
         assert aeidon.util.read(path, "ascii") == "\xc3\xb6"
 
+    def test_read_cache(self):
+        path = os.path.join(aeidon.CACHE_HOME_DIR, "test", "test.json")
+        assert aeidon.util.write_cache(path, dict(version=1), [1, 2])
+        assert aeidon.util.read_cache(path, dict(version=1)) == [1, 2]
+        assert aeidon.util.read_cache(path, dict(version=2)) is None
+
+    def test_read_cache__invalid(self):
+        path = os.path.join(aeidon.CACHE_HOME_DIR, "test", "test.json")
+        aeidon.util.makedirs(os.path.dirname(path))
+        with open(path, "w", encoding="utf_8") as f:
+            f.write('{"key": 1}')
+        assert aeidon.util.read_cache(path, 1) is None
+        with open(path, "w", encoding="utf_8") as f:
+            f.write('{"key": 1, "data"')
+        assert aeidon.util.read_cache(path, 1) is None
+
+    def test_read_iso_codes(self):
+        cache_home_dir = aeidon.CACHE_HOME_DIR
+        aeidon.CACHE_HOME_DIR = tempfile.mkdtemp()
+        try:
+            codes = aeidon.util.read_iso_codes("iso_639", "iso_639_1_code")
+            assert codes["fi"] == "Finnish"
+            path = os.path.join(aeidon.CACHE_HOME_DIR,
+                                "iso-codes",
+                                "iso_639.json")
+
+            assert os.path.isfile(path)
+            with patch("xml.etree.ElementTree.parse", None):
+                cached = aeidon.util.read_iso_codes("iso_639", "iso_639_1_code")
+            assert cached == codes
+            # Cache with a matching key but no codes must be ignored.
+            with open(path, "r", encoding="utf_8") as f:
+                cache = json.load(f)
+            del cache["data"]
+            with open(path, "w", encoding="utf_8") as f:
+                json.dump(cache, f)
+            assert aeidon.util.read_iso_codes("iso_639",
+                                              "iso_639_1_code") == codes
+        finally:
+            shutil.rmtree(aeidon.CACHE_HOME_DIR)
+            aeidon.CACHE_HOME_DIR = cache_home_dir
+
     def test_readlines__basic(self):
         path = self.new_subrip_file()
         lines = [x.rstrip() for x in open(path, "r").readlines()]
@@ -128,6 +184,12 @@ class TestModule(aeidon.TestCase):
         f = open(path, "r", encoding="utf_8")
         assert f.read() == text
 
+    def test_write_cache(self):
+        path = os.path.join(aeidon.CACHE_HOME_DIR, "test", "test.json")
+        assert aeidon.util.write_cache(path, 1, dict(a=1))
+        with open(path, "r", encoding="utf_8") as f:
+            assert json.load(f) == dict(key=1, data=dict(a=1))
+
     def test_writelines__basic(self):
         lines = ("test", "test")
         path = self.new_subrip_file()
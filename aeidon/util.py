@@ -20,14 +20,11 @@
 import aeidon
 import collections
 import contextlib
-import inspect
 import locale
 import os
 import random
 import re
-import shutil
 import stat
-import subprocess
 import sys
 import traceback
 import urllib.parse
@@ -92,6 +89,7 @@ def atomic_open(path, mode="w", *args, **kwargs):
             if sys.platform == "win32":
                 if os.path.isfile(path):
                     os.remove(path)
+            import shutil
             shutil.move(temp_path, path)
     finally:
         with silent(Exception):
@@ -159,23 +157,9 @@ def detect_newlines(path):
     try:
         with open(path, "r", newline="") as f:
             f.read()
-            chars = f.newlines
+            return get_newline(f.newlines)
     except Exception:
         return None
-    if chars is None:
-        return None
-    if isinstance(chars, str):
-        return aeidon.newlines.find_item("value", chars)
-    if isinstance(chars, tuple):
-        if len(chars) == 1:
-            return aeidon.newlines.find_item("value", chars[0])
-        # This is not actually correct. If both CR and LF are detected,
-        # it could mean a mixture of Mac and Unix newlines on separate
-        # lines or one Windows newline in a mostly something else file.
-        # We could count the frequencies, but it's probably not worth
-        # the effort.
-        return aeidon.newlines.WINDOWS
-    return None
 
 @aeidon.deco.once
 def enchant_available():
@@ -248,6 +232,48 @@ def get_encoding_alias(encoding):
         return aliases[encoding]
     return encoding
 
+def get_index_ranges(indices):
+    """
+    Return a sorted list of ranges of consecutive integers in `indices`.
+
+    >>> aeidon.util.get_index_ranges([1, 2, 3, 5, 6, 7, 9, 11, 12])
+    [range(1, 4), range(5, 8), range(9, 10), range(11, 13)]
+    """
+    ranges = []
+    start = stop = None
+    for index in sorted(set(indices)):
+        if index == stop:
+            stop += 1
+            continue
+        if start is not None:
+            ranges.append(range(start, stop))
+        start, stop = index, index + 1
+    if start is not None:
+        ranges.append(range(start, stop))
+    return ranges
+
+def get_newline(chars):
+    """
+    Return :attr:`aeidon.newlines` item matching `chars` or ``None``.
+
+    `chars` should be the value of the ``newlines`` attribute of a file
+    object, i.e. ``None``, a string or a tuple of strings.
+    """
+    if chars is None:
+        return None
+    if isinstance(chars, str):
+        return aeidon.newlines.find_item("value", chars)
+    if isinstance(chars, tuple):
+        if len(chars) == 1:
+            return aeidon.newlines.find_item("value", chars[0])
+        # This is not actually correct. If both CR and LF are detected,
+        # it could mean a mixture of Mac and Unix newlines on separate
+        # lines or one Windows newline in a mostly something else file.
+        # We could count the frequencies, but it's probably not worth
+        # the effort.
+        return aeidon.newlines.WINDOWS
+    return None
+
 def get_ranges(lst):
     """
     Return a list of ranges in list of integers.
@@ -257,8 +283,8 @@ def get_ranges(lst):
     """
     if not lst: return []
     lst = sorted(get_unique(lst))
-    ranges = [[lst.pop(0)]]
-    for item in lst:
+    ranges = [[lst[0]]]
+    for item in lst[1:]:
         if item == ranges[-1][-1] + 1:
             ranges[-1].append(item)
         else:
@@ -297,7 +323,7 @@ def install_module(name, obj):
 
         aeidon.util.install_module("foo", lambda: None)
     """
-    aeidon.__dict__[name] = inspect.getmodule(obj)
+    aeidon.__dict__[name] = sys.modules[obj.__module__]
 
 def last(iterator):
     """Return the last value from `iterator` or ``None``."""
@@ -325,6 +351,15 @@ def normalize_newlines(text):
     re_newline_char = re.compile(r"\r\n?")
     return re_newline_char.sub("\n", text)
 
+@aeidon.deco.once
+def numpy_available():
+    """Return ``True`` if :mod:`numpy` module is available."""
+    try:
+        import numpy
+        return True
+    except Exception:
+        return False
+
 def path_to_uri(path):
     """Convert local filepath to URI."""
     if sys.platform == "win32":
@@ -380,6 +415,63 @@ def read(path, encoding=None, fallback="utf_8", quiet=False):
             print_read_unicode(sys.exc_info(), path, encoding)
         raise # UnicodeError
 
+def read_cache(path, key):
+    """
+    Return data cached in JSON file at `path` or ``None``.
+
+    `key` should be a JSON-serializable value identifying the state of
+    the sources of cached data, e.g. modification times of files. Return
+    ``None`` if the cache doesn't exist, cannot be read or was written
+    with a different `key`.
+    """
+    import json
+    try:
+        with open(path, "r", encoding="utf_8") as f:
+            cache = json.load(f)
+    except (IOError, ValueError):
+        return None
+    if not isinstance(cache, dict): return None
+    if cache.get("key") != key: return None
+    return cache.get("data", None)
+
+def read_iso_codes(name, code_key):
+    """
+    Return a dictionary mapping codes to names from iso-codes file `name`.
+
+    `name` should be the basename of the XML file without extension, e.g.
+    "iso_639", and `code_key` the attribute of entries that holds the code.
+    Codes are cached in :attr:`aeidon.CACHE_HOME_DIR` and reused as long
+    as the path, modification time and size of the XML file remain the same.
+    """
+    basename = "{}.xml".format(name)
+    path = os.path.join("/usr/share/xml/iso-codes", basename)
+    if not os.path.isfile(path):
+        # Prefer files part of the iso-codes installation,
+        # use bundled copy as fallback.
+        path = os.path.join(aeidon.DATA_DIR, "iso-codes", basename)
+    stat = os.stat(path)
+    key = dict(path=path,
+               mtime=stat.st_mtime_ns,
+               size=stat.st_size,
+               code_key=code_key)
+
+    cache_path = os.path.join(aeidon.CACHE_HOME_DIR,
+                              "iso-codes",
+                              "{}.json".format(name))
+
+    codes = read_cache(cache_path, key)
+    if isinstance(codes, dict):
+        return codes
+    import xml.etree.ElementTree as ET
+    codes = {}
+    for element in ET.parse(path).findall("{}_entry".format(name)):
+        code = element.get(code_key, None)
+        label = element.get("name", None)
+        if not code or not label: continue
+        codes[code] = label
+    write_cache(cache_path, key, codes)
+    return codes
+
 def readlines(path, encoding=None, fallback="utf_8", quiet=False):
     """
     Read file at `path` and return lines.
@@ -424,6 +516,8 @@ def start_process(command, **kwargs):
     Raise :exc:`aeidon.ProcessError` if something goes wrong.
     Return :class:`subprocess.Popen` instance.
     """
+    # Imported here, since rarely needed and slow to import.
+    import subprocess
     # Use no environment on Windows due to a subprocess bug.
     # http://bugzilla.gnome.org/show_bug.cgi?id=605805
     env = (os.environ.copy() if sys.platform != "win32" else None)
@@ -482,6 +576,24 @@ def write(path, text, encoding=None, fallback="utf_8", quiet=False):
             print_write_unicode(sys.exc_info(), path, encoding)
         raise # UnicodeError
 
+def write_cache(path, key, data):
+    """
+    Write `data` to JSON file at `path` to be read with `key`.
+
+    Return ``True`` if written, ``False`` if writing failed. Failing to
+    cache is not an error, data can be built from its sources again.
+    """
+    import json
+    try:
+        makedirs(os.path.dirname(path))
+        # Write atomically so that concurrent processes
+        # never read a partially written cache.
+        with atomic_open(path, "w", encoding="utf_8") as f:
+            json.dump(dict(key=key, data=data), f, ensure_ascii=False)
+    except OSError:
+        return False
+    return True
+
 def writelines(path, lines, encoding=None, fallback="utf_8", quiet=False):
     """
     Write `lines` of text to file at `path`.
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Configuration of unit tests run with pytest."""
+
+import aeidon
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_home_dir():
+    """Write caches to a temporary directory instead of the user's."""
+    cache_home_dir = aeidon.CACHE_HOME_DIR
+    aeidon.CACHE_HOME_DIR = aeidon.temp.create_directory()
+    yield aeidon.CACHE_HOME_DIR
+    aeidon.temp.remove(aeidon.CACHE_HOME_DIR)
+    aeidon.CACHE_HOME_DIR = cache_home_dir
@@ -64,6 +64,7 @@ from gaupol import ruler
 from gaupol.entries import *
 from gaupol.renderers import *
 from gaupol.floatlabel import *
+from gaupol.model import *
 from gaupol.view import *
 from gaupol.page import *
 from gaupol.player import *
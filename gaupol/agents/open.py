@@ -18,10 +18,13 @@
 """Opening subtitle files and creating new projects."""
 
 import aeidon
+import concurrent.futures
 import gaupol
 import os
+import threading
 
-from aeidon.i18n   import _
+from aeidon.i18n   import _, n_
+from gi.repository import GLib
 from gi.repository import Gtk
 
 
@@ -157,6 +160,31 @@ class OpenAgent(aeidon.Delegate):
         encodings = encodings or ["utf_8"]
         return tuple(aeidon.util.get_unique(encodings))
 
+    def _load_file(self, page, doc, path, encodings, result):
+        """Load `result` of reading file at `path` or raise Default."""
+        basename = os.path.basename(path)
+        if isinstance(result, UnicodeError):
+            # Report if all codecs failed to decode file.
+            self._show_encoding_error_dialog(basename)
+            raise gaupol.Default
+        if isinstance(result, aeidon.FormatError):
+            self._show_format_error_dialog(basename)
+            raise gaupol.Default
+        if isinstance(result, IOError):
+            self._show_io_error_dialog(basename, str(result))
+            raise gaupol.Default
+        if isinstance(result, aeidon.ParseError):
+            with aeidon.util.silent(Exception):
+                format = aeidon.sniff(path, encodings).format
+            self._show_parse_error_dialog(basename, format)
+            raise gaupol.Default
+        if isinstance(result, Exception):
+            raise result
+        file, subtitles, sort_count = result
+        self._check_sort_count(path, sort_count)
+        align_method = gaupol.conf.file.align_method
+        page.project.load(doc, file, subtitles, align_method)
+
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
     def _on_append_file_activate(self, *args):
@@ -238,21 +266,27 @@ class OpenAgent(aeidon.Delegate):
 
     def _open_file(self, path, encodings, doc, check_open=True):
         """Open file at `path` and return corresponding page if successful."""
-        self._check_file_exists(path)
-        if check_open:
-            self._check_file_not_open(path)
-        self._check_file_size(path)
-        basename = os.path.basename(path)
-        page = (gaupol.Page() if doc == aeidon.documents.MAIN
-                else self.get_current_page())
-        for encoding in encodings:
-            with aeidon.util.silent(UnicodeError):
-                n = self._try_open_file(page, doc, path, encoding)
-                self._check_sort_count(path, n)
-                return page
-        # Report if all codecs failed to decode file.
-        self._show_encoding_error_dialog(basename)
-        raise gaupol.Default
+        return next(self._open_files([path], encodings, doc, check_open))
+
+    def _open_files(self, paths, encodings, doc, check_open=True):
+        """
+        Open files at `paths` and yield corresponding pages if successful.
+
+        Files are read concurrently in worker threads and then loaded into
+        projects one by one. Raise :exc:`gaupol.Default` at first failure.
+        """
+        for path in paths:
+            self._check_file_exists(path)
+            if check_open:
+                self._check_file_not_open(path)
+            self._check_file_size(path)
+        pages = [(gaupol.Page() if doc == aeidon.documents.MAIN
+                  else self.get_current_page()) for x in paths]
+        projects = [x.project for x in pages]
+        results = self._read_files(projects, paths, encodings)
+        for page, path, result in zip(pages, paths, results):
+            self._load_file(page, doc, path, encodings, result)
+            yield page
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -261,19 +295,19 @@ class OpenAgent(aeidon.Delegate):
         if gaupol.fields.TRAN_TEXT in gaupol.conf.editor.visible_fields:
             gaupol.conf.editor.visible_fields.remove(gaupol.fields.TRAN_TEXT)
         encodings = self._get_encodings(encoding)
+        paths = list(aeidon.util.flatten([path]))
         gaupol.util.set_cursor_busy(self.window)
-        for path in aeidon.util.flatten([path]):
-            try:
-                page = self._open_file(path, encodings, aeidon.documents.MAIN)
-            except gaupol.Default:
-                gaupol.util.set_cursor_normal(self.window)
-                raise # gaupol.Default
-            self.add_page(page)
-            format = page.project.main_file.format
-            self.add_to_recent_files(path, format, aeidon.documents.MAIN)
-            # Refresh view to get row heights etc. correct.
-            page.view.set_focus(0, page.view.columns.MAIN_TEXT)
-        gaupol.util.set_cursor_normal(self.window)
+        try:
+            for page in self._open_files(
+                    paths, encodings, aeidon.documents.MAIN):
+                self.add_page(page)
+                path = page.project.main_file.path
+                format = page.project.main_file.format
+                self.add_to_recent_files(path, format, aeidon.documents.MAIN)
+                # Refresh view to get row heights etc. correct.
+                page.view.set_focus(0, page.view.columns.MAIN_TEXT)
+        finally:
+            gaupol.util.set_cursor_normal(self.window)
         self.update_gui()
 
     @aeidon.deco.export
@@ -292,6 +326,62 @@ class OpenAgent(aeidon.Delegate):
         self.add_to_recent_files(path, format, aeidon.documents.TRAN)
         gaupol.util.set_cursor_normal(self.window)
 
+    def _read_file(self, project, path, encodings):
+        """
+        Read file at `path` trying `encodings` in order.
+
+        Return file, subtitles and sort count or exception raised. This is
+        called in a worker thread and must not touch the GUI.
+        """
+        try:
+            return project.read(path, encodings)
+        except Exception as error:
+            return error
+
+    def _read_files(self, projects, paths, encodings):
+        """
+        Read files at `paths` concurrently in worker threads.
+
+        Return a list of return values of :meth:`_read_file` for `paths`.
+        Show progress if reading takes long, raise :exc:`gaupol.Default`
+        if cancelled. Cancelling skips files whose reading hasn't started,
+        the rest are read to the end, but discarded.
+        """
+        cancelled = threading.Event()
+        results = [None] * len(paths)
+        def read(i):
+            if cancelled.is_set(): return
+            results[i] = self._read_file(projects[i], paths[i], encodings)
+        title = n_("Opening file", "Opening files", len(paths))
+        dialog = gaupol.ProgressDialog(self.window, title)
+        dialog.connect("response", lambda *args: cancelled.set())
+        source = gaupol.util.delay_add(500, dialog.show)
+        done = []
+        def on_done(future):
+            done.append(future)
+            basename = os.path.basename(futures[future])
+            dialog.set_progress(len(done), len(paths), basename)
+        workers = min(len(paths), os.cpu_count() or 1)
+        # Keep the window from taking input, e.g. opening the same files
+        # again or closing pages, while the main loop is iterated waiting.
+        # The progress dialog is a separate window and can still cancel.
+        self.window.set_sensitive(False)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+                futures = {executor.submit(read, i): path
+                           for i, path in enumerate(paths)}
+                gaupol.util.wait_for(list(futures), on_done)
+        finally:
+            self.window.set_sensitive(True)
+        if not dialog.get_visible():
+            GLib.source_remove(source)
+        dialog.destroy()
+        for future in futures:
+            # Raise possible unexpected errors.
+            future.result()
+        gaupol.util.raise_default(cancelled.is_set())
+        return results
+
     def _select_files(self, title, doc):
         """Show a :class:`gaupol.OpenDialog` to select files."""
         gaupol.util.set_cursor_busy(self.window)
@@ -380,24 +470,3 @@ class OpenAgent(aeidon.Delegate):
         if response == Gtk.ResponseType.YES:
             return self.save_translation(page)
         gaupol.util.raise_default(response != Gtk.ResponseType.NO)
-
-    def _try_open_file(self, page, doc, path, encoding, **kwargs):
-        """Try to open file at `path` and return subtitle sort count."""
-        if encoding == "auto":
-            encoding = aeidon.encodings.detect(path)
-            if encoding is None: raise UnicodeError
-        kwargs["align_method"] = gaupol.conf.file.align_method
-        basename = os.path.basename(path)
-        try:
-            return page.project.open(doc, path, encoding, **kwargs)
-        except aeidon.FormatError:
-            self._show_format_error_dialog(basename)
-        except IOError as error:
-            self._show_io_error_dialog(basename, str(error))
-        except aeidon.ParseError:
-            bom_encoding = aeidon.encodings.detect_bom(path)
-            encoding = bom_encoding or encoding
-            with aeidon.util.silent(Exception):
-                format = aeidon.util.detect_format(path, encoding)
-            self._show_parse_error_dialog(basename, format)
-        raise gaupol.Default
@@ -18,6 +18,7 @@
 """Saving documents."""
 
 import aeidon
+import functools
 import gaupol
 import os
 
@@ -98,7 +99,8 @@ class SaveAgent(aeidon.Delegate):
         try:
             file = file or page.project.get_file(doc)
             gaupol.util.set_cursor_busy(self.window)
-            return page.project.save(doc, file)
+            write_func = functools.partial(self._write_file, file)
+            return page.project.save(doc, file, write_func=write_func)
         except IOError as error:
             gaupol.util.set_cursor_normal(self.window)
             basename = os.path.basename(file.path)
@@ -205,3 +207,13 @@ class SaveAgent(aeidon.Delegate):
         dialog.add_button(_("_OK"), Gtk.ResponseType.OK)
         dialog.set_default_response(Gtk.ResponseType.OK)
         gaupol.util.flash_dialog(dialog)
+
+    def _write_file(self, file, subtitles, doc):
+        """Write `subtitles` to `file` in a worker thread."""
+        # Keep the window from taking input that could change
+        # subtitles while they're being written.
+        self.window.set_sensitive(False)
+        try:
+            return gaupol.util.run_in_thread(file.write, subtitles, doc)
+        finally:
+            self.window.set_sensitive(True)
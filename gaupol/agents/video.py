@@ -19,6 +19,7 @@
 
 import aeidon
 import gaupol
+import itertools
 import os
 import sys
 
@@ -37,20 +38,43 @@ class VideoAgent(aeidon.Delegate):
     def __init__(self, master):
         """Initialize an :class:`VideoAgent` instance."""
         aeidon.Delegate.__init__(self, master)
-        # Maintain an up-to-date cache of subtitle positions in seconds and
+        # Maintain an up-to-date index of subtitle positions in seconds and
         # subtitle texts in order to allow fast polled updates in video player.
-        # This cache must be updated when page or subtitle data changes.
-        self._cache = []
+        # This index is rebuilt when page changes and updated incrementally
+        # from the signals of the project when subtitle data changes.
+        self._cache = aeidon.IntervalIndex()
+        self._cache_project = None
         self._update_handlers = []
 
     def _clear_subtitle_cache(self):
         """Clear subtitle position and text cache."""
-        self._cache = []
+        self._cache = aeidon.IntervalIndex()
+        self._disconnect_cache_project()
+
+    def _disconnect_cache_project(self):
+        """Disconnect cache updates from project signals."""
+        if self._cache_project is None: return
+        for signal, method in self._get_cache_project_handlers():
+            self._cache_project.disconnect(signal, method)
+        self._cache_project = None
+
+    def _get_cache_project_handlers(self):
+        """Return a list of project signals and cache update methods."""
+        return [
+            ("main-file-opened",   self._update_subtitle_cache),
+            ("main-texts-changed", self._on_project_main_texts_changed),
+            ("notify::framerate",  self._update_subtitle_cache),
+            ("positions-changed",  self._on_project_positions_changed),
+            ("subtitles-inserted", self._on_project_subtitles_inserted),
+            ("subtitles-moved",    self._on_project_subtitles_moved),
+            ("subtitles-removed",  self._on_project_subtitles_removed),
+            # Opening translation can add subtitles without signals.
+            ("translation-file-opened", self._update_subtitle_cache),
+        ]
 
     def _init_cache_updates(self):
         """Initialize cache updates on application signals."""
         self.connect("page-added",    self._update_subtitle_cache)
-        self.connect("page-changed",  self._update_subtitle_cache)
         self.connect("page-closed",   self._update_subtitle_cache)
         self.connect("page-switched", self._update_subtitle_cache)
 
@@ -228,9 +252,9 @@ class VideoAgent(aeidon.Delegate):
         pos = self.player.get_position(aeidon.modes.SECONDS)
         if pos is None:
             return True # to be called again.
-        subtitles = list(filter(lambda x: x[0] <= pos <= x[1], self._cache))
-        if subtitles:
-            text = subtitles[-1][2]
+        texts = self._cache.find(pos)
+        if texts:
+            text = texts[-1]
             if text != self.player.subtitle_text_raw:
                 self.player.subtitle_text = text
         else:
@@ -243,6 +267,55 @@ class VideoAgent(aeidon.Delegate):
         self.volume_button.set_value(self.player.volume)
         return True # to be called again.
 
+    def _on_project_main_texts_changed(self, project, ranges):
+        """Update texts in subtitle cache."""
+        for index in itertools.chain.from_iterable(ranges):
+            self._cache.set_value(index, project.subtitles[index].main_text)
+
+    def _on_project_positions_changed(self, project, ranges):
+        """Update positions in subtitle cache."""
+        if sum(map(len, ranges)) > gaupol.Page._reload_limit:
+            # Changing each of many intervals would mostly reorder
+            # them one by one, rebuilding once is faster.
+            return self._rebuild_subtitle_cache(project)
+        for index in itertools.chain.from_iterable(ranges):
+            subtitle = project.subtitles[index]
+            self._cache.set(index,
+                            subtitle.start_seconds,
+                            subtitle.end_seconds,
+                            subtitle.main_text)
+
+    def _on_project_subtitles_inserted(self, project, ranges):
+        """Insert subtitles to subtitle cache."""
+        if sum(map(len, ranges)) > gaupol.Page._reload_limit:
+            return self._rebuild_subtitle_cache(project)
+        for index in itertools.chain.from_iterable(ranges):
+            subtitle = project.subtitles[index]
+            self._cache.insert(index,
+                               subtitle.start_seconds,
+                               subtitle.end_seconds,
+                               subtitle.main_text)
+
+    def _on_project_subtitles_moved(self, project, order):
+        """Update moved subtitles in subtitle cache."""
+        indices = [i for i, x in enumerate(order) if x != i]
+        if len(indices) > gaupol.Page._reload_limit:
+            return self._rebuild_subtitle_cache(project)
+        for index in indices:
+            subtitle = project.subtitles[index]
+            self._cache.set(index,
+                            subtitle.start_seconds,
+                            subtitle.end_seconds,
+                            subtitle.main_text)
+
+    def _on_project_subtitles_removed(self, project, ranges):
+        """Remove subtitles from subtitle cache."""
+        if sum(map(len, ranges)) > gaupol.Page._reload_limit:
+            return self._rebuild_subtitle_cache(project)
+        for rows in reversed(ranges):
+            for index in reversed(rows):
+                self._cache.pop(index)
+
     @aeidon.deco.export
     def _on_seek_backward_activate(self, *args):
         """Seek backward."""
@@ -267,17 +340,19 @@ class VideoAgent(aeidon.Delegate):
     def _on_seek_next_activate(self, *args):
         """Seek to the start of the next subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
-        subtitles = list(filter(lambda x: x[0] > pos + 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[0][0])
+        if pos is None: return
+        subtitle = self._cache.find_next(pos + 0.001)
+        if subtitle is None: return
+        self.player.seek(subtitle[0])
 
     @aeidon.deco.export
     def _on_seek_previous_activate(self, *args):
         """Seek to the start of the previous subtitle."""
         pos = self.player.get_position(aeidon.modes.SECONDS)
-        subtitles = list(filter(lambda x: x[1] < pos - 0.001, self._cache))
-        if not subtitles: return
-        self.player.seek(subtitles[-1][0])
+        if pos is None: return
+        subtitle = self._cache.find_previous(pos - 0.001)
+        if subtitle is None: return
+        self.player.seek(subtitle[0])
 
     @aeidon.deco.export
     def _on_seek_selection_end_activate(self, *args):
@@ -330,6 +405,12 @@ class VideoAgent(aeidon.Delegate):
         self.volume_button.set_value(self.player.volume)
         self.update_gui()
 
+    def _rebuild_subtitle_cache(self, project):
+        """Rebuild subtitle cache from subtitles of `project`."""
+        self._cache = aeidon.IntervalIndex(
+            (x.start_seconds, x.end_seconds, x.main_text)
+            for x in project.subtitles)
+
     def _update_languages_menu(self):
         """Update the audio language selection menu."""
         menu = self.get_menubar_section("audio-languages-placeholder")
@@ -348,5 +429,8 @@ class VideoAgent(aeidon.Delegate):
         page = self.get_current_page()
         if self.player is None or page is None:
             return self._clear_subtitle_cache()
-        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
-                       for x in page.project.subtitles]
+        self._disconnect_cache_project()
+        self._rebuild_subtitle_cache(page.project)
+        self._cache_project = page.project
+        for signal, method in self._get_cache_project_handlers():
+            self._cache_project.connect(signal, method)
@@ -63,9 +63,9 @@ class ViewAgent(aeidon.Delegate):
         page.project.set_framerate(framerate, register=None)
         gaupol.conf.editor.framerate = framerate
         if page.edit_mode != page.project.main_file.mode:
-            rows = list(range(len(page.project.subtitles)))
+            ranges = [range(len(page.project.subtitles))]
             fields = [x for x in gaupol.fields if x.is_position]
-            page.reload_view(rows, fields)
+            page.reload_view(ranges, fields)
         self.update_gui()
         gaupol.util.set_cursor_normal(self.window)
 
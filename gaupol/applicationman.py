@@ -144,8 +144,8 @@ class ApplicationManager(Gtk.Application):
             metavar=_("METHOD"),
             dest="align_method",
             default="position",
-            choices=["number", "position"],
-            help=_("method used to align translation subtitles: 'number' or 'position'"))
+            choices=["number", "position", "overlap"],
+            help=_("method used to align translation subtitles: 'number', 'position' or 'overlap'"))
 
         parser.add_argument(
             "-v", "--video-file",
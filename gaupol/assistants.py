@@ -18,8 +18,12 @@
 """Assistant to guide through multiple text correction tasks."""
 
 import aeidon
+import collections
+import concurrent.futures
 import gaupol
+import multiprocessing
 import os
+import pickle
 
 from aeidon.i18n   import _, n_
 from gi.repository import Gdk
@@ -44,6 +48,8 @@ class TextAssistantPage(Gtk.Box):
 
     Of these attributes, :attr:`description`, :attr:`handle` and :attr:`title`
     are only required for pages of type :attr:`Gtk.AssistantPageType.CONTENT`.
+    Such pages should also define a method ``get_corrections``, that returns
+    a list of corrections as accepted by :func:`aeidon.correction.correct_texts`.
     """
 
     def __init__(self, assistant):
@@ -226,8 +232,8 @@ class LocalePage(BuilderPage):
         self._init_combo_boxes()
         self._init_values()
 
-    def correct_texts(self, project, indices, doc):
-        """Correct texts in `project`."""
+    def get_corrections(self):
+        """Return a list of corrections to apply to texts."""
         raise NotImplementedError
 
     def _filter_patterns(self, patterns):
@@ -423,14 +429,14 @@ class CapitalizationPage(LocalePage):
 
     _ui_file_basename = "capitalization-page.ui"
 
-    def correct_texts(self, project, indices, doc):
-        """Correct texts in `project`."""
+    def get_corrections(self):
+        """Return a list of corrections to apply to texts."""
         script = self._get_script()
         language = self._get_language()
         country = self._get_country()
         self._manager.save_config(script, language, country)
         patterns = self._manager.get_patterns(script, language, country)
-        project.capitalize(indices, doc, patterns)
+        return [("capitalize", dict(patterns=patterns))]
 
     def _init_attributes(self):
         """Initialize values of page attributes."""
@@ -452,14 +458,14 @@ class CommonErrorPage(LocalePage):
     _ui_file_basename = "common-error-page.ui"
     _widgets = ("human_check", "ocr_check") + LocalePage._widgets
 
-    def correct_texts(self, project, indices, doc):
-        """Correct texts in `project`."""
+    def get_corrections(self):
+        """Return a list of corrections to apply to texts."""
         script = self._get_script()
         language = self._get_language()
         country = self._get_country()
         self._manager.save_config(script, language, country)
         patterns = self._manager.get_patterns(script, language, country)
-        project.correct_common_errors(indices, doc, patterns)
+        return [("correct_common_errors", dict(patterns=patterns))]
 
     def _init_attributes(self):
         """Initialize values of page attributes."""
@@ -510,14 +516,14 @@ class HearingImpairedPage(LocalePage):
 
     _ui_file_basename = "hearing-impaired-page.ui"
 
-    def correct_texts(self, project, indices, doc):
-        """Correct texts in `project`."""
+    def get_corrections(self):
+        """Return a list of corrections to apply to texts."""
         script = self._get_script()
         language = self._get_language()
         country = self._get_country()
         self._manager.save_config(script, language, country)
         patterns = self._manager.get_patterns(script, language, country)
-        project.remove_hearing_impaired(indices, doc, patterns)
+        return [("remove_hearing_impaired", dict(patterns=patterns))]
 
     def _init_attributes(self):
         """Initialize values of page attributes."""
@@ -550,20 +556,28 @@ class JoinSplitWordsPage(BuilderPage):
         self.title = _("Join or Split Words")
         self._init_values()
 
-    def correct_texts(self, project, indices, doc):
-        """Correct texts in `project`."""
+    def get_corrections(self):
+        """Return a list of corrections to apply to texts."""
         import enchant
+        corrections = []
         language = gaupol.conf.spell_check.language
         if gaupol.conf.join_split_words.join:
-            try:
-                project.spell_check_join_words(indices, doc, language)
-            except enchant.Error as error:
-                return self._show_error_dialog(str(error))
+            corrections.append(("spell_check_join_words",
+                                dict(language=language)))
+
         if gaupol.conf.join_split_words.split:
-            try:
-                project.spell_check_split_words(indices, doc, language)
-            except enchant.Error as error:
-                return self._show_error_dialog(str(error))
+            corrections.append(("spell_check_split_words",
+                                dict(language=language)))
+
+        if not corrections: return corrections
+        try:
+            # Check the dictionary here, since errors in worker
+            # processes could not be shown until all is done.
+            aeidon.SpellChecker(language)
+        except enchant.Error as error:
+            self._show_error_dialog(str(error))
+            return []
+        return corrections
 
     def _init_values(self):
         """Initialize default values for widgets."""
@@ -608,24 +622,27 @@ class LineBreakPage(LocalePage):
 
     _ui_file_basename = "line-break-page.ui"
 
-    def correct_texts(self, project, indices, doc):
-        """Correct texts in `project`."""
+    def get_corrections(self):
+        """Return a list of corrections to apply to texts."""
         script = self._get_script()
         language = self._get_language()
         country = self._get_country()
         self._manager.save_config(script, language, country)
         patterns = self._manager.get_patterns(script, language, country)
         length_func = gaupol.ruler.get_length_function(self.conf.length_unit)
+        if self.conf.length_unit == gaupol.length_units.CHAR:
+            # Lines measured contain no line breaks, for which len
+            # equals character length and, unlike the ruler, can be
+            # passed to worker processes and is faster to break lines.
+            length_func = len
         skip = self.conf.use_skip_max_length or self.conf.use_skip_max_lines
-        project.break_lines(indices=indices,
-                            doc=doc,
-                            patterns=patterns,
-                            length_func=length_func,
-                            max_length=self.conf.max_length,
-                            max_lines=self.conf.max_lines,
-                            skip=skip,
-                            max_skip_length=self._max_skip_length,
-                            max_skip_lines=self._max_skip_lines)
+        return [("break_lines", dict(patterns=patterns,
+                                     length_func=length_func,
+                                     max_length=self.conf.max_length,
+                                     max_lines=self.conf.max_lines,
+                                     skip=skip,
+                                     max_skip_length=self._max_skip_length,
+                                     max_skip_lines=self._max_skip_lines))]
 
     def _init_attributes(self):
         """Initialize values of page attributes."""
@@ -903,6 +920,12 @@ class ConfirmationPage(BuilderPage):
         self._remove_check.set_active(self.conf.remove_blank)
         self._preview_button.set_sensitive(False)
 
+    def insert_changes(self, position, page, changes):
+        """Insert `changes` to texts of `page` to tree view at `position`."""
+        store = self._tree_view.get_model()
+        for i, (index, orig, new) in enumerate(changes):
+            store.insert(position + i, (page, index, True, orig, new))
+
     def _on_mark_all_button_clicked(self, *args):
         """Set all accept column values to ``True``."""
         store = self._tree_view.get_model()
@@ -969,7 +992,9 @@ class TextAssistant(Gtk.Assistant):
     def __init__(self, parent, application):
         """Initialize a :class:`TextAssistant` instance."""
         GObject.GObject.__init__(self)
+        self._cancelled = False
         self._confirmation_page = ConfirmationPage(self)
+        self._futures = []
         self._introduction_page = IntroductionPage(self)
         self._previous_page = None
         self._progress_page = ProgressPage(self)
@@ -1001,43 +1026,38 @@ class TextAssistant(Gtk.Assistant):
                 page.set_visible(pages[0].get_visible())
         pages[0].connect("notify::visible", on_notify_visible, pages)
 
-    def _copy_project(self, project):
-        """Return a copy of `project` with some same properties."""
-        copy = aeidon.Project(project.framerate)
-        copy.main_file = project.main_file
-        copy.tran_file = project.tran_file
-        copy.subtitles = [x.copy() for x in project.subtitles]
-        return copy
-
     def _correct_texts(self, assistant_pages):
         """Correct texts by all pages and present changes."""
-        changes = []
         target = self._introduction_page.get_target()
         field = self._introduction_page.get_field()
         doc = gaupol.util.text_field_to_document(field)
         rows = self.application.get_target_rows(target)
         application_pages = self.application.get_target_pages(target)
+        corrections = []
+        for page in assistant_pages:
+            corrections.extend(page.get_corrections())
+        if self._cancelled: return
         total = len(application_pages) * len(assistant_pages)
         self._progress_page.reset(total)
-        for application_page in application_pages:
-            name = application_page.get_main_basename()
-            self._progress_page.set_project_name(name)
-            project = application_page.project
-            # Initialize a dummy project to apply corrections in
-            # to be able to present those corrections for approval and
-            # to finally be able to apply only approved corrections.
-            dummy = self._copy_project(project)
-            static_subtitles = dummy.subtitles[:]
-            for page in assistant_pages:
-                self._progress_page.set_task_name(page.title)
-                page.correct_texts(dummy, rows, doc)
-                self._progress_page.bump_progress()
-            for i in range(len(static_subtitles)):
-                orig = project.subtitles[i].get_text(doc)
-                new = static_subtitles[i].get_text(doc)
-                if orig == new: continue
-                changes.append((application_page, i, orig, new))
-        self._prepare_confirmation_page(doc, changes)
+        titles = ", ".join(x.title for x in assistant_pages)
+        self._progress_page.set_task_name(titles)
+        self._confirmation_page.populate_tree_view(())
+        counts = [None] * len(application_pages)
+        def on_done(i, changes):
+            page = application_pages[i]
+            counts[i] = len(changes)
+            # Keep changes in the order of pages regardless
+            # of the order in which correcting them finishes.
+            position = sum(x for x in counts[:i] if x is not None)
+            self._confirmation_page.insert_changes(position, page, changes)
+            self._progress_page.set_project_name(page.get_main_basename())
+            self._progress_page.bump_progress(len(assistant_pages))
+        snapshots = [aeidon.TextSnapshot(x.project, doc)
+                     for x in application_pages]
+
+        self._run_corrections(snapshots, rows, corrections, on_done)
+        if self._cancelled: return
+        self._prepare_confirmation_page(doc, sum(counts))
         self.set_current_page(self.get_current_page() + 1)
 
     def _init_properties(self):
@@ -1066,14 +1086,16 @@ class TextAssistant(Gtk.Assistant):
         gaupol.util.set_cursor_busy(self)
         edits = removals = 0
         changes = self._confirmation_page.get_confirmed_changes()
-        changed_pages = aeidon.util.get_unique([x[0] for x in changes])
+        changed_pages = collections.OrderedDict()
+        for page, index, orig, new in changes:
+            changed_pages.setdefault(page, []).append((index, new))
         field = self._introduction_page.get_field()
         doc = gaupol.util.text_field_to_document(field)
         description = _("Correcting texts")
         register = aeidon.registers.DO
-        for page in changed_pages:
-            indices = [x[1] for x in changes if x[0] is page]
-            texts = [x[3] for x in changes if x[0] is page]
+        for page, changes in changed_pages.items():
+            indices = [x[0] for x in changes]
+            texts = [x[1] for x in changes]
             if indices and texts:
                 page.project.replace_texts(indices, doc, texts)
                 page.project.set_action_description(register, description)
@@ -1090,7 +1112,11 @@ class TextAssistant(Gtk.Assistant):
         gaupol.util.set_cursor_normal(self)
 
     def _on_cancel(self, *args):
-        """Destroy assistant."""
+        """Cancel possible correcting of texts and destroy assistant."""
+        # Corrections already running are finished, but discarded.
+        self._cancelled = True
+        for future in self._futures:
+            future.cancel()
         self._save_window_geometry()
         self.destroy()
 
@@ -1116,9 +1142,8 @@ class TextAssistant(Gtk.Assistant):
         maximized = bool(state & Gdk.WindowState.MAXIMIZED)
         gaupol.conf.text_assistant.maximized = maximized
 
-    def _prepare_confirmation_page(self, doc, changes):
-        """Present `changes` and activate confirmation page."""
-        count = len(changes)
+    def _prepare_confirmation_page(self, doc, count):
+        """Activate confirmation page presenting `count` changes."""
         title = n_("Confirm {:d} Change",
                    "Confirm {:d} Changes",
                    count).format(count)
@@ -1126,7 +1151,6 @@ class TextAssistant(Gtk.Assistant):
         self.set_page_title(self._confirmation_page, title)
         self._confirmation_page.application = self.application
         self._confirmation_page.doc = doc
-        self._confirmation_page.populate_tree_view(changes)
         self.set_page_complete(self._progress_page, True)
 
     def _prepare_introduction_page(self):
@@ -1136,7 +1160,7 @@ class TextAssistant(Gtk.Assistant):
         pages.remove(self._introduction_page)
         pages.remove(self._progress_page)
         pages.remove(self._confirmation_page)
-        pages = [x for x in pages if hasattr(x, "correct_texts")]
+        pages = [x for x in pages if hasattr(x, "get_corrections")]
         self._introduction_page.populate_tree_view(pages)
 
     def _prepare_progress_page(self, pages):
@@ -1145,6 +1169,48 @@ class TextAssistant(Gtk.Assistant):
         self.set_page_complete(self._progress_page, False)
         gaupol.util.delay_add(10, self._correct_texts, pages)
 
+    def _run_corrections(self, snapshots, rows, corrections, callback):
+        """
+        Apply `corrections` to `snapshots` and call `callback` with changes.
+
+        `callback` is called with the index of snapshot and its changes
+        as soon as each is done. Snapshots are corrected concurrently in
+        worker processes, unless `corrections` cannot be passed to them,
+        e.g. due to a length function that measures rendered text.
+        """
+        workers = min(len(snapshots), os.cpu_count() or 1)
+        try:
+            pickle.dumps(corrections)
+        except (AttributeError, TypeError, pickle.PicklingError):
+            workers = 0
+        if workers < 1 or not corrections:
+            for i, snapshot in enumerate(snapshots):
+                if self._cancelled: return
+                changes = aeidon.correction.correct_texts(
+                    snapshot, rows, corrections)
+                callback(i, changes)
+            return
+        def on_done(future):
+            if self._cancelled or future.cancelled(): return
+            if future.exception() is not None: return
+            callback(futures[future], future.result())
+        # Don't fork the application, which has other threads running,
+        # but start fresh processes, to which snapshots are pickled.
+        context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(
+                workers, mp_context=context) as executor:
+            futures = {executor.submit(aeidon.correction.correct_texts,
+                                       snapshot, rows, corrections): i
+                       for i, snapshot in enumerate(snapshots)}
+
+            self._futures = list(futures)
+            gaupol.util.wait_for(self._futures, on_done)
+        self._futures = []
+        for future in futures:
+            # Raise possible unexpected errors.
+            if future.cancelled(): continue
+            future.result()
+
     def _save_window_geometry(self):
         """Save the geometry of the assistant window."""
         if not gaupol.conf.text_assistant.maximized:
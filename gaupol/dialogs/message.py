@@ -17,9 +17,18 @@
 
 """Message dialog classes."""
 
+import gaupol
+
+from aeidon.i18n   import _
 from gi.repository import Gtk
 
-__all__ = ("ErrorDialog", "InfoDialog", "QuestionDialog", "WarningDialog")
+__all__ = (
+    "ErrorDialog",
+    "InfoDialog",
+    "ProgressDialog",
+    "QuestionDialog",
+    "WarningDialog",
+)
 
 FLAGS = Gtk.DialogFlags.MODAL | Gtk.DialogFlags.DESTROY_WITH_PARENT
 
@@ -58,6 +67,34 @@ class InfoDialog(Gtk.MessageDialog):
             self.format_secondary_text(message)
 
 
+class ProgressDialog(Gtk.MessageDialog):
+
+    """Dialog displaying progress of a task, optionally cancellable."""
+
+    def __init__(self, parent, title, cancellable=True):
+        """Initialize a :class:`ProgressDialog` instance."""
+        Gtk.MessageDialog.__init__(self,
+                                   parent=parent,
+                                   flags=FLAGS,
+                                   type=Gtk.MessageType.OTHER,
+                                   buttons=Gtk.ButtonsType.NONE,
+                                   message_format=title)
+
+        self._progress_bar = Gtk.ProgressBar()
+        self._progress_bar.set_show_text(True)
+        gaupol.util.pack_start_fill(self.get_message_area(),
+                                    self._progress_bar)
+
+        self._progress_bar.show()
+        if cancellable:
+            self.add_button(_("_Cancel"), Gtk.ResponseType.CANCEL)
+
+    def set_progress(self, done, total, text=None):
+        """Show `done` out of `total` tasks complete and `text`."""
+        self._progress_bar.set_fraction(done / max(1, total))
+        self._progress_bar.set_text(text)
+
+
 class QuestionDialog(Gtk.MessageDialog):
 
     """Base class for question dialogs."""
@@ -45,6 +45,7 @@ class SpellCheckDialog(gaupol.BuilderDialog):
     :ivar _pager: Iterator to iterate over all target pages
     :ivar _replacements: List of misspelled words and their replacements
     :ivar _row: Row currently being checked
+    :ivar _speller: :class:`aeidon.SpellChecker` instance used for suggestions
     """
     _max_replacements = 10000
     _personal_dir = os.path.join(aeidon.CONFIG_HOME_DIR, "spell-check")
@@ -83,6 +84,7 @@ class SpellCheckDialog(gaupol.BuilderDialog):
         self._pager = None
         self._replacements = []
         self._row = None
+        self._speller = None
         self._init_dialog(parent)
         self._init_spell_check()
         self._init_widgets()
@@ -144,7 +146,7 @@ class SpellCheckDialog(gaupol.BuilderDialog):
         self._join_back_button.set_sensitive(leading.isspace())
         self._join_forward_button.set_sensitive(trailing.isspace())
         self._set_entry_text("")
-        self._populate_tree_view(self._checker.suggest())
+        self._populate_tree_view(self._speller.suggest(self._checker.word))
         self._tree_view.grab_focus()
 
     def _advance_row(self):
@@ -182,11 +184,11 @@ class SpellCheckDialog(gaupol.BuilderDialog):
         """
         try:
             import enchant.checker
-            dictionary = enchant.Dict(self._language)
-            # Sometimes enchant will initialize a dictionary that will not
-            # actually work when trying to use it, hence check something.
-            dictionary.check("gaupol")
-            self._checker = enchant.checker.SpellChecker(dictionary, "")
+            # Share dictionary and cached suggestions with other spell-checks
+            # of the same language, e.g. joining and splitting words.
+            self._speller = aeidon.SpellChecker(self._language)
+            self._checker = enchant.checker.SpellChecker(
+                self._speller.dictionary, "")
         except enchant.Error as error:
             self._show_error_dialog(str(error))
             raise ValueError("Dictionary initialization failed for language {}"
@@ -256,7 +258,7 @@ class SpellCheckDialog(gaupol.BuilderDialog):
 
     def _on_add_button_clicked(self, *args):
         """Add the current word to the user dictionary."""
-        self._checker.dict.add(self._checker.word)
+        self._speller.add(self._checker.word)
         self._advance()
 
     def _on_edit_button_clicked(self, *args):
@@ -273,7 +275,7 @@ class SpellCheckDialog(gaupol.BuilderDialog):
     def _on_entry_changed(self, entry):
         """Populate suggestions based on text in `entry`."""
         word = entry.get_text()
-        suggestions = (self._checker.suggest(word) if word else [])
+        suggestions = (self._speller.suggest(word) if word else [])
         self._populate_tree_view(suggestions, select=False)
         self._replace_button.set_sensitive(bool(word))
         self._replace_all_button.set_sensitive(bool(word))
@@ -45,6 +45,14 @@ class TestInfoDialog(_TestMessageDialog):
         self.dialog.show()
 
 
+class TestProgressDialog(_TestMessageDialog):
+
+    def setup_method(self, method):
+        self.dialog = gaupol.ProgressDialog(Gtk.Window(), "test")
+        self.dialog.set_progress(1, 2, "test")
+        self.dialog.show()
+
+
 class TestQuestionDialog(_TestMessageDialog):
 
     def setup_method(self, method):
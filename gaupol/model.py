@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""List data model that reads subtitle data directly from a project."""
+
+import aeidon
+import collections
+import random
+
+from gi.repository import GObject
+from gi.repository import Gtk
+
+__all__ = ("SubtitleListModel",)
+
+
+class SubtitleListModel(GObject.Object, Gtk.TreeModel):
+
+    """
+    List data model that reads subtitle data directly from a project.
+
+    :ivar edit_mode: :attr:`aeidon.modes` item corresponding to editing mode
+    :ivar project: The :class:`aeidon.Project` instance to read data from
+
+    Values of cells are formatted on demand and cached for a limited amount
+    of recently used rows, usually the ones visible in a view. Data is never
+    copied into the model, so no formatted values are kept for rows not
+    displayed. Views still walk and measure all rows when the model is set,
+    which is not free for a large amount of subtitles.
+
+    The amount of rows in the model changes only when notified of changes in
+    the subtitles of :attr:`project` and emits the corresponding signals for
+    views, which thus see a consistent state at all times. If :attr:`project`
+    or its subtitles are replaced, :meth:`set_project` should be called while
+    the model is not set to any view.
+    """
+
+    _cache_limit = 500
+
+    def __init__(self, edit_mode):
+        """Initialize a :class:`SubtitleListModel` instance."""
+        GObject.Object.__init__(self)
+        self._cache = collections.OrderedDict()
+        self._count = 0
+        self._stamp = random.randint(1, 2**31-1)
+        self.edit_mode = edit_mode
+        self.project = None
+
+    def _clear_cache_from(self, row):
+        """Remove cached values of `row` and all rows after it."""
+        for cached_row in [x for x in self._cache if x >= row]:
+            del self._cache[cached_row]
+
+    def do_get_column_type(self, index):
+        """Return the type of data in column `index`."""
+        if self.edit_mode == aeidon.modes.TIME:
+            return (GObject.TYPE_INT,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_DOUBLE,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_STRING)[index]
+        if self.edit_mode == aeidon.modes.FRAME:
+            return (GObject.TYPE_INT,
+                    GObject.TYPE_INT,
+                    GObject.TYPE_INT,
+                    GObject.TYPE_INT,
+                    GObject.TYPE_STRING,
+                    GObject.TYPE_STRING)[index]
+        raise ValueError("Invalid mode: {}"
+                         .format(repr(self.edit_mode)))
+
+    def do_get_flags(self):
+        """Return flags of supported features."""
+        return Gtk.TreeModelFlags.LIST_ONLY
+
+    def do_get_iter(self, path):
+        """Return ``True`` and an iterator pointing to `path`."""
+        indices = path.get_indices()
+        if len(indices) != 1: return (False, None)
+        return self._new_iter(indices[0])
+
+    def do_get_n_columns(self):
+        """Return the amount of columns."""
+        return 6
+
+    def do_get_path(self, itr):
+        """Return a :class:`Gtk.TreePath` pointing to `itr`."""
+        return Gtk.TreePath.new_from_indices([self._get_row(itr)])
+
+    def do_get_value(self, itr, column):
+        """Return the value in `itr` and `column`."""
+        return self._get_values(self._get_row(itr))[column]
+
+    def do_iter_children(self, parent):
+        """Return ``True`` and an iterator pointing to first child."""
+        if parent is not None: return (False, None)
+        return self._new_iter(0)
+
+    def do_iter_has_child(self, itr):
+        """Return ``False``, since rows in a list have no children."""
+        return False
+
+    def do_iter_n_children(self, itr):
+        """Return the amount of rows if `itr` is ``None``."""
+        return (self._count if itr is None else 0)
+
+    def do_iter_next(self, itr):
+        """Set `itr` to point to the next row and return ``True``."""
+        row = self._get_row(itr) + 1
+        if row >= self._count: return False
+        itr.user_data = row
+        return True
+
+    def do_iter_nth_child(self, parent, n):
+        """Return ``True`` and an iterator pointing to row `n`."""
+        if parent is not None: return (False, None)
+        return self._new_iter(n)
+
+    def do_iter_parent(self, child):
+        """Return ``False``, since rows in a list have no parent."""
+        return (False, None)
+
+    def do_iter_previous(self, itr):
+        """Set `itr` to point to the previous row and return ``True``."""
+        row = self._get_row(itr) - 1
+        if row < 0: return False
+        itr.user_data = row
+        return True
+
+    def _get_row(self, itr):
+        """Return the row `itr` points to."""
+        # Row zero is stored as a null pointer, which reads as None.
+        return itr.user_data or 0
+
+    def _get_values(self, row):
+        """Return a tuple of values in `row`, formatting if needed."""
+        if row in self._cache:
+            self._cache.move_to_end(row)
+            return self._cache[row]
+        mode = self.edit_mode
+        subtitle = self.project.subtitles[row]
+        duration = (subtitle.duration_seconds
+                    if mode == aeidon.modes.TIME
+                    else subtitle.duration_frame)
+
+        values = (row + 1,
+                  subtitle.get_start(mode),
+                  subtitle.get_end(mode),
+                  duration,
+                  subtitle.main_text,
+                  subtitle.tran_text)
+
+        self._cache[row] = values
+        while len(self._cache) > self._cache_limit:
+            self._cache.popitem(last=False)
+        return values
+
+    def _new_iter(self, row):
+        """Return ``True`` and an iterator pointing to `row`."""
+        if not 0 <= row < self._count: return (False, None)
+        itr = Gtk.TreeIter()
+        itr.stamp = self._stamp
+        itr.user_data = row
+        return (True, itr)
+
+    def rows_changed(self, ranges):
+        """Notify views that data in `ranges` of rows has changed."""
+        # The cache is small, check its rows instead of all changed rows.
+        for row in [x for x in self._cache if any(x in y for y in ranges)]:
+            del self._cache[row]
+        for rows in ranges:
+            for row in rows:
+                success, itr = self._new_iter(row)
+                if not success: break
+                path = Gtk.TreePath.new_from_indices([row])
+                self.row_changed(path, itr)
+
+    def rows_inserted(self, ranges):
+        """Notify views that `ranges` of rows have been inserted."""
+        if not ranges: return
+        # Following rows have shifted, invalidate from the first onward.
+        self._clear_cache_from(ranges[0].start)
+        for rows in ranges:
+            for row in rows:
+                self._count += 1
+                path = Gtk.TreePath.new_from_indices([row])
+                self.row_inserted(path, self._new_iter(row)[1])
+
+    def rows_moved(self, order):
+        """Notify views that rows have been moved to `order`."""
+        # Order is a list of old rows at new rows.
+        for row in [i for i, x in enumerate(order) if x != i]:
+            self._cache.pop(row, None)
+        path = Gtk.TreePath.new()
+        self.rows_reordered(path, None, order)
+
+    def rows_removed(self, ranges):
+        """Notify views that `ranges` of rows have been removed."""
+        if not ranges: return
+        self._clear_cache_from(ranges[0].start)
+        for rows in reversed(ranges):
+            for row in reversed(rows):
+                self._count -= 1
+                path = Gtk.TreePath.new_from_indices([row])
+                self.row_deleted(path)
+
+    def set_project(self, project):
+        """
+        Set project to read subtitle data from.
+
+        This should only be called while the model is not set to any view.
+        """
+        self._cache.clear()
+        self._count = (len(project.subtitles) if project is not None else 0)
+        self.project = project
@@ -50,6 +50,10 @@ class Page(aeidon.Observable):
     """
     signals = ("close-request", "view-created")
 
+    # Amount of changed rows above which it is faster
+    # to reload the entire view than to update rows one by one.
+    _reload_limit = 50
+
     def __init__(self, count=0):
         """Initialize a :class:`Page` instance."""
         aeidon.Observable.__init__(self)
@@ -89,29 +93,6 @@ class Page(aeidon.Observable):
             return os.path.basename(self.project.main_file.path)
         return self.untitle
 
-    def _get_subtitle_value(self, row, field):
-        """Return value of subtitle data for `row` and `field`."""
-        mode = self.edit_mode
-        subtitle = self.project.subtitles[row]
-        if field == gaupol.fields.START:
-            return subtitle.get_start(mode)
-        if field == gaupol.fields.END:
-            return subtitle.get_end(mode)
-        if field == gaupol.fields.DURATION:
-            if mode == aeidon.modes.TIME:
-                return subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                return subtitle.duration_frame
-            raise ValueError("Invalid mode: {}"
-                             .format(repr(mode)))
-
-        if field == gaupol.fields.MAIN_TEXT:
-            return subtitle.main_text
-        if field == gaupol.fields.TRAN_TEXT:
-            return subtitle.tran_text
-        raise ValueError("Invalid field: {}"
-                         .format(repr(field)))
-
     def _get_tab_close_button(self):
         """Initialize and return a tab close button."""
         button = Gtk.Button()
@@ -144,10 +125,17 @@ class Page(aeidon.Observable):
                 basename = basename[:-len(extension)]
         return _("{} translation").format(basename)
 
+    def _has_focus_in(self, ranges):
+        """Return ``True`` if focus is in `ranges` of rows."""
+        row = self.view.get_focus()[0]
+        if row is None: return False
+        return any(row in x for x in ranges)
+
     def _init_project(self):
         """Initialize :class:`aeidon.Project` with proper properties."""
         framerate = gaupol.conf.editor.framerate
         self.project = aeidon.Project(framerate)
+        self.view.get_model().set_project(self.project)
 
     def _init_signal_handlers(self):
         """Initialize signal handlers."""
@@ -161,6 +149,7 @@ class Page(aeidon.Observable):
         aeidon.util.connect(self, "project", "positions-changed")
         aeidon.util.connect(self, "project", "subtitles-changed")
         aeidon.util.connect(self, "project", "subtitles-inserted")
+        aeidon.util.connect(self, "project", "subtitles-moved")
         aeidon.util.connect(self, "project", "subtitles-removed")
         aeidon.util.connect(self, "project", "translation-file-opened")
         aeidon.util.connect(self, "project", "translation-texts-changed")
@@ -200,77 +189,59 @@ class Page(aeidon.Observable):
         self.reload_view_all()
         gaupol.util.iterate_main()
 
-    def _on_project_main_texts_changed(self, project, rows):
-        """Reload and select main texts in rows."""
-        if not rows: return
+    def _on_project_main_texts_changed(self, project, ranges):
+        """Reload and select main texts in `ranges` of rows."""
+        if not ranges: return
         fields = (gaupol.fields.MAIN_TEXT,)
-        self.reload_view(rows, fields)
-        if not self.view.get_focus()[0] in rows:
+        self.reload_view(ranges, fields)
+        if not self._has_focus_in(ranges):
             col = self.view.columns.MAIN_TEXT
-            self.view.set_focus(rows[0], col)
-        self.view.select_rows(rows)
+            self.view.set_focus(ranges[0].start, col)
+        self.view.select_ranges(ranges)
         gaupol.util.iterate_main()
 
-    def _on_project_positions_changed(self, project, rows):
-        """Reload and select positions in rows."""
-        if not rows: return
+    def _on_project_positions_changed(self, project, ranges):
+        """Reload and select positions in `ranges` of rows."""
+        if not ranges: return
         enum = gaupol.fields
         fields = (enum.START, enum.END, enum.DURATION)
-        self.reload_view(rows, fields)
-        if not self.view.get_focus()[0] in rows:
-            self.view.set_focus(rows[0])
-        self.view.select_rows(rows)
+        self.reload_view(ranges, fields)
+        if not self._has_focus_in(ranges):
+            self.view.set_focus(ranges[0].start)
+        self.view.select_ranges(ranges)
         gaupol.util.iterate_main()
 
-    def _on_project_subtitles_changed(self, project, rows):
-        """Reload and select subtitles in rows."""
-        if not rows: return
+    def _on_project_subtitles_changed(self, project, ranges):
+        """Reload and select subtitles in `ranges` of rows."""
+        if not ranges: return
         fields = [x for x in gaupol.fields]
         fields.remove(gaupol.fields.NUMBER)
-        self.reload_view(rows, fields)
-        if not self.view.get_focus()[0] in rows:
-            self.view.set_focus(rows[0])
-        self.view.select_rows(rows)
+        self.reload_view(ranges, fields)
+        if not self._has_focus_in(ranges):
+            self.view.set_focus(ranges[0].start)
+        self.view.select_ranges(ranges)
         gaupol.util.iterate_main()
 
-    def _on_project_subtitles_inserted(self, project, rows):
-        """Insert rows to the view and select them."""
-        if not rows: return
-        mode = self.edit_mode
-        store = self.view.get_model()
-        for row in sorted(rows):
-            subtitle = self.project.subtitles[row]
-            store.insert(row)
-            store[row][0] = row + 1
-            store[row][1] = subtitle.get_start(mode)
-            store[row][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[row][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[row][3] = subtitle.duration_frame
-            store[row][4] = subtitle.main_text
-            store[row][5] = subtitle.tran_text
-        self.view.set_focus(rows[0])
-        self.view.select_rows(rows)
+    def _on_project_subtitles_inserted(self, project, ranges):
+        """Insert `ranges` of rows to the view and select them."""
+        if not ranges: return
+        self._update_model(ranges, "rows_inserted")
+        self.view.set_focus(ranges[0].start)
+        self.view.select_ranges(ranges)
         gaupol.util.iterate_main()
 
-    def _on_project_subtitles_removed(self, project, rows):
-        """Remove rows from the view."""
-        if not rows: return
-        store = self.view.get_model()
-        if len(rows) > 50:
-            # Unset and later reset the model if removing a large amount
-            # of rows, because a large batch of separate live updates
-            # directly made to the view are slow.
-            self.view.set_model(None)
-        for row in reversed(sorted(rows)):
-            path = gaupol.util.tree_row_to_path(row)
-            store.remove(store.get_iter(path))
-        if len(rows) > 50:
-            self.view.set_model(store)
+    def _on_project_subtitles_moved(self, project, order):
+        """Reorder rows in the view."""
+        self.view.get_model().rows_moved(order)
+        gaupol.util.iterate_main()
+
+    def _on_project_subtitles_removed(self, project, ranges):
+        """Remove `ranges` of rows from the view."""
+        if not ranges: return
+        col = self.view.get_focus()[1]
+        self._update_model(ranges, "rows_removed")
         if self.project.subtitles:
-            row = min(rows[0], len(self.project.subtitles)-1)
-            col = self.view.get_focus()[1]
+            row = min(ranges[0].start, len(self.project.subtitles)-1)
             self.view.set_focus(row, col)
         gaupol.util.iterate_main()
 
@@ -279,15 +250,15 @@ class Page(aeidon.Observable):
         self.reload_view_all()
         gaupol.util.iterate_main()
 
-    def _on_project_translation_texts_changed(self, project, rows):
-        """Reload and select translation texts in rows."""
-        if not rows: return
+    def _on_project_translation_texts_changed(self, project, ranges):
+        """Reload and select translation texts in `ranges` of rows."""
+        if not ranges: return
         fields = (gaupol.fields.TRAN_TEXT,)
-        self.reload_view(rows, fields)
-        if not self.view.get_focus()[0] in rows:
+        self.reload_view(ranges, fields)
+        if not self._has_focus_in(ranges):
             col = self.view.columns.TRAN_TEXT
-            self.view.set_focus(rows[0], col)
-        self.view.select_rows(rows)
+            self.view.set_focus(ranges[0].start, col)
+        self.view.select_ranges(ranges)
         gaupol.util.iterate_main()
 
     def _on_tab_label_query_tooltip(self, label, x, y, keyboard, tooltip):
@@ -306,30 +277,22 @@ class Page(aeidon.Observable):
 
         return True # to show the tooltip.
 
-    def reload_view(self, rows, fields):
-        """Reload the view in `rows` and `fields`."""
-        store = self.view.get_model()
-        for row, field in ((x, y) for x in rows for y in fields):
-            value = self._get_subtitle_value(row, field)
-            store[row][field] = value
+    def reload_view(self, ranges, fields):
+        """Reload the view in `ranges` of rows and `fields`."""
+        # Cells are read on demand, all fields of rows are reloaded.
+        if sum(map(len, ranges)) <= self._reload_limit:
+            return self.view.get_model().rows_changed(ranges)
+        # Redraw once instead of notifying the view of each row.
+        row, col = self.view.get_focus()
+        self.reload_view_all()
+        if row is not None:
+            self.view.set_focus(row, col)
 
     def reload_view_all(self):
         """Clear and repopulate the entire view."""
         store = self.view.get_model()
         self.view.set_model(None)
-        store.clear()
-        mode = self.edit_mode
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.insert(i)
-            store[i][0] = i + 1
-            store[i][1] = subtitle.get_start(mode)
-            store[i][2] = subtitle.get_end(mode)
-            if mode == aeidon.modes.TIME:
-                store[i][3] = subtitle.duration_seconds
-            if mode == aeidon.modes.FRAME:
-                store[i][3] = subtitle.duration_frame
-            store[i][4] = subtitle.main_text
-            store[i][5] = subtitle.tran_text
+        store.set_project(self.project)
         self.view.set_model(store)
 
     def text_column_to_document(self, col):
@@ -341,6 +304,15 @@ class Page(aeidon.Observable):
         raise ValueError("Invalid column: {}"
                          .format(repr(col)))
 
+    def _update_model(self, ranges, name):
+        """Call model method `name` to insert or remove `ranges` of rows."""
+        if sum(map(len, ranges)) <= self._reload_limit:
+            return getattr(self.view.get_model(), name)(ranges)
+        # Reload the entire view if inserting or removing a large
+        # amount of rows, because a large batch of separate live
+        # updates, even to a view without a model, are slow.
+        self.reload_view_all()
+
     def update_tab_label(self):
         """Update the notebook tab label and return title."""
         title = self.get_main_basename()
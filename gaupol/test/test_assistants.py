@@ -51,10 +51,11 @@ class TestIntroductionPage(_TestBuilderPage):
 
 class _TestLocalePage(_TestBuilderPage):
 
-    def test_correct_texts(self):
-        self.page.correct_texts(self.new_project(),
-                                None,
-                                aeidon.documents.MAIN)
+    def test_get_corrections(self):
+        corrections = self.page.get_corrections()
+        project = self.new_project()
+        snapshot = aeidon.TextSnapshot(project, aeidon.documents.MAIN)
+        aeidon.correction.correct_texts(snapshot, None, corrections)
 
 
 class TestCapitalizationPage(_TestLocalePage):
@@ -104,10 +105,10 @@ class TestJoinSplitWordsPage(_TestBuilderPage):
         self.window.add(self.page)
         self.window.show_all()
 
-    def test_correct_texts(self):
-        self.page.correct_texts(self.project,
-                                None,
-                                aeidon.documents.MAIN)
+    def test_get_corrections(self):
+        corrections = self.page.get_corrections()
+        snapshot = aeidon.TextSnapshot(self.project, aeidon.documents.MAIN)
+        aeidon.correction.correct_texts(snapshot, None, corrections)
 
 
 class TestLineBreakPage(_TestLocalePage):
@@ -154,6 +155,14 @@ class TestConfirmationPage(_TestBuilderPage):
         self.window.add(self.page)
         self.window.show_all()
 
+    def test_insert_changes(self):
+        self.page.insert_changes(0, None, [(0, "a", "b"), (2, "e", "f")])
+        self.page.insert_changes(1, None, [(1, "c", "d")])
+        changes = self.page.get_confirmed_changes()
+        assert [x[1:] for x in changes] == [(0, "a", "b"),
+                                           (1, "c", "d"),
+                                           (2, "e", "f")]
+
 
 class TestTextAssistant(gaupol.TestCase):
 
@@ -170,3 +179,30 @@ class TestTextAssistant(gaupol.TestCase):
         self.assistant = gaupol.TextAssistant(
             self.application.window, self.application)
         self.assistant.show()
+
+    def test__run_corrections(self):
+        changes = []
+        page = self.application.get_current_page()
+        snapshot = aeidon.TextSnapshot(page.project, aeidon.documents.MAIN)
+        manager = aeidon.PatternManager("common-error")
+        patterns = manager.get_patterns("Latn", "en")
+        corrections = [("correct_common_errors", dict(patterns=patterns))]
+        self.assistant._run_corrections([snapshot, snapshot],
+                                        None,
+                                        corrections,
+                                        lambda *args: changes.append(args))
+
+        assert sorted(x[0] for x in changes) == [0, 1]
+        assert changes[0][1] == changes[1][1]
+
+    def test__run_corrections__cancel(self):
+        changes = []
+        page = self.application.get_current_page()
+        snapshot = aeidon.TextSnapshot(page.project, aeidon.documents.MAIN)
+        self.assistant._cancelled = True
+        self.assistant._run_corrections([snapshot],
+                                        None,
+                                        [],
+                                        lambda *args: changes.append(args))
+
+        assert not changes
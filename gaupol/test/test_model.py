@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2017 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import gaupol
+
+
+class TestSubtitleListModel(gaupol.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.model = gaupol.SubtitleListModel(aeidon.modes.TIME)
+        self.model.set_project(self.project)
+
+    def test___getitem__(self):
+        subtitle = self.project.subtitles[1]
+        assert self.model[1][0] == 2
+        assert self.model[1][1] == subtitle.start_time
+        assert self.model[1][2] == subtitle.end_time
+        assert self.model[1][4] == subtitle.main_text
+        assert self.model[1][5] == subtitle.tran_text
+
+    def test___getitem____frame(self):
+        self.model = gaupol.SubtitleListModel(aeidon.modes.FRAME)
+        self.model.set_project(self.project)
+        subtitle = self.project.subtitles[0]
+        assert self.model[0][1] == subtitle.start_frame
+        assert self.model[0][3] == subtitle.duration_frame
+
+    def test___iter__(self):
+        rows = [x[0] for x in self.model]
+        assert rows == list(range(1, len(self.project.subtitles) + 1))
+
+    def test___len__(self):
+        assert len(self.model) == len(self.project.subtitles)
+
+    def test_rows_changed(self):
+        assert self.model[0][4] == self.project.subtitles[0].main_text
+        self.project.subtitles[0].main_text = "test"
+        self.model.rows_changed([range(0, 1)])
+        assert self.model[0][4] == "test"
+
+    def test_rows_inserted(self):
+        assert self.model[1][4] == self.project.subtitles[1].main_text
+        self.project.subtitles.insert(1, self.project.new_subtitle())
+        self.model.rows_inserted([range(1, 2)])
+        assert len(self.model) == len(self.project.subtitles)
+        assert self.model[1][4] == ""
+
+    def test_rows_moved(self):
+        text = self.project.subtitles[2].main_text
+        assert self.model[0][4] == self.project.subtitles[0].main_text
+        order = list(range(len(self.project.subtitles)))
+        order.insert(0, order.pop(2))
+        self.project.reorder_subtitles(order)
+        self.model.rows_moved(order)
+        assert self.model[0][4] == text
+
+    def test_rows_removed(self):
+        text = self.project.subtitles[2].main_text
+        assert self.model[1][4] == self.project.subtitles[1].main_text
+        self.project.subtitles.pop(1)
+        self.model.rows_removed([range(1, 2)])
+        assert len(self.model) == len(self.project.subtitles)
+        assert self.model[1][4] == text
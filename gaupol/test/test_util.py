@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
+import concurrent.futures
 import gaupol
 
 from gi.repository import Gdk
@@ -60,6 +61,14 @@ class TestModule(gaupol.TestCase):
         color = gaupol.util.rgba_to_hex(rgba)
         assert color == "#ff00ff"
 
+    def test_run_in_thread(self):
+        assert gaupol.util.run_in_thread(sum, [1, 2]) == 3
+
+    def test_run_in_thread__error(self):
+        self.assert_raises(ZeroDivisionError,
+                           gaupol.util.run_in_thread,
+                           divmod, 1, 0)
+
     def test_tree_path_to_row(self):
         path = gaupol.util.tree_row_to_path(1)
         assert gaupol.util.tree_path_to_row(path) == 1
@@ -68,3 +77,10 @@ class TestModule(gaupol.TestCase):
     def test_tree_row_to_path(self):
         path = gaupol.util.tree_row_to_path(1)
         assert gaupol.util.tree_path_to_row(path) == 1
+
+    def test_wait_for(self):
+        done = []
+        with concurrent.futures.ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(abs, -x) for x in range(5)]
+            gaupol.util.wait_for(futures, done.append)
+        assert sorted(x.result() for x in done) == list(range(5))
@@ -46,15 +46,8 @@ class TestView(gaupol.TestCase):
 
     def setup_frame(self):
         self.view = gaupol.View(aeidon.modes.FRAME)
-        store = self.view.get_model()
         self.project = self.new_project()
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.append((i+1,
-                          subtitle.start_frame,
-                          subtitle.end_frame,
-                          subtitle.duration_frame,
-                          subtitle.main_text,
-                          subtitle.tran_text))
+        self.view.get_model().set_project(self.project)
 
     def setup_method(self, method):
         random.choice((self.setup_frame, self.setup_time))()
@@ -62,15 +55,14 @@ class TestView(gaupol.TestCase):
 
     def setup_time(self):
         self.view = gaupol.View(aeidon.modes.TIME)
-        store = self.view.get_model()
         self.project = self.new_project()
-        for i, subtitle in enumerate(self.project.subtitles):
-            store.append((i+1,
-                          subtitle.start_time,
-                          subtitle.end_time,
-                          subtitle.duration_seconds,
-                          subtitle.main_text,
-                          subtitle.tran_text))
+        self.view.get_model().set_project(self.project)
+
+    def test_select_ranges(self):
+        self.view.select_ranges([])
+        assert self.view.get_selected_rows() == ()
+        self.view.select_ranges([range(0, 1), range(2, 4)])
+        assert self.view.get_selected_rows() == (0, 2, 3)
 
     def test_select_rows(self):
         self.view.select_rows(())
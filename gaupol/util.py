@@ -18,6 +18,7 @@
 """Miscellaneous functions and decorators."""
 
 import aeidon
+import concurrent.futures
 import gaupol
 import inspect
 import sys
@@ -294,6 +295,18 @@ def run_dialog(dialog):
     """Run `dialog` and return response."""
     return dialog.run()
 
+def run_in_thread(function, *args, **kwargs):
+    """
+    Call `function` with `args` and `kwargs` in a worker thread.
+
+    Iterate the GTK+ main loop until `function` returns and return its
+    return value or raise the exception it raised.
+    """
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        future = executor.submit(function, *args, **kwargs)
+        wait_for([future])
+        return future.result()
+
 def scale_to_content(widget, min_nchar=0,  max_nchar=32768,
                              min_nlines=0, max_nlines=32768, font=None):
     """Set `widget's` size by content, but limited by `min` and `max`."""
@@ -396,3 +409,21 @@ def tree_row_to_path(row):
     """Convert list row integer to a :class:`Gtk.TreePath`."""
     if row is None: return None
     return Gtk.TreePath.new_from_string(str(row))
+
+def wait_for(futures, callback=None):
+    """
+    Iterate the GTK+ main loop until all `futures` are done.
+
+    `callback` is called in the main thread with each future once done.
+    Futures are handed back to the main loop via :func:`idle_add`, which
+    thus keeps processing events, e.g. redrawing, while waiting.
+    """
+    done = []
+    def on_done(future):
+        done.append(future)
+        if callback is not None:
+            callback(future)
+    for future in futures:
+        future.add_done_callback(lambda x: idle_add(on_done, x))
+    while len(done) < len(futures):
+        Gtk.main_iteration()
@@ -39,7 +39,7 @@ class View(Gtk.TreeView):
        The values of the enumeration items correspond to the column indices and
        are updated when columns are added, removed or reordered. Note that
        these indices are not necessarily the same as the column indices in the
-       underlying :class:`Gtk.ListStore` data model.
+       underlying :class:`gaupol.SubtitleListModel` data model.
     """
 
     def __init__(self, edit_mode):
@@ -170,12 +170,7 @@ class View(Gtk.TreeView):
 
     def _init_props(self, edit_mode):
         """Initialize properties."""
-        if edit_mode == aeidon.modes.TIME:
-            columns = (int, str, str, float, str, str)
-        if edit_mode == aeidon.modes.FRAME:
-            columns = (int, int, int, int, str, str)
-        store = Gtk.ListStore(*columns)
-        self.set_model(store)
+        self.set_model(gaupol.SubtitleListModel(edit_mode))
         self._init_columns(edit_mode)
         self._init_cell_data_functions()
         self.set_name("gaupol-view")
@@ -348,21 +343,26 @@ class View(Gtk.TreeView):
                     self._calc.time_to_seconds(time_key) <
                     self._calc.time_to_seconds(time_next))
 
-    def select_rows(self, rows):
-        """Select `rows`, clearing previous selection."""
+    def select_ranges(self, ranges):
+        """Select `ranges` of rows, clearing previous selection."""
         # Avoid sending more than one 'changed' signal.
         selection = self.get_selection()
         for handler_id in self._selection_changed_handlers:
             selection.handler_block(handler_id)
         selection.unselect_all()
-        for lst in aeidon.util.get_ranges(rows):
-            start = gaupol.util.tree_row_to_path(lst[0])
-            end = gaupol.util.tree_row_to_path(lst[-1])
+        for rows in ranges:
+            if not rows: continue
+            start = gaupol.util.tree_row_to_path(rows[0])
+            end = gaupol.util.tree_row_to_path(rows[-1])
             selection.select_range(start, end)
         for handler_id in self._selection_changed_handlers:
             selection.handler_unblock(handler_id)
         selection.emit("changed")
 
+    def select_rows(self, rows):
+        """Select `rows`, clearing previous selection."""
+        self.select_ranges(aeidon.util.get_index_ranges(rows))
+
     def set_focus(self, row, col=None):
         """Set the focus to `row` (-1 for last), `col`."""
         if row == -1: